@@ -1,15 +1,17 @@
-import logging
 import os
 import stat
 import uuid
 from datetime import datetime
+from functools import lru_cache
 
 import httpx
 from dotenv import load_dotenv
 from fastapi import APIRouter, HTTPException
+from loguru import logger
 from pydantic import BaseModel
-from together import Together
 
+from app.services.system.container import services
+from app.services.system.tracing import span
 from app.utils.twitter.decorators import handle_twitter_endpoint
 
 router = APIRouter()
@@ -18,21 +20,15 @@ load_dotenv()
 TOGETHER_API_KEY = os.getenv("TOGETHER_API_KEY")
 BASE_IMAGE_DIR = os.path.join(os.path.dirname(__file__), "../../../assets/images")
 
-logging.basicConfig(level=logging.DEBUG)
-
-client = Together(api_key=TOGETHER_API_KEY)
-
-# Log the current working directory
-logging.debug(f"Current working directory: {os.getcwd()}")
-
-# Create a directory for today's date
-today_date = datetime.now().strftime("%d-%m-%Y")
-IMAGE_DIR = os.path.join(BASE_IMAGE_DIR, today_date)
-
-if not os.path.exists(IMAGE_DIR):
-    os.makedirs(IMAGE_DIR)
-    # Set write permissions for the directory
-    os.chmod(IMAGE_DIR, stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)
+@lru_cache()
+def get_image_dir(folder: str) -> str:
+    """Directory for one day's images, created on first use"""
+    image_dir = os.path.join(BASE_IMAGE_DIR, folder)
+    if not os.path.exists(image_dir):
+        os.makedirs(image_dir)
+        # Set write permissions for the directory
+        os.chmod(image_dir, stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)
+    return image_dir
 
 class GenImageRequest(BaseModel):
     prompt: str
@@ -53,9 +49,10 @@ async def gen_image(request: GenImageRequest):
     if not TOGETHER_API_KEY:
         raise HTTPException(status_code=500, detail="TOGETHER API key not configured")
     
-    response = client.images.generate(
-        prompt=prompt, model=model_name, steps=4
-    )
+    with span('llm.generate_image', provider='together', model=model_name):
+        response = services.together.images.generate(
+            prompt=prompt, model=model_name, steps=4
+        )
 
     if not response.data or not response.data[0].url:
         raise HTTPException(status_code=500, detail="Model returned empty response")
@@ -63,38 +60,36 @@ async def gen_image(request: GenImageRequest):
     image_url = response.data[0].url
     
     try:
-        async with httpx.AsyncClient() as http_client:
-            image_response = await http_client.get(image_url)
+        with span('image.download', url=image_url):
+            image_response = await services.http.get(image_url)
             image_response.raise_for_status()
-            
-            file_extension = os.path.splitext(image_url)[1].split('/')[0].split('?')[0]
-            if not file_extension:
-                file_extension = '.jpg'
-            file_name = f"{uuid.uuid4()}{file_extension}"
-            file_path = os.path.join(IMAGE_DIR, file_name)  # Save in the date directory
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=500, detail=f"Failed to download image: {e}") from e
 
-            try:
-                with open(file_path, "wb") as image_file:
-                    image_file.write(image_response.content)
-            except Exception as e:
-                logging.error(f"Error saving image to {file_path}: {e}")
-                raise HTTPException(status_code=500, detail=f"Error saving image: {e}") from e
-            
-            if not os.path.exists(file_path):
-                logging.error(f"File was not created: {file_path}")
-                raise HTTPException(status_code=500, detail=f"File was not created: {file_path}")
-            else:
-                logging.debug(f"File created successfully: {file_path}")
+    today_date = datetime.now().strftime("%d-%m-%Y")
+    file_extension = os.path.splitext(image_url)[1].split('/')[0].split('?')[0]
+    if not file_extension:
+        file_extension = '.jpg'
+    file_name = f"{uuid.uuid4()}{file_extension}"
+    file_path = os.path.join(get_image_dir(today_date), file_name)  # Save in the date directory
 
-            # Set write permissions for the file
-            os.chmod(file_path, stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)
-            logging.debug(f"Set permissions for file: {file_path}")
-            
-            response_object = {
-                "folder": today_date,
-                "image": file_name,
-                "path": f"{today_date}/{file_name}"
-            }
-            return response_object
-    except httpx.HTTPError as e:
-        raise HTTPException(status_code=500, detail=f"Failed to download image: {e}") from e
\ No newline at end of file
+    try:
+        with open(file_path, "wb") as image_file:
+            image_file.write(image_response.content)
+    except Exception as e:
+        logger.error(f"Error saving image to {file_path}: {e}")
+        raise HTTPException(status_code=500, detail=f"Error saving image: {e}") from e
+
+    if not os.path.exists(file_path):
+        logger.error(f"File was not created: {file_path}")
+        raise HTTPException(status_code=500, detail=f"File was not created: {file_path}")
+    logger.debug(f"File created successfully: {file_path}")
+
+    # Set write permissions for the file
+    os.chmod(file_path, stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)
+
+    return {
+        "folder": today_date,
+        "image": file_name,
+        "path": f"{today_date}/{file_name}"
+    }
\ No newline at end of file
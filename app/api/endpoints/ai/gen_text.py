@@ -6,6 +6,8 @@ from pydantic import BaseModel
 from pydantic_ai import Agent
 from pydantic_ai.models.groq import GroqModel
 
+from app.services.system.metrics import record_llm_usage, track_llm_call
+from app.services.system.tracing import span
 from app.utils.twitter.decorators import handle_twitter_endpoint
 
 router = APIRouter()
@@ -35,7 +37,9 @@ async def gen_text(request: GenTextRequest):
     model = GroqModel(model_name, api_key=GROQ_API_KEY)
     agent = Agent(model)
 
-    result = await agent.run(prompt)
+    with span('llm.generate_text', provider='groq', model=model_name), track_llm_call('groq', model_name):
+        result = await agent.run(prompt)
+    record_llm_usage('groq', model_name, result.usage())
 
     if not result.data:
         raise HTTPException(status_code=500, detail="Model returned empty response")
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
 
+from app.services.system.metrics import record_llm_usage, track_llm_call
+from app.services.system.tracing import span
 from app.utils.twitter.decorators import handle_twitter_endpoint
 
 router = APIRouter()
@@ -39,7 +41,9 @@ async def gen_text_together(request: GenTextTogetherRequest):
     )
     agent = Agent(model)
 
-    result = await agent.run(prompt)
+    with span('llm.generate_text', provider='together', model=model_name), track_llm_call('together', model_name):
+        result = await agent.run(prompt)
+    record_llm_usage('together', model_name, result.usage())
 
     if not result.data:
         raise HTTPException(status_code=500, detail="Model returned empty response")
@@ -1,7 +1,34 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from app.services.system.health import HEALTH_PROBES_ENABLED, health_monitor
+from app.services.system.resilience import OPEN, breaker_states
 
 router = APIRouter()
 
 @router.get("/")
-def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+async def health_check():
+    """Full picture for humans and dashboards: cached probes and circuit breakers, always 200.
+
+    The health routes are async: they only read memory and must not queue behind sync routes
+    in the threadpool.
+    """
+    report = health_monitor.report() if HEALTH_PROBES_ENABLED else {'status': 'healthy', 'ready': True, 'probes': {}}
+    circuit_breakers = breaker_states()
+    if report['status'] == 'healthy' and any(state['state'] == OPEN for state in circuit_breakers.values()):
+        report['status'] = 'degraded'
+    return {**report, "circuit_breakers": circuit_breakers}
+
+@router.get("/live", summary="Liveness probe", description="200 while the process and its event loop respond")
+async def liveness():
+    return {"status": "alive"}
+
+@router.get(
+    "/ready",
+    summary="Readiness probe",
+    description="200 when every critical dependency probe passed recently, 503 otherwise. Reads cached results only."
+)
+async def readiness():
+    if not HEALTH_PROBES_ENABLED:
+        return {"status": "healthy", "ready": True}
+    report = health_monitor.report()
+    return JSONResponse(status_code=200 if report['ready'] else 503, content=report)
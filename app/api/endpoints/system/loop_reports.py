@@ -0,0 +1,29 @@
+from fastapi import APIRouter
+
+from app.services.system.loop_monitor import get_last_loop_lag, loop_watchdog
+
+router = APIRouter()
+
+@router.get(
+    "/loop-reports",
+    summary="Event loop blocking reports",
+    description="Returns stalls captured by the event loop watchdog, each with the stack of the blocking call site"
+)
+def get_loop_reports():
+    reports = loop_watchdog.get_reports()
+    return {
+        "enabled": loop_watchdog.is_running,
+        "threshold": loop_watchdog.threshold,
+        "last_loop_lag": get_last_loop_lag(),
+        "count": len(reports),
+        "reports": reports
+    }
+
+@router.delete(
+    "/loop-reports",
+    summary="Clear event loop blocking reports",
+    description="Drops all stored watchdog reports"
+)
+def clear_loop_reports():
+    loop_watchdog.clear_reports()
+    return {"status": "success"}
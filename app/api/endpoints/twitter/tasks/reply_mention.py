@@ -4,7 +4,7 @@ from fastapi import APIRouter, HTTPException
 from loguru import logger
 from pydantic import BaseModel
 
-from app.api.endpoints.ai.gen_text import gen_text
+from app.api.endpoints.ai.gen_text import GenTextRequest, gen_text
 from app.models.schemas.tasks import HandleMentionRequest
 from app.models.schemas.tweet import CreateTweetRequest, TweetDetails
 from app.utils.twitter.decorators import handle_twitter_endpoint
@@ -94,7 +94,7 @@ The reply_text should be a direct response to the chosen tweet that:
 The answer must contain only the object and nothing else, this is critically important.
 """
 
-    response = await gen_text(llm_request)
+    response = await gen_text(GenTextRequest(prompt=llm_request))
 
     try:
         structured_response = json.loads(response)
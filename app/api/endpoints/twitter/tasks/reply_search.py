@@ -1,20 +1,32 @@
 import json
+import os
+import time
 from typing import List
 from datetime import date, timedelta
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from loguru import logger
 from pydantic import BaseModel
 
-from app.api.endpoints.ai.gen_text import gen_text
+from app.api.endpoints.ai.gen_text import GenTextRequest, gen_text
 from app.models.schemas.tweet import TweetDetails, CreateTweetRequest
 from ..tweets.search import search_tweets
 from ..tweets.like import like_tweet
 from ..tweets.new import create_tweet
 from app.models.schemas.search import SearchParams
+from app.repositories.twitter.tweet_repository import TweetRepository, get_tweet_repository
+from app.services.system.supabase import get_supabase
+from app.services.twitter.reply_queue import REPLY_MAX_AGE, reply_priority, tweet_timestamp
+from app.services.twitter.tweet_service import mark_tweet_processed
+from app.utils.twitter import before_non_idempotent_call
+from app.utils.twitter.normalizer import tweet_to_db_row
 
 router = APIRouter()
 
+REPLY_SEARCH_MAX_CANDIDATES = int(os.getenv("REPLY_SEARCH_MAX_CANDIDATES", "20"))
+
+tweet_repository_dependency = Depends(get_tweet_repository)
+
 class ContextTweet(BaseModel):
     id: str
     text: str
@@ -38,7 +50,7 @@ class SearchResultTweet(BaseModel):
     summary="Search for tweets matching given phrases",
     description="Searches for tweets containing exact phrases with minimum engagement requirements"
 )
-async def reply_search(request: HandleSearchRequest):
+async def reply_search(request: HandleSearchRequest, repository: TweetRepository = tweet_repository_dependency):
     search_batch = []
     yesterday = date.today() - timedelta(days=1)
     yesterday_str = yesterday.strftime("%Y-%m-%d")
@@ -52,8 +64,10 @@ async def reply_search(request: HandleSearchRequest):
         tweets = getattr(search_result, 'tweets', [])
         search_batch.append({"phrase": phrase, "tweets": tweets})
 
-    results = []
+    candidates = []
     seen_ids = set()
+    tweet_rows = {}
+    now = time.time()
 
     for batch in search_batch:
         for tweet_data in batch["tweets"]:
@@ -64,20 +78,48 @@ async def reply_search(request: HandleSearchRequest):
                     seen_ids.add(tweet_id)
                     photo_urls = tweet_data.photo_urls
 
-                    if not photo_urls:
-                        results.append(SearchResultTweet(
+                    posted_at = tweet_timestamp(tweet_data.created_at, tweet_id)
+                    if not photo_urls and now - posted_at <= REPLY_MAX_AGE:
+                        tweet_rows[str(tweet_id)] = tweet_to_db_row(tweet_data)
+                        candidates.append((posted_at, SearchResultTweet(
                             tweet_id=str(tweet_id),
                             tweet_user_nick=tweet_data.tweet_user_nick,
                             text=tweet_data.text,
                             retweets=tweet_data.retweets,
                             likes=tweet_data.likes
-                        ))
+                        )))
 
             except Exception as e:
                 logger.error(f"Error processing tweet: {e}")
                 continue
 
-    logger.info(f"🔎  Found {len(results)} unique tweets matching search criteria")
+    candidate_ids = [result.tweet_id for _, result in candidates]
+    try:
+        replied_ids = await repository.get_replied_ids(candidate_ids)
+    except Exception as e:
+        logger.warning(f"⚠️  Could not check reply ledger, ranking all candidates: {str(e)}")
+        replied_ids = set()
+    try:
+        velocities = await repository.get_engagement_velocity(candidate_ids)
+    except Exception as e:
+        logger.warning(f"⚠️  Could not read engagement velocity, ranking by counts only: {str(e)}")
+        velocities = {}
+
+    # Only the freshest, fastest growing candidates are worth the model's tokens
+    candidates = [
+        (reply_priority(
+            result.likes, result.retweets, 0, posted_at, now,
+            likes_per_hour=velocities[result.tweet_id].likes_per_hour if result.tweet_id in velocities else 0.0
+        ), result)
+        for posted_at, result in candidates
+        if result.tweet_id not in replied_ids
+    ]
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+    results = [result for _, result in candidates[:REPLY_SEARCH_MAX_CANDIDATES]]
+    logger.info(f"🔎  Found {len(candidates)} unique tweets matching search criteria, ranking the top {len(results)}")
+
+    if not results:
+        raise HTTPException(status_code=404, detail="No fresh tweets worth replying to")
 
     # TODO: Improve the prompt for handle different cases
     llm_request = f"""# AI Tweet Rating System
@@ -173,7 +215,7 @@ DO:
 Both fields should be strings.
 """
 
-    answer = await gen_text(llm_request)
+    answer = await gen_text(GenTextRequest(prompt=llm_request))
     logger.info(f"🤖  Model answer: {answer}")
 
 
@@ -186,18 +228,34 @@ Both fields should be strings.
     if not structured_response:
         raise HTTPException(status_code=500, detail="Model returned empty response")
 
-    await like_tweet(structured_response.get("target_tweet_id"))
-    logger.info(f"💛 Liking mention target tweet {structured_response.get('target_tweet_id')}")
+    target_id = str(structured_response.get("target_tweet_id"))
+    if target_id not in {result.tweet_id for result in results}:
+        raise HTTPException(status_code=500, detail="Model chose a tweet that was not among the candidates")
+
+    await like_tweet(target_id)
+    logger.info(f"💛 Liking mention target tweet {target_id}")
 
     tweet_request = CreateTweetRequest(
         text=structured_response.get("reply_text"),
-        reply_to=structured_response.get("target_tweet_id")
+        reply_to=target_id
     )
 
+    async def record_before_posting():
+        # A reply that times out may still have been posted: record the target first,
+        # so no later run replies to it again
+        await mark_tweet_processed(get_supabase(), tweet_rows[target_id])
+
     # TODO: If replied the main tweet before, then reply tweet_with_mention (if have since and it's a positive tweet)
-    reply = await create_tweet(tweet_request)
+    with before_non_idempotent_call(record_before_posting):
+        reply = await create_tweet(tweet_request)
 
     if not reply:
         raise HTTPException(status_code=500, detail="Failed to create reply tweet")
 
+    try:
+        await mark_tweet_processed(get_supabase(), tweet_rows[target_id], reply_id=reply.id)
+    except Exception as e:
+        # Already recorded as processed, so it is skipped either way
+        logger.error(f"Error recording reply {reply.id} to tweet {target_id}: {str(e)}")
+
     return reply
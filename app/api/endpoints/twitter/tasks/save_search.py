@@ -1,22 +1,17 @@
 from datetime import date, timedelta
 from typing import List
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 from loguru import logger
 from pydantic import BaseModel
-from supabase import Client
 
 from app.models.schemas.search import SearchParams
-from app.services.system.supabase import get_supabase
-from app.services.twitter.tweet_service import save_twitter_tweets_batch
-from app.utils.twitter.normalizer import normalize_search_tweet_data
+from app.services.twitter.tweet_service import SearchHit, SearchHits, queue_tweet_records
 
-from ..tweets.search import search_tweets
+from ..tweets.search import collect_search_records
 
 router = APIRouter()
 
-supabase_dependency = Depends(get_supabase)
-
 class HandleSearchRequest(BaseModel):
     phrases: List[str]
 
@@ -27,36 +22,32 @@ class HandleSearchRequest(BaseModel):
     summary="Save search results for given phrases",
     description="Searches Twitter for given phrases and saves matching tweets"
 )
-async def save_search(request: HandleSearchRequest, supabase: Client = supabase_dependency):
-    search_batch = []
+async def save_search(request: HandleSearchRequest):
     yesterday = date.today() - timedelta(days=1)
     yesterday_str = yesterday.strftime("%Y-%m-%d")
 
+    records = []
+    hits: SearchHits = {}
+
     for phrase in request.phrases:
         params = SearchParams(
             query=f'"{phrase}" min_replies:1 min_faves:30 min_retweets:1 lang:en since:{yesterday_str} -filter:replies',
             minimum_tweets=10
         )
-        search_result = await search_tweets(params)
-        tweets = getattr(search_result, 'tweets', [])
-        search_batch.append({"phrase": phrase, "tweets": tweets})
-
-    results = []
-    seen_ids = set()
-    logger.info(f"✅  seen_ids: {len(seen_ids)}")
-
-    for batch in search_batch:
-        for tweet in batch['tweets']:
-            tweet_data = tweet.dict()
-            tweet_dict = normalize_search_tweet_data(tweet_data)
-
-            if tweet_dict['id'] and tweet_dict['id'] not in seen_ids:
-                seen_ids.add(tweet_dict['id'])
-                results.append(tweet_dict)
+        for record in await collect_search_records(params):
+            if not record.tweet_id:
+                continue
+            # A tweet found by several phrases is saved once, with a hit per phrase
+            if record.tweet_id not in hits:
+                hits[record.tweet_id] = []
+                records.append(record)
+            if not any(hit.phrase == phrase for hit in hits[record.tweet_id]):
+                hits[record.tweet_id].append(SearchHit(phrase, params.query))
+
+    logger.info(f"✅  Unique tweets found: {len(records)}")
 
     # Save the unique tweets to the database
-    if results:
-        saved_tweets = await save_twitter_tweets_batch(supabase, results)
-        return len(saved_tweets)
+    if records:
+        return await queue_tweet_records(records, hits=hits)
 
     return 0
\ No newline at end of file
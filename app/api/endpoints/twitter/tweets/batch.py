@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+
+from app.models.schemas.tweet import BatchTweetsRequest, BatchTweetsResponse
+from app.services.twitter.tweet_lookup import get_tweets_by_ids
+from app.utils.twitter.decorators import handle_twitter_endpoint
+
+router = APIRouter()
+
+@router.post(
+    "/tweets/batch",
+    response_model=BatchTweetsResponse,
+    tags=["tweets"],
+    summary="Get tweets by their IDs",
+    description="Retrieve up to 100 tweets in one request. Results and per-id errors are keyed by tweet ID."
+)
+@handle_twitter_endpoint("get tweets by ids")
+async def get_tweets_batch(request: BatchTweetsRequest):
+    """Get several tweets by their IDs"""
+    tweets, errors = await get_tweets_by_ids(request.ids)
+    return BatchTweetsResponse(tweets=tweets, errors=errors)
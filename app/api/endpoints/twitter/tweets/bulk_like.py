@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends
+from supabase import Client
+
+from app.models.schemas.tweet import BulkEngagementRequest, BulkEngagementResponse
+from app.services.system.supabase import get_supabase
+from app.services.twitter.engagement import bulk_set_liked
+from app.utils.twitter.decorators import handle_twitter_endpoint
+
+router = APIRouter()
+
+supabase_dependency = Depends(get_supabase)
+
+@router.post(
+    "/tweets/like",
+    response_model=BulkEngagementResponse,
+    tags=["tweets"],
+    summary="Favorite several tweets",
+    description="Favorite tweets in order, paced by the shared write budget. Tweets already liked are skipped."
+)
+@handle_twitter_endpoint("favorite tweets")
+async def like_tweets(request: BulkEngagementRequest, supabase: Client = supabase_dependency):
+    results, errors, updated_rows = await bulk_set_liked(supabase, request.ids, like=True)
+    return BulkEngagementResponse(results=results, errors=errors, updated_rows=updated_rows)
+
+@router.post(
+    "/tweets/unlike",
+    response_model=BulkEngagementResponse,
+    tags=["tweets"],
+    summary="Unfavorite several tweets",
+    description="Unfavorite tweets in order, paced by the shared write budget"
+)
+@handle_twitter_endpoint("unfavorite tweets")
+async def unlike_tweets(request: BulkEngagementRequest, supabase: Client = supabase_dependency):
+    results, errors, updated_rows = await bulk_set_liked(supabase, request.ids, like=False)
+    return BulkEngagementResponse(results=results, errors=errors, updated_rows=updated_rows)
@@ -1,14 +1,16 @@
 from fastapi import APIRouter
 from loguru import logger
-from app.utils.twitter import handle_twitter_request, twitter_client
 from app.utils.twitter.decorators import handle_twitter_endpoint
-from app.models.schemas.search import TimelineParams, TweetData
+from app.models.schemas.search import TimelineParams, TimelineResponse
+from app.services.twitter.timeline import collect_timeline_records
+from app.utils.twitter.normalizer import records_to_tweet_data
 
 router = APIRouter()
 
 @router.post(
     "/tweets/latest",
     tags=["tweets"],
+    response_model=TimelineResponse,
     summary="Get latest tweets from following timeline",
     description="Retrieve the latest tweets from the user's following timeline"
 )
@@ -16,14 +18,5 @@ router = APIRouter()
 async def get_latest_user_timeline(params: TimelineParams):
     logger.info("🔎  Fetching latest timeline (Following)...")
 
-    async def get_latest_timeline_tweets():
-        return await twitter_client.client.get_latest_timeline()
-
-    tweets = await handle_twitter_request(get_latest_timeline_tweets)
-    results = []
-
-    for i, tweet in enumerate(tweets[:params.minimum_tweets]):
-        tweet_data = twitter_client.process_tweet(tweet, i + 1)
-        results.append(TweetData(**tweet_data))
-
-    return results
+    records, next_cursor = await collect_timeline_records('latest', params)
+    return TimelineResponse(tweets=records_to_tweet_data(records), next_cursor=next_cursor)
@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.models.schemas.tweet import LocalSearchResponse
+from app.repositories.twitter.tweet_repository import TweetRepository, get_tweet_repository
+
+router = APIRouter()
+
+tweet_repository_dependency = Depends(get_tweet_repository)
+
+@router.get(
+    "/tweets/local-search",
+    response_model=LocalSearchResponse,
+    tags=["tweets"],
+    summary="Search saved tweets",
+    description=(
+        "Full-text search over tweets already saved to the database, best match first. "
+        "Supports web search syntax (\"exact phrase\", or, -word). Never calls Twitter."
+    )
+)
+async def local_search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    since: Optional[datetime] = None,
+    repository: TweetRepository = tweet_repository_dependency
+):
+    tweets = await repository.search_text(q, limit, since)
+    return LocalSearchResponse(query=q, tweets=tweets)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from app.models.schemas.tweet import TweetDetails, CreateTweetRequest
 from loguru import logger
-from app.utils.twitter import handle_twitter_request, process_tweet_details, twitter_client
+from app.utils.twitter import handle_twitter_request, tweet_to_details, twitter_client
 from app.utils.twitter.decorators import handle_twitter_endpoint
 
 router = APIRouter()
@@ -34,7 +34,8 @@ async def create_tweet(request: CreateTweetRequest):
             # Regular tweet without reply
             return await twitter_client.client.create_tweet(text=request.text)
 
-    tweet = await handle_twitter_request(post_tweet)
-    tweet_details = process_tweet_details(tweet)
+    # Posting is not idempotent: a retried timeout could publish the tweet twice
+    tweet = await handle_twitter_request(post_tweet, idempotent=False, method='create_tweet')
+    tweet_details = tweet_to_details(tweet)
     logger.info(f"✅ Successfully posted tweet {tweet_details.id}")
     return tweet_details
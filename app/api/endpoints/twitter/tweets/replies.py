@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from app.models.schemas.tweet import TweetThread
 from loguru import logger
-from app.utils.twitter import handle_twitter_request, process_tweet_details, twitter_client
+from app.utils.twitter import handle_twitter_request, tweet_to_details, twitter_client
 from app.utils.twitter.decorators import handle_twitter_endpoint
 
 router = APIRouter()
@@ -32,7 +32,7 @@ async def get_tweet_replies(
         if not main_tweet:
             raise HTTPException(status_code=404, detail="Tweet not found")
 
-        main_tweet_details = process_tweet_details(main_tweet)
+        main_tweet_details = tweet_to_details(main_tweet)
 
         # If tweet has no replies, return early
         if not main_tweet.replies:
@@ -47,7 +47,7 @@ async def get_tweet_replies(
         while current_replies and len(replies) < limit and page_count < max_pages:
             # Process current page of replies
             for reply in current_replies[:limit - len(replies)]:
-                reply_details = process_tweet_details(reply)
+                reply_details = tweet_to_details(reply)
                 replies.append(reply_details)
 
                 # Check if we reached the until_id
@@ -67,6 +67,6 @@ async def get_tweet_replies(
             replies=replies[:limit]  # Cut to requested limit
         )
 
-    result = await handle_twitter_request(fetch_replies)
+    result = await handle_twitter_request(fetch_replies, method='get_tweet_by_id')
     logger.info(f"✅  Successfully fetched main tweet and {len(result.replies)} replies")
     return result
\ No newline at end of file
@@ -1,10 +1,11 @@
 from fastapi import APIRouter
 from app.models.schemas.search import SearchParams, SearchResponse, TimelineParams
 from loguru import logger
-import time
 from app.utils.twitter import handle_twitter_request, twitter_client
+from app.services.system.pacer import pace
 from app.utils.twitter.decorators import handle_twitter_endpoint
-from secrets import randbelow
+from app.utils.twitter.normalizer import TweetRecord, records_to_tweet_data, tweets_to_records
+from typing import List
 
 router = APIRouter()
 
@@ -20,15 +21,9 @@ async def get_tweets(params: SearchParams | TimelineParams):
         else:
             return await twitter_client.client.get_timeline()
 
-@router.post(
-    "/tweets/search",
-    tags=["tweets"],
-    response_model=SearchResponse,
-    summary="Search for tweets",
-    description="Search for tweets based on a query"
-)
 @handle_twitter_endpoint("search tweets")
-async def search_tweets(params: SearchParams):
+async def collect_search_records(params: SearchParams) -> List[TweetRecord]:
+    """Page through search results into compact records until `minimum_tweets` are collected"""
     tweet_count = 0
     tweets = None
     results = []
@@ -37,23 +32,28 @@ async def search_tweets(params: SearchParams):
         nonlocal tweets
         if tweets is None:
             return await get_tweets(params)
-        else:
-            wait_time = randbelow(6) + 5  # Generates a random number between 5 and 10
-            logger.info(f'⏳  Getting next tweets after {wait_time} seconds ...')
-            time.sleep(wait_time)
-            return await tweets.next()
+        return await tweets.next()
 
     while tweet_count < params.minimum_tweets:
-        tweets = await handle_twitter_request(get_tweets_func)
+        # Every page draws from the search budget shared by all workers
+        await pace('twitter.search')
+        tweets = await handle_twitter_request(get_tweets_func, method='search_tweet')
         if not tweets:
             break
 
-        for tweet in tweets:
-            tweet_count += 1
-            tweet_data = twitter_client.process_tweet(tweet, tweet_count)
-            results.append(tweet_data)
+        page = list(tweets)[:params.minimum_tweets - tweet_count]
+        results.extend(tweets_to_records(page))
+        tweet_count += len(page)
 
-            if tweet_count >= params.minimum_tweets:
-                break
+    return results
 
-    return SearchResponse(tweets=results)
\ No newline at end of file
+@router.post(
+    "/tweets/search",
+    tags=["tweets"],
+    response_model=SearchResponse,
+    summary="Search for tweets",
+    description="Search for tweets based on a query"
+)
+async def search_tweets(params: SearchParams):
+    records = await collect_search_records(params)
+    return SearchResponse(tweets=records_to_tweet_data(records))
\ No newline at end of file
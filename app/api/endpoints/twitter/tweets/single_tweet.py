@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException
 from loguru import logger
 
 from app.models.schemas.tweet import TweetDetails
-from app.utils.twitter import handle_twitter_request, process_tweet_details, twitter_client
+from app.utils.twitter import handle_twitter_request, tweet_to_details, twitter_client
 from app.utils.twitter.decorators import handle_twitter_endpoint
 
 router = APIRouter()
@@ -25,8 +25,8 @@ async def get_tweet_by_id(tweet_id: str):
             raise HTTPException(status_code=404, detail="Tweet not found")
         return tweet
 
-    tweet_details = await handle_twitter_request(fetch_tweet)
-    processed_tweet = process_tweet_details(tweet_details)
+    tweet_details = await handle_twitter_request(fetch_tweet, method='get_tweet_by_id')
+    processed_tweet = tweet_to_details(tweet_details)
     logger.info(f"✅  Successfully fetched tweet {tweet_details.id}")
 
     return processed_tweet
\ No newline at end of file
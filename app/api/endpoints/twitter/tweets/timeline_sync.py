@@ -0,0 +1,34 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.models.schemas.search import TimelineSyncResponse
+from app.services.twitter.timeline_follower import TIMELINE_FOLLOWER_ENABLED, TIMELINE_FOLLOWER_TIMELINES, timeline_buffer
+
+router = APIRouter()
+
+@router.get(
+    "/tweets/timeline/{timeline}",
+    tags=["tweets"],
+    response_model=TimelineSyncResponse,
+    summary="Read new timeline tweets",
+    description=(
+        "Tweets the background timeline follower has seen since `since_id`, oldest first. "
+        "Served from the local buffer; never calls Twitter."
+    )
+)
+def get_timeline_updates(
+    timeline: Literal['latest', 'for_you'],
+    since_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000)
+):
+    if not TIMELINE_FOLLOWER_ENABLED or timeline not in TIMELINE_FOLLOWER_TIMELINES:
+        raise HTTPException(status_code=503, detail=f"The {timeline} timeline is not being followed")
+
+    tweets = timeline_buffer.since(timeline, since_id, limit)
+    newest_id, polled_at = timeline_buffer.state(timeline)
+    return TimelineSyncResponse(
+        tweets=tweets,
+        newest_id=tweets[-1].tweet_id if tweets else since_id or newest_id,
+        polled_at=polled_at
+    )
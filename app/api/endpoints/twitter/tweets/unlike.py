@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 from loguru import logger
-from app.utils.twitter import handle_twitter_request, twitter_client
+from app.services.twitter.engagement import favorite
 from app.utils.twitter.decorators import handle_twitter_endpoint
 
 router = APIRouter()
@@ -15,9 +15,6 @@ router = APIRouter()
 async def unlike_tweet(tweet_id: int):
     logger.info(f"🎯  Attempting to unfavorite tweet {tweet_id}")
 
-    async def do_favorite():
-        return await twitter_client.client.unfavorite_tweet(tweet_id)
-
-    await handle_twitter_request(do_favorite)
+    await favorite(tweet_id, like=False)
     logger.info(f"💜  Successfully unfavorited tweet {tweet_id}")
     return {"status": "success", "tweet_id": tweet_id}
@@ -1,14 +1,90 @@
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from app.api.routers import router as api_router
+from app.services.system.container import services
+from app.services.system.health import start_health_probes, stop_health_probes
+from app.services.system.loop_monitor import (
+    start_loop_lag_monitor,
+    start_loop_watchdog,
+    stop_loop_lag_monitor,
+    stop_loop_watchdog,
+)
+from app.services.system.metrics import HTTP_REQUEST_DURATION
+from app.services.system.resilience import UpstreamUnavailableError
+from app.services.twitter.engagement_refresher import start_engagement_refresher, stop_engagement_refresher
+from app.services.twitter.mentions import start_mention_ingestion, stop_mention_ingestion
+from app.services.twitter.timeline_follower import start_timeline_follower, stop_timeline_follower
+from app.services.twitter.tweet_service import start_tweet_write_buffer, stop_tweet_write_buffer
+from app.services.system.tracing import (
+    TRACE_DEBUG_HEADER,
+    TRACE_ID_HEADER,
+    server_timing,
+    start_trace,
+)
 from loguru import logger
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Starting up the application...")
+    start_loop_lag_monitor()
+    start_loop_watchdog()
+    start_health_probes()
+    start_tweet_write_buffer()
+    start_timeline_follower()
+    start_mention_ingestion()
+    start_engagement_refresher()
+    yield
+    logger.info("Shutting down the application...")
+    await stop_engagement_refresher()
+    await stop_mention_ingestion()
+    await stop_timeline_follower()
+    await stop_tweet_write_buffer()
+    await stop_health_probes()
+    await stop_loop_lag_monitor()
+    await stop_loop_watchdog()
+    await services.aclose()
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(api_router)
 
-@app.on_event("startup")
-async def startup_event():
-    logger.info("Starting up the application...")
+@app.exception_handler(UpstreamUnavailableError)
+async def upstream_unavailable_handler(request: Request, exc: UpstreamUnavailableError):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))}
+    )
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    logger.info("Shutting down the application...")
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status)
+        )
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    with start_trace(
+        f"{request.method} {request.url.path}",
+        trace_id=request.headers.get(TRACE_ID_HEADER),
+        **{"http.method": request.method, "http.target": request.url.path}
+    ) as trace:
+        response = await call_next(request)
+
+    response.headers[TRACE_ID_HEADER] = trace.trace_id
+    if request.headers.get(TRACE_DEBUG_HEADER):
+        response.headers["Server-Timing"] = server_timing(trace)
+    return response
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 class TweetData(BaseModel):
     tweet_id: str
@@ -11,9 +11,12 @@ class TweetData(BaseModel):
     likes: int
     photo_urls: List[str]
     tweet_lang: str
+    tweet_user_id: str = ""
+    tweet_user_photo: Optional[str] = None
 
 class TimelineParams(BaseModel):
     minimum_tweets: int = 10
+    cursor: Optional[str] = None  # next_cursor of a previous response, to continue from there
 
 class SearchParams(BaseModel):
     query: str
@@ -22,3 +25,14 @@ class SearchParams(BaseModel):
 class SearchResponse(BaseModel):
     tweets: List[TweetData]
     status: str = "success"
+
+class TimelineResponse(BaseModel):
+    tweets: List[TweetData]
+    next_cursor: Optional[str] = None
+    status: str = "success"
+
+class TimelineSyncResponse(BaseModel):
+    tweets: List[TweetData]  # oldest first
+    newest_id: Optional[str] = None  # pass back as since_id on the next poll
+    polled_at: Optional[float] = None
+    status: str = "success"
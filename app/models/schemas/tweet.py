@@ -30,6 +30,21 @@ class TweetThread(BaseModel):
     main_tweet: TweetDetails
     replies: List[TweetDetails] 
 
+class BatchTweetsRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=100)
+
+class BatchTweetsResponse(BaseModel):
+    tweets: Dict[str, TweetDetails] = Field(default_factory=dict)
+    errors: Dict[str, str] = Field(default_factory=dict)
+
+class BulkEngagementRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=200)
+
+class BulkEngagementResponse(BaseModel):
+    results: Dict[str, str] = Field(default_factory=dict)  # id -> liked/unliked/skipped/failed
+    errors: Dict[str, str] = Field(default_factory=dict)
+    updated_rows: int = 0
+
 class CreateTweetRequest(BaseModel):
     text: str
     reply_to: Optional[str] = None
@@ -94,6 +109,8 @@ class DBTweetBase(BaseModel):
     likes_count: int = 0
     photo_urls: List[str] = Field(default_factory=list)
     meta_data: dict = Field(default_factory=dict)
+    # First saved-search phrase that found the tweet and the full query built from it;
+    # every match is kept in tweet_search_hits
     search_query_by: str = ""
     search_text_by: str = ""
     media: List[Dict[str, Any]] = Field(default_factory=list)
@@ -122,4 +139,48 @@ class DBTweet(DBTweetBase):
     sentiment: str = ""
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class PhraseYield(BaseModel):
+    """How many saved tweets a search phrase produced and what became of them"""
+    phrase: str
+    tweets: int
+    processed: int
+    replied: int
+    liked: int
+    no_reply: int
+    last_hit_at: Optional[datetime] = None
+
+class LocalSearchHit(BaseModel):
+    id: str
+    text: str
+    author_name: str
+    author_username: str
+    likes_count: int = 0
+    retweets_count: int = 0
+    created_at: datetime
+    search_query_by: str = ""
+    rank: float = 0.0
+
+class LocalSearchResponse(BaseModel):
+    query: str
+    tweets: List[LocalSearchHit]  # best match first
+    status: str = "success"
+
+class EngagementVelocity(BaseModel):
+    """Engagement growth of a tweet between its first and last snapshot in a window"""
+    tweet_id: str
+    likes_count: int
+    retweets_count: int
+    likes_per_hour: float
+    retweets_per_hour: float
+    snapshots: int
+    first_at: datetime
+    last_at: datetime
+
+class TweetCounters(BaseModel):
+    """Stored engagement counters of a tracked tweet"""
+    id: str
+    likes_count: int = 0
+    retweets_count: int = 0
+    created_at: datetime
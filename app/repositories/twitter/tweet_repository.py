@@ -1,8 +1,149 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
+
+from supabase import Client
+
+from app.models.schemas.tweet import DBTweet, EngagementVelocity, LocalSearchHit, PhraseYield, TweetCounters
+from app.services.system.supabase import execute_query, get_supabase
+
 class TweetRepository:
-    async def get_tweet_by_id(self, tweet_id: str):
-        result = supabase.table('tweets').select('*').eq('tweet_id', tweet_id).execute()
-        return result.data[0] if result.data else None
+    """Read queries over the `tweets` table used by the task workflows.
+
+    Each query is backed by an index from supabase/migrations/.
+    """
+
+    def __init__(self, supabase: Client):
+        self.supabase = supabase
+
+    def _tweets(self):
+        return self.supabase.table('tweets')
+
+    async def get_tweet_by_id(self, tweet_id: str) -> Optional[DBTweet]:
+        result = execute_query(self._tweets().select('*').eq('id', tweet_id), 'tweets', 'select')
+        return DBTweet.model_validate(result.data[0]) if result.data else None
+
+    async def get_unprocessed_by_phrase(self, phrase: str, limit: int = 50) -> List[DBTweet]:
+        """Unhandled tweets first found by `phrase` (search_query_by), newest first"""
+        result = execute_query(
+            self._tweets().select('*')
+                .eq('search_query_by', phrase)
+                .eq('is_processed', False)
+                .order('created_at', desc=True)
+                .limit(limit),
+            'tweets', 'select'
+        )
+        return [DBTweet.model_validate(row) for row in result.data]
+
+    async def get_tweets_by_phrase(self, phrase: str, limit: int = 50) -> List[DBTweet]:
+        """Tweets `phrase` has matched, including those first found by another phrase, newest hit first"""
+        hits = execute_query(
+            self.supabase.table('tweet_search_hits').select('tweet_id')
+                .eq('phrase', phrase)
+                .order('searched_at', desc=True)
+                .limit(limit),
+            'tweet_search_hits', 'select'
+        )
+        tweet_ids = [hit['tweet_id'] for hit in hits.data]
+        if not tweet_ids:
+            return []
+        result = execute_query(self._tweets().select('*').in_('id', tweet_ids), 'tweets', 'select')
+        tweets = {row['id']: DBTweet.model_validate(row) for row in result.data}
+        return [tweets[tweet_id] for tweet_id in tweet_ids if tweet_id in tweets]
+
+    async def get_phrase_yield(self, since: Optional[datetime] = None) -> List[PhraseYield]:
+        """Per-phrase counts of saved, processed, replied, liked and skipped tweets, aggregated in Postgres"""
+        result = execute_query(
+            self.supabase.rpc('search_phrase_yield', {'since': since.isoformat() if since else None}),
+            'tweet_search_hits', 'rpc'
+        )
+        return [PhraseYield.model_validate(row) for row in result.data]
+
+    async def search_text(self, query: str, limit: int = 20, since: Optional[datetime] = None) -> List[LocalSearchHit]:
+        """Full-text search over saved tweets (web search syntax: "exact phrase", or, -word), best match first"""
+        result = execute_query(
+            self.supabase.rpc('search_saved_tweets', {
+                'q': query,
+                'max_results': limit,
+                'since': since.isoformat() if since else None,
+            }),
+            'tweets', 'rpc'
+        )
+        return [LocalSearchHit.model_validate(row) for row in result.data]
+
+    async def get_engagement_velocity(
+        self,
+        tweet_ids: Optional[List[str]] = None,
+        window_hours: float = 6,
+        limit: int = 100
+    ) -> Dict[str, EngagementVelocity]:
+        """Likes/retweets per hour over the last `window_hours` from the engagement snapshots,
+        for `tweet_ids` or the fastest growing tweets; tweets with fewer than two snapshots are absent"""
+        if tweet_ids is not None and not tweet_ids:
+            return {}
+        result = execute_query(
+            self.supabase.rpc('engagement_velocity', {
+                'tweet_ids': tweet_ids,
+                'window_hours': window_hours,
+                'max_results': limit if tweet_ids is None else len(tweet_ids),
+            }),
+            'tweet_engagement_snapshots', 'rpc'
+        )
+        velocities = [EngagementVelocity.model_validate(row) for row in result.data]
+        return {velocity.tweet_id: velocity for velocity in velocities}
+
+    async def get_tweets_by_author(self, username: str, limit: int = 50) -> List[DBTweet]:
+        """Saved tweets of one author, newest first"""
+        result = execute_query(
+            self._tweets().select('*')
+                .eq('author_username', username)
+                .order('created_at', desc=True)
+                .limit(limit),
+            'tweets', 'select'
+        )
+        return [DBTweet.model_validate(row) for row in result.data]
+
+    async def get_recent_candidates(self, since: datetime, limit: int = 50) -> List[DBTweet]:
+        """Unhandled tweets saved since `since`, most liked (then retweeted) first"""
+        result = execute_query(
+            self._tweets().select('*')
+                .eq('is_processed', False)
+                .eq('is_no_reply', False)
+                .gte('created_at', since.isoformat())
+                .order('likes_count', desc=True)
+                .order('retweets_count', desc=True)
+                .limit(limit),
+            'tweets', 'select'
+        )
+        return [DBTweet.model_validate(row) for row in result.data]
+
+    async def get_tracked_counters(self, since: datetime, limit: int = 1000) -> List[TweetCounters]:
+        """Counters of the unhandled tweets saved since `since` (the reply candidates), newest first"""
+        result = execute_query(
+            self._tweets().select('id,likes_count,retweets_count,created_at')
+                .eq('is_processed', False)
+                .eq('is_no_reply', False)
+                .gte('created_at', since.isoformat())
+                .order('created_at', desc=True)
+                .limit(limit),
+            'tweets', 'select'
+        )
+        return [TweetCounters.model_validate(row) for row in result.data]
+
+    async def get_replied_ids(self, tweet_ids: List[str]) -> Set[str]:
+        """Ids among `tweet_ids` that already have a reply, or had one posted that may have gone out.
+
+        Replies are recorded as processed before they are posted and get their reply_id after,
+        so every processed tweet not marked is_no_reply counts.
+        """
+        if not tweet_ids:
+            return set()
+        result = execute_query(
+            self._tweets().select('id').in_('id', tweet_ids).eq('is_processed', True).eq('is_no_reply', False),
+            'tweets', 'select'
+        )
+        return {row['id'] for row in result.data}
 
-    async def get_tweets_by_username(self, username: str, limit: int):
-        result = supabase.table('tweets').select('*').eq('tweet_user_name', username).limit(limit).execute()
-        return result.data if result.data else []
\ No newline at end of file
+@lru_cache()
+def get_tweet_repository() -> TweetRepository:
+    return TweetRepository(get_supabase())
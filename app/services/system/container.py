@@ -0,0 +1,46 @@
+import os
+from typing import Any, Optional
+
+import httpx
+from loguru import logger
+
+class ServiceContainer:
+    """Process-wide provider clients.
+
+    Nothing is created at import time: each client is built on first use inside a worker
+    and closed from the application lifespan, so importing the app (and forking workers)
+    stays cheap and works without provider keys.
+    """
+
+    def __init__(self):
+        self._together: Optional[Any] = None
+        self._http: Optional[httpx.AsyncClient] = None
+
+    @property
+    def together(self) -> Any:
+        if self._together is None:
+            # Deferred: the together SDK is slow to import and validates the key on construction
+            from together import Together
+
+            self._together = Together(api_key=os.getenv("TOGETHER_API_KEY"))
+        return self._together
+
+    @together.setter
+    def together(self, client: Any):
+        self._together = client
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Shared outbound HTTP client (connection pooling across requests)"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(timeout=30)
+        return self._http
+
+    async def aclose(self):
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        self._together = None
+        logger.info("🧹  Service clients closed")
+
+services = ServiceContainer()
@@ -0,0 +1,46 @@
+import asyncio
+import fcntl
+import os
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+@asynccontextmanager
+async def file_lock(path: str, timeout: Optional[float] = None, poll_interval: float = 0.1) -> AsyncIterator[None]:
+    """Exclusive advisory lock on `path`, shared by every process on the host.
+
+    Polls with a non-blocking flock so waiting never blocks the event loop.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    started = time.monotonic()
+    try:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if timeout is not None and time.monotonic() - started >= timeout:
+                    raise TimeoutError(f"Timed out waiting for lock {path}")
+                await asyncio.sleep(poll_interval)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+def atomic_write_text(path: str, content: str) -> None:
+    """Write to a temp file in the same directory, fsync, then rename over `path`"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+            tmp_file.write(content)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,195 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from app.services.system.container import services
+from app.services.system.loop_monitor import get_last_loop_lag
+from app.services.system.metrics import HEALTH_PROBE_LATENCY, HEALTH_PROBE_UP
+from app.services.system.pacer import pace
+from app.services.system.resilience import UpstreamUnavailableError
+from app.services.system.supabase import execute_query, get_supabase
+from app.services.twitter.client import USE_TWITTER_MOCKS, twitter_client
+from app.utils.twitter import handle_twitter_request
+
+HEALTH_PROBES_ENABLED = os.getenv("HEALTH_PROBES_ENABLED", "true").lower() == "true"
+HEALTH_PROBE_TIMEOUT = float(os.getenv("HEALTH_PROBE_TIMEOUT", "5"))  # seconds
+HEALTH_MAX_LOOP_LAG = float(os.getenv("HEALTH_MAX_LOOP_LAG", "0.5"))  # seconds
+# Probes that take the worker out of rotation when failing; the others only degrade it
+HEALTH_CRITICAL_PROBES = {
+    name.strip() for name in os.getenv("HEALTH_CRITICAL_PROBES", "twitter,supabase,event_loop").split(",") if name.strip()
+}
+
+LLM_PROVIDERS = {
+    'together': ('TOGETHER_API_KEY', 'https://api.together.xyz/v1/models'),
+    'groq': ('GROQ_API_KEY', 'https://api.groq.com/openai/v1/models'),
+}
+
+@dataclass(frozen=True)
+class Probe:
+    name: str
+    check: Callable[[], Awaitable[Optional[str]]]  # returns a detail string, raises when unhealthy
+    interval: float
+    timeout: Optional[float] = None  # defaults to the monitor's timeout
+
+async def get_session_probe():
+    return await twitter_client.client.get_timeline(count=1)
+
+async def check_twitter() -> str:
+    """One timeline call through the regular request path.
+
+    It logs in when there is no valid session yet, and draws from the `twitter.timeline`
+    budget and circuit breakers like any other call. A rate limit proves the session works.
+    """
+    if USE_TWITTER_MOCKS:
+        return "mock client"
+    await pace('twitter.timeline')
+    try:
+        await handle_twitter_request(get_session_probe, method='get_timeline')
+    except UpstreamUnavailableError as e:
+        if e.status_code != 429:
+            raise
+        return f"session valid, rate limited for {e.retry_after:.0f}s"
+    return "session valid"
+
+def _ping_supabase():
+    execute_query(get_supabase().table('tweets').select('id').limit(1), 'tweets', 'health')
+
+async def check_supabase() -> str:
+    if not os.getenv("SUPABASE_API_URL"):
+        raise RuntimeError("SUPABASE_API_URL is not configured")
+    # The client is synchronous (and slow to build the first time): keep it off the loop
+    await asyncio.to_thread(_ping_supabase)
+    return "reachable"
+
+async def check_llm() -> str:
+    configured = {name: (os.getenv(key_name), url) for name, (key_name, url) in LLM_PROVIDERS.items() if os.getenv(key_name)}
+    if not configured:
+        raise RuntimeError(f"No LLM API key configured ({', '.join(key for key, _ in LLM_PROVIDERS.values())})")
+    for name, (api_key, url) in configured.items():
+        response = await services.http.get(url, headers={'Authorization': f'Bearer {api_key}'})
+        if response.status_code >= 400:
+            raise RuntimeError(f"{name} returned HTTP {response.status_code}")
+    return f"reachable: {', '.join(configured)}"
+
+async def check_event_loop() -> str:
+    lag = get_last_loop_lag()
+    if lag > HEALTH_MAX_LOOP_LAG:
+        raise RuntimeError(f"event loop lag {lag * 1000:.0f} ms exceeds {HEALTH_MAX_LOOP_LAG * 1000:.0f} ms")
+    return f"lag {lag * 1000:.1f} ms"
+
+DEFAULT_PROBES = [
+    # Long enough for the login the probe may have to perform
+    Probe('twitter', check_twitter, float(os.getenv("HEALTH_TWITTER_INTERVAL", "300")), float(os.getenv("HEALTH_TWITTER_TIMEOUT", "60"))),
+    Probe('supabase', check_supabase, float(os.getenv("HEALTH_SUPABASE_INTERVAL", "15"))),
+    Probe('llm', check_llm, float(os.getenv("HEALTH_LLM_INTERVAL", "300"))),
+    Probe('event_loop', check_event_loop, float(os.getenv("HEALTH_EVENT_LOOP_INTERVAL", "5"))),
+]
+
+class HealthMonitor:
+    """Runs dependency probes in background tasks and keeps their last results.
+
+    Health endpoints only read `results`, so they never wait on a dependency. A result
+    older than a few probe intervals counts as failing: it means the probe task is stuck.
+    """
+
+    def __init__(self, probes: List[Probe], critical: set = HEALTH_CRITICAL_PROBES, timeout: float = HEALTH_PROBE_TIMEOUT):
+        self.probes = {probe.name: probe for probe in probes}
+        self.critical = critical
+        self.timeout = timeout
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._stopping: Optional[asyncio.Event] = None
+
+    async def run_probe(self, probe: Probe) -> Dict[str, Any]:
+        timeout = probe.timeout or self.timeout
+        started = time.perf_counter()
+        try:
+            detail = await asyncio.wait_for(probe.check(), timeout)
+            ok = True
+        except asyncio.TimeoutError:
+            ok, detail = False, f"timed out after {timeout:.0f}s"
+        except Exception as e:
+            ok, detail = False, f"{type(e).__name__}: {str(e)}"
+        latency = time.perf_counter() - started
+
+        previous = self.results.get(probe.name)
+        if previous and previous['ok'] != ok:
+            log = logger.info if ok else logger.warning
+            log(f"{'💚' if ok else '💔'}  Health probe {probe.name}: {detail}")
+        result = {
+            'ok': ok,
+            'detail': detail,
+            'latency_ms': round(latency * 1000, 1),
+            'checked_at': time.time(),
+        }
+        self.results[probe.name] = result
+        HEALTH_PROBE_UP.set(1 if ok else 0, probe=probe.name)
+        HEALTH_PROBE_LATENCY.set(latency, probe=probe.name)
+        return result
+
+    async def _run_forever(self, probe: Probe, stopping: asyncio.Event):
+        # Exit on the stop event, not only on cancel: on Python < 3.12 wait_for drops a
+        # cancel that arrives as the check completes, and the task would keep probing
+        while not stopping.is_set():
+            await self.run_probe(probe)
+            try:
+                await asyncio.wait_for(stopping.wait(), probe.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        if self._tasks:
+            return
+        self._stopping = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run_forever(probe, self._stopping)) for probe in self.probes.values()]
+        logger.info(f"🩺  Health probes started: {', '.join(self.probes)}")
+
+    async def stop(self, timeout: float = 5.0):
+        if not self._tasks:
+            return
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        if pending:
+            logger.warning(f"🩺  {len(pending)} health probes did not stop within {timeout:.0f}s")
+        self._tasks = []
+
+    def report(self) -> Dict[str, Any]:
+        """Cached probe results plus overall status: ready (all critical probes ok) and degraded"""
+        now = time.time()
+        probes = {}
+        for name, probe in self.probes.items():
+            result = self.results.get(name)
+            if result is None:
+                probes[name] = {'ok': False, 'detail': 'pending first probe', 'critical': name in self.critical}
+                continue
+            age = now - result['checked_at']
+            stale = age > 3 * probe.interval + (probe.timeout or self.timeout)
+            probes[name] = {
+                **result,
+                'ok': result['ok'] and not stale,
+                'age_seconds': round(age, 1),
+                'stale': stale,
+                'critical': name in self.critical,
+            }
+        ready = all(probe['ok'] for probe in probes.values() if probe['critical'])
+        degraded = not all(probe['ok'] for probe in probes.values())
+        return {
+            'status': 'unavailable' if not ready else 'degraded' if degraded else 'healthy',
+            'ready': ready,
+            'probes': probes,
+        }
+
+health_monitor = HealthMonitor(DEFAULT_PROBES)
+
+def start_health_probes():
+    if HEALTH_PROBES_ENABLED:
+        health_monitor.start()
+
+async def stop_health_probes():
+    await health_monitor.stop()
@@ -0,0 +1,178 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from loguru import logger
+
+from app.services.system.metrics import (
+    EVENT_LOOP_BLOCK_DURATION,
+    EVENT_LOOP_BLOCKS,
+    EVENT_LOOP_LAG,
+    EVENT_LOOP_LAG_LAST,
+)
+
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.5"))  # seconds
+LOOP_WATCHDOG_ENABLED = os.getenv("LOOP_WATCHDOG_ENABLED", "false").lower() == "true"
+LOOP_WATCHDOG_THRESHOLD = float(os.getenv("LOOP_WATCHDOG_THRESHOLD", "0.1"))  # seconds
+LOOP_WATCHDOG_MAX_REPORTS = int(os.getenv("LOOP_WATCHDOG_MAX_REPORTS", "100"))
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_lag_task: Optional[asyncio.Task] = None
+
+async def monitor_event_loop_lag(interval: float = LOOP_LAG_INTERVAL):
+    """Sleep for a fixed interval and record how late the loop woke us up"""
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - scheduled)
+        EVENT_LOOP_LAG.observe(lag)
+        EVENT_LOOP_LAG_LAST.set(lag)
+
+def get_last_loop_lag() -> float:
+    return EVENT_LOOP_LAG_LAST.value()
+
+def start_loop_lag_monitor():
+    global _lag_task
+    if _lag_task and not _lag_task.done():
+        return
+    _lag_task = asyncio.create_task(monitor_event_loop_lag())
+    logger.info(f"📈  Event loop lag monitor started (interval {LOOP_LAG_INTERVAL}s)")
+
+async def stop_loop_lag_monitor():
+    global _lag_task
+    if not _lag_task:
+        return
+    _lag_task.cancel()
+    try:
+        await _lag_task
+    except asyncio.CancelledError:
+        pass
+    _lag_task = None
+
+class LoopWatchdog:
+    """
+    Detects callbacks that block the event loop.
+
+    A task on the loop refreshes a heartbeat; a daemon thread checks it and, when the
+    heartbeat is older than the threshold, samples the loop thread's stack. That stack
+    points at the synchronous call that is holding the loop.
+    """
+
+    def __init__(self, threshold: float = LOOP_WATCHDOG_THRESHOLD, max_reports: int = LOOP_WATCHDOG_MAX_REPORTS):
+        self.threshold = threshold
+        self.tick = max(threshold / 4, 0.005)
+        self.reports: Deque[Dict[str, Any]] = deque(maxlen=max_reports)
+        self._lock = threading.Lock()
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    async def _beat(self):
+        while True:
+            self._heartbeat = time.monotonic()
+            await asyncio.sleep(self.tick)
+
+    def _watch(self):
+        current: Optional[Dict[str, Any]] = None
+        while not self._stopped.wait(self.tick):
+            stalled_for = time.monotonic() - self._heartbeat
+
+            if stalled_for < self.threshold:
+                if current:
+                    self._finish_report(current)
+                    current = None
+                continue
+
+            if current is None:
+                current = self._capture(stalled_for)
+                continue
+
+            current['duration'] = round(stalled_for, 4)
+
+        if current:
+            self._finish_report(current)
+
+    def _capture(self, stalled_for: float) -> Dict[str, Any]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.extract_stack(frame) if frame else []
+        app_frames = [item for item in stack if item.filename.startswith(APP_ROOT)]
+        blocking_frame = stack[-1] if stack else None
+        report = {
+            'detected_at': datetime.now(timezone.utc).isoformat(),
+            'duration': round(stalled_for, 4),
+            'blocking_call': _format_frame(blocking_frame),
+            'app_call_site': _format_frame(app_frames[-1] if app_frames else None),
+            'stack': [_format_frame(item) for item in stack],
+        }
+        logger.warning(
+            f"🐢  Event loop blocked for >{self.threshold}s at {report['app_call_site'] or report['blocking_call']}"
+        )
+        return report
+
+    def _finish_report(self, report: Dict[str, Any]):
+        EVENT_LOOP_BLOCKS.inc()
+        EVENT_LOOP_BLOCK_DURATION.observe(report['duration'])
+        with self._lock:
+            self.reports.append(report)
+
+    def get_reports(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self.reports)
+
+    def clear_reports(self):
+        with self._lock:
+            self.reports.clear()
+
+    def start(self):
+        if self.is_running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._heartbeat_task = asyncio.create_task(self._beat())
+        self._thread = threading.Thread(target=self._watch, name='loop-watchdog', daemon=True)
+        self._thread.start()
+        logger.info(f"🐕  Event loop watchdog started (threshold {self.threshold}s)")
+
+    async def stop(self):
+        self._stopped.set()
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+def _format_frame(frame: Optional[traceback.FrameSummary]) -> Optional[str]:
+    if frame is None:
+        return None
+    filename = os.path.relpath(frame.filename, os.path.dirname(APP_ROOT)) if frame.filename.startswith(APP_ROOT) else frame.filename
+    return f"{filename}:{frame.lineno} in {frame.name}" + (f" -> {frame.line}" if frame.line else "")
+
+loop_watchdog = LoopWatchdog()
+
+def start_loop_watchdog():
+    if not LOOP_WATCHDOG_ENABLED:
+        return
+    loop_watchdog.start()
+
+async def stop_loop_watchdog():
+    await loop_watchdog.stop()
@@ -0,0 +1,322 @@
+import math
+from abc import ABC, abstractmethod
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric(ABC):
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        ...
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        lines.extend(self.samples())
+        return '\n'.join(lines)
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}' for key, value in items]
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}' for key, value in items]
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, ('le', _format_value(bound)))
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+            lines.append(f'{self.name}_count{labels} {cumulative}')
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return '\n'.join(metric.render() for metric in self._metrics.values()) + '\n'
+
+registry = Registry()
+
+# Upstream Twitter (twikit) calls made through handle_twitter_request
+TWITTER_REQUESTS = registry.register(Counter(
+    'twitter_upstream_requests_total',
+    'Upstream Twitter calls by method and outcome.',
+    ('method', 'outcome')
+))
+TWITTER_REQUEST_DURATION = registry.register(Histogram(
+    'twitter_upstream_request_duration_seconds',
+    'Latency of upstream Twitter calls by method.',
+    ('method',)
+))
+TWITTER_RETRIES = registry.register(Counter(
+    'twitter_upstream_retries_total',
+    'Retried upstream Twitter calls by method and error category.',
+    ('method', 'category')
+))
+
+# Circuit breakers (0 closed, 1 half-open, 2 open)
+CIRCUIT_STATE = registry.register(Gauge(
+    'circuit_breaker_state',
+    'Circuit breaker state by breaker: 0 closed, 1 half-open, 2 open.',
+    ('breaker',)
+))
+
+# Mention inbox
+MENTIONS_PROCESSED = registry.register(Counter(
+    'mentions_processed_total',
+    'Mentions taken from the inbox queue by outcome (replied, retry, failed).',
+    ('outcome',)
+))
+MENTION_QUEUE_DEPTH = registry.register(Gauge(
+    'mention_queue_depth',
+    'Mentions waiting for a reply worker.'
+))
+REPLY_QUEUE_DROPPED = registry.register(Counter(
+    'reply_queue_dropped_total',
+    'Reply candidates dropped from the priority queue by reason (expired, evicted).',
+    ('reason',)
+))
+
+# Background dependency probes behind /health/ready
+HEALTH_PROBE_UP = registry.register(Gauge(
+    'health_probe_up',
+    'Result of the last dependency probe by probe name: 1 ok, 0 failing.',
+    ('probe',)
+))
+HEALTH_PROBE_LATENCY = registry.register(Gauge(
+    'health_probe_latency_seconds',
+    'Duration of the last dependency probe by probe name.',
+    ('probe',)
+))
+
+# LLM provider calls
+LLM_REQUESTS = registry.register(Counter(
+    'llm_requests_total',
+    'LLM calls by provider, model and outcome.',
+    ('provider', 'model', 'outcome')
+))
+LLM_REQUEST_DURATION = registry.register(Histogram(
+    'llm_request_duration_seconds',
+    'Latency of LLM calls by provider and model.',
+    ('provider', 'model'),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+))
+LLM_TOKENS = registry.register(Counter(
+    'llm_tokens_total',
+    'Tokens consumed by LLM calls by provider, model and kind (request/response).',
+    ('provider', 'model', 'kind')
+))
+
+# Supabase (PostgREST) round trips
+SUPABASE_REQUESTS = registry.register(Counter(
+    'supabase_requests_total',
+    'Supabase round trips by table, operation and outcome.',
+    ('table', 'operation', 'outcome')
+))
+SUPABASE_REQUEST_DURATION = registry.register(Histogram(
+    'supabase_request_duration_seconds',
+    'Latency of Supabase round trips by table and operation.',
+    ('table', 'operation')
+))
+SUPABASE_ROWS = registry.register(Counter(
+    'supabase_rows_total',
+    'Rows returned by Supabase round trips by table and operation.',
+    ('table', 'operation')
+))
+TWEET_WRITE_BUFFER_ROWS = registry.register(Gauge(
+    'tweet_write_buffer_rows',
+    'Tweet rows waiting in the write-behind buffer.'
+))
+TWEET_WRITE_FLUSHES = registry.register(Counter(
+    'tweet_write_flushes_total',
+    'Write-behind buffer flushes by outcome (success/error).',
+    ('outcome',)
+))
+TWEET_WRITE_FLUSH_SIZE = registry.register(Histogram(
+    'tweet_write_flush_rows',
+    'Tweet rows written per write-behind flush.',
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000)
+))
+
+TWEET_REFRESHES = registry.register(Counter(
+    'tweet_refreshes_total',
+    'Tracked tweets re-fetched by the engagement refresher by result (changed/unchanged/failed).',
+    ('result',)
+))
+
+# In-process caches
+CACHE_REQUESTS = registry.register(Counter(
+    'cache_requests_total',
+    'Cache lookups by cache name and result (hit/miss).',
+    ('cache', 'result')
+))
+
+# Event loop health
+EVENT_LOOP_LAG = registry.register(Histogram(
+    'event_loop_lag_seconds',
+    'Delay between the scheduled and actual wake-up of the loop lag probe.',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+))
+EVENT_LOOP_LAG_LAST = registry.register(Gauge(
+    'event_loop_lag_last_seconds',
+    'Most recent event loop lag sample.'
+))
+
+EVENT_LOOP_BLOCKS = registry.register(Counter(
+    'event_loop_blocked_total',
+    'Event loop stalls detected by the watchdog (callbacks exceeding the threshold).'
+))
+EVENT_LOOP_BLOCK_DURATION = registry.register(Histogram(
+    'event_loop_blocked_seconds',
+    'Duration of event loop stalls detected by the watchdog.',
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+))
+
+# Inbound HTTP requests
+HTTP_REQUEST_DURATION = registry.register(Histogram(
+    'http_request_duration_seconds',
+    'Latency of inbound HTTP requests by method, route and status.',
+    ('method', 'route', 'status')
+))
+
+@contextmanager
+def track_llm_call(provider: str, model: str) -> Iterator[None]:
+    """Count and time an LLM call; exceptions are counted as errors and re-raised"""
+    started = time.perf_counter()
+    outcome = 'error'
+    try:
+        yield
+        outcome = 'success'
+    finally:
+        LLM_REQUESTS.inc(provider=provider, model=model, outcome=outcome)
+        LLM_REQUEST_DURATION.observe(time.perf_counter() - started, provider=provider, model=model)
+
+def record_llm_usage(provider: str, model: str, usage: Any) -> None:
+    """Record token usage from a pydantic-ai Usage object"""
+    LLM_TOKENS.inc(getattr(usage, 'request_tokens', None) or 0, provider=provider, model=model, kind='request')
+    LLM_TOKENS.inc(getattr(usage, 'response_tokens', None) or 0, provider=provider, model=model, kind='response')
+
+def record_cache_lookup(cache: str, is_hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result='hit' if is_hit else 'miss')
+
+def render_metrics() -> str:
+    """Render all registered metrics in the Prometheus text exposition format"""
+    return registry.render()
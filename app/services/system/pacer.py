@@ -0,0 +1,127 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from loguru import logger
+
+from app.services.system.tracing import span
+
+PACER_ENABLED = os.getenv("PACER_ENABLED", "true").lower() == "true"
+PACER_DB_PATH = os.getenv("PACER_DB_PATH", os.path.join(tempfile.gettempdir(), "comagency-pacer.sqlite3"))
+
+# Twitter's GraphQL search allows about 50 calls per 15-minute window per account
+TWITTER_SEARCH_RATE_LIMIT = float(os.getenv("TWITTER_SEARCH_RATE_LIMIT", "50"))
+TWITTER_RATE_WINDOW = float(os.getenv("TWITTER_RATE_WINDOW", "900"))
+# Search pages spread over the window: a small burst, then one page every window / limit seconds
+TWITTER_SEARCH_BURST = float(os.getenv("TWITTER_SEARCH_BURST", "5"))
+# Home timelines (For You and Following share one budget)
+TWITTER_TIMELINE_RATE_LIMIT = float(os.getenv("TWITTER_TIMELINE_RATE_LIMIT", "500"))
+# Mentions inbox (notifications)
+TWITTER_NOTIFICATIONS_RATE_LIMIT = float(os.getenv("TWITTER_NOTIFICATIONS_RATE_LIMIT", "180"))
+# Replies written by the mention workers, per hour
+REPLY_RATE_LIMIT = float(os.getenv("REPLY_RATE_LIMIT", "30"))
+# Multi-id tweet lookups (TweetResultsByRestIds)
+TWITTER_LOOKUP_RATE_LIMIT = float(os.getenv("TWITTER_LOOKUP_RATE_LIMIT", "150"))
+# Likes/unlikes: one write every TWITTER_WRITE_SPACING seconds after a burst of TWITTER_WRITE_BURST
+TWITTER_WRITE_SPACING = float(os.getenv("TWITTER_WRITE_SPACING", "1"))
+TWITTER_WRITE_BURST = float(os.getenv("TWITTER_WRITE_BURST", "5"))
+
+@dataclass(frozen=True)
+class Bucket:
+    capacity: float
+    refill_per_second: float
+
+BUCKETS: Dict[str, Bucket] = {
+    'twitter.search': Bucket(TWITTER_SEARCH_BURST, TWITTER_SEARCH_RATE_LIMIT / TWITTER_RATE_WINDOW),
+    'twitter.timeline': Bucket(TWITTER_TIMELINE_RATE_LIMIT, TWITTER_TIMELINE_RATE_LIMIT / TWITTER_RATE_WINDOW),
+    'twitter.notifications': Bucket(TWITTER_NOTIFICATIONS_RATE_LIMIT, TWITTER_NOTIFICATIONS_RATE_LIMIT / TWITTER_RATE_WINDOW),
+    'twitter.reply': Bucket(REPLY_RATE_LIMIT, REPLY_RATE_LIMIT / 3600),
+    'twitter.lookup': Bucket(TWITTER_LOOKUP_RATE_LIMIT, TWITTER_LOOKUP_RATE_LIMIT / TWITTER_RATE_WINDOW),
+    'twitter.write': Bucket(TWITTER_WRITE_BURST, 1 / TWITTER_WRITE_SPACING),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+def _connect(path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(_SCHEMA)
+    return connection
+
+class Pacer:
+    """Token buckets shared by every worker process through one SQLite file.
+
+    A call reserves a token even when the bucket is empty (the balance goes negative), and
+    the caller sleeps until its reservation matures; concurrent callers in any process are
+    therefore served in arrival order at the bucket's rate instead of all retrying at once.
+    """
+
+    def __init__(self, path: str = PACER_DB_PATH, buckets: Optional[Dict[str, Bucket]] = None):
+        self.path = path
+        self.buckets = buckets if buckets is not None else BUCKETS
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        # Connections must not cross a fork
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = _connect(self.path)
+            self._pid = os.getpid()
+        return self._connection
+
+    def reserve(self, name: str, tokens: float = 1.0) -> float:
+        """Take `tokens` from the bucket; returns how many seconds to wait before using them"""
+        bucket = self.buckets[name]
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                available = self._refilled(db, name, bucket, now) - tokens
+                db.execute(
+                    "INSERT INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                    (name, available, now)
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return -available / bucket.refill_per_second if available < 0 else 0.0
+
+    def available(self, name: str) -> float:
+        """Current balance of a bucket; negative while reservations are outstanding"""
+        with self._lock:
+            return self._refilled(self._db(), name, self.buckets[name], time.time())
+
+    @staticmethod
+    def _refilled(db: sqlite3.Connection, name: str, bucket: Bucket, now: float) -> float:
+        row = db.execute("SELECT tokens, updated_at FROM buckets WHERE name = ?", (name,)).fetchone()
+        if not row:
+            return bucket.capacity
+        return min(bucket.capacity, row[0] + (now - row[1]) * bucket.refill_per_second)
+
+pacer = Pacer()
+
+async def pace(name: str, tokens: float = 1.0) -> float:
+    """Wait for a token from a shared bucket; returns the seconds waited"""
+    if not PACER_ENABLED:
+        return 0.0
+    wait = await asyncio.to_thread(pacer.reserve, name, tokens)
+    if wait > 0:
+        logger.info(f'⏳  Pacing {name}: waiting {wait:.1f} seconds ...')
+        with span('pacer.wait', bucket=name, wait_seconds=round(wait, 3)):
+            await asyncio.sleep(wait)
+    return wait
@@ -0,0 +1,117 @@
+import os
+import random
+import time
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from app.services.system.metrics import CIRCUIT_STATE
+
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("BREAKER_RESET_TIMEOUT", "30"))
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+class UpstreamUnavailableError(Exception):
+    """Raised without calling upstream while its circuit is open"""
+
+    def __init__(self, name: str, retry_after: float, status_code: int = 503):
+        super().__init__(f"{name} is unavailable; retry in {retry_after:.0f}s")
+        self.name = name
+        self.retry_after = retry_after
+        self.status_code = status_code
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    closed: calls pass, failures are counted. After `failure_threshold` consecutive
+    failures the circuit opens and calls fail fast for `reset_timeout` seconds. Then it is
+    half-open: a single probe call goes through, success closes the circuit, failure
+    opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_until = 0.0
+        self.open_status_code = 503
+        self.last_error: Optional[str] = None
+        self._probe_in_flight = False
+        self._set_state(CLOSED)
+
+    def _set_state(self, state: str):
+        if state != self.state:
+            logger.warning(f"🔌  Circuit {self.name}: {self.state} -> {state}")
+        self.state = state
+        CIRCUIT_STATE.set(_STATE_VALUES[state], breaker=self.name)
+
+    def before_call(self) -> bool:
+        """Raise UpstreamUnavailableError unless a call may go through now.
+
+        Returns True when the call is the half-open probe; the caller must then report its
+        result (or `release()` the probe).
+        """
+        if self.state == OPEN:
+            remaining = self.opened_until - time.monotonic()
+            if remaining > 0:
+                raise UpstreamUnavailableError(self.name, remaining, self.open_status_code)
+            self._set_state(HALF_OPEN)
+
+        if self.state == HALF_OPEN:
+            if self._probe_in_flight:
+                raise UpstreamUnavailableError(self.name, 1.0)
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self._probe_in_flight = False
+        self.failures = 0
+        self._set_state(CLOSED)
+
+    def record_failure(self, error: Optional[BaseException] = None):
+        self._probe_in_flight = False
+        self.failures += 1
+        self.last_error = f"{type(error).__name__}: {error}" if error else None
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.trip(self.reset_timeout)
+
+    def trip(self, seconds: float, status_code: int = 503):
+        """Open the circuit for `seconds`, e.g. until a rate limit window resets (429)"""
+        self._probe_in_flight = False
+        self.open_status_code = status_code
+        self.opened_until = max(self.opened_until, time.monotonic() + seconds)
+        self._set_state(OPEN)
+
+    def release(self):
+        """Forget a probe that ended without telling anything about upstream health"""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'retry_after': round(max(0.0, self.opened_until - time.monotonic()), 1) if self.state == OPEN else 0.0,
+            'last_error': self.last_error,
+        }
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+def get_breaker(name: str) -> CircuitBreaker:
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(name)
+    return _breakers[name]
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    return {name: breaker.snapshot() for name, breaker in sorted(_breakers.items())}
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2 ** attempt)]"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
@@ -1,9 +1,28 @@
 from supabase import create_client, Client
 from functools import lru_cache
+from typing import Any
 import os
+import time
+
+from app.services.system.metrics import SUPABASE_REQUEST_DURATION, SUPABASE_REQUESTS, SUPABASE_ROWS
+from app.services.system.tracing import span
 
 @lru_cache()
 def get_supabase() -> Client:
     url = os.getenv("SUPABASE_API_URL")
     key = os.getenv("SUPABASE_API_KEY")
-    return create_client(url, key)
\ No newline at end of file
+    return create_client(url, key)
+
+def execute_query(query: Any, table: str, operation: str) -> Any:
+    """Execute a PostgREST query builder, recording round-trip latency and returned rows"""
+    started = time.perf_counter()
+    outcome = 'error'
+    try:
+        with span(f'supabase.{operation}', table=table):
+            result = query.execute()
+        outcome = 'success'
+        SUPABASE_ROWS.inc(len(result.data or []), table=table, operation=operation)
+        return result
+    finally:
+        SUPABASE_REQUESTS.inc(table=table, operation=operation, outcome=outcome)
+        SUPABASE_REQUEST_DURATION.observe(time.perf_counter() - started, table=table, operation=operation)
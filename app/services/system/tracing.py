@@ -0,0 +1,177 @@
+import asyncio
+import os
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+import httpx
+from loguru import logger
+
+OTLP_TRACES_ENDPOINT = os.getenv("OTLP_TRACES_ENDPOINT")  # e.g. http://localhost:4318/v1/traces
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "comagency")
+TRACE_ID_HEADER = "X-Trace-Id"
+TRACE_DEBUG_HEADER = "X-Debug-Trace"
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+class Span:
+    __slots__ = ('name', 'span_id', 'parent_id', 'kind', 'start_ns', 'end_ns', 'attributes', 'status', 'error')
+
+    def __init__(self, name: str, parent_id: Optional[str], kind: int, attributes: Dict[str, Any]):
+        self.name = name
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.status = STATUS_OK
+        self.error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns or time.time_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+class Trace:
+    def __init__(self, trace_id: Optional[str] = None):
+        self.trace_id = trace_id or secrets.token_hex(16)
+        self.spans: List[Span] = []
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar('current_trace', default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+_export_tasks: Set[asyncio.Task] = set()
+
+def _normalize_trace_id(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    value = value.strip().lower().replace('-', '')
+    if len(value) != 32 or any(char not in '0123456789abcdef' for char in value):
+        return None
+    return value
+
+def get_current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+def get_trace_id() -> Optional[str]:
+    trace = _current_trace.get()
+    return trace.trace_id if trace else None
+
+@contextmanager
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Record a timed span under the current trace; a no-op outside of a traced request"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = Span(name, parent.span_id if parent else None, kind, attributes)
+    trace.spans.append(current)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = STATUS_ERROR
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+
+def traced(name: str):
+    """Decorator wrapping an async function in a span"""
+    def decorator(func: Callable):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@contextmanager
+def start_trace(name: str, trace_id: Optional[str] = None, **attributes: Any) -> Iterator[Trace]:
+    """Start a request-scoped trace with a root server span; the trace is exported when it ends"""
+    trace = Trace(_normalize_trace_id(trace_id))
+    trace_token = _current_trace.set(trace)
+    try:
+        with span(name, kind=SPAN_KIND_SERVER, **attributes):
+            yield trace
+    finally:
+        _current_trace.reset(trace_token)
+        schedule_trace_export(trace)
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{'key': key, 'value': _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+def to_otlp(trace: Trace) -> Dict[str, Any]:
+    """Serialize a trace as an OTLP/JSON ExportTraceServiceRequest"""
+    spans = []
+    for item in trace.spans:
+        otlp_span = {
+            'traceId': trace.trace_id,
+            'spanId': item.span_id,
+            'name': item.name,
+            'kind': item.kind,
+            'startTimeUnixNano': str(item.start_ns),
+            'endTimeUnixNano': str(item.end_ns or time.time_ns()),
+            'attributes': _otlp_attributes(item.attributes),
+            'status': {'code': item.status, **({'message': item.error} if item.error else {})}
+        }
+        if item.parent_id:
+            otlp_span['parentSpanId'] = item.parent_id
+        spans.append(otlp_span)
+
+    return {
+        'resourceSpans': [{
+            'resource': {'attributes': _otlp_attributes({'service.name': TRACE_SERVICE_NAME})},
+            'scopeSpans': [{'scope': {'name': 'app.services.system.tracing'}, 'spans': spans}]
+        }]
+    }
+
+def server_timing(trace: Trace) -> str:
+    """Render the trace as a Server-Timing header value (one entry per span)"""
+    entries = []
+    for item in trace.spans:
+        metric = ''.join(char if char.isalnum() or char in '.-' else '_' for char in item.name)
+        description = item.name.replace('"', "'")
+        entries.append(f'{metric};desc="{description}";dur={item.duration_ms:.2f}')
+    return ', '.join(entries)
+
+async def export_trace(trace: Trace) -> None:
+    if not OTLP_TRACES_ENDPOINT:
+        return
+    try:
+        async with httpx.AsyncClient(timeout=5) as http_client:
+            response = await http_client.post(OTLP_TRACES_ENDPOINT, json=to_otlp(trace))
+            response.raise_for_status()
+    except Exception as e:
+        logger.warning(f"Failed to export trace {trace.trace_id}: {str(e)}")
+
+def schedule_trace_export(trace: Trace) -> None:
+    """Export the trace in the background so the response is not delayed"""
+    if not OTLP_TRACES_ENDPOINT:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(export_trace(trace))
+    _export_tasks.add(task)
+    task.add_done_callback(_export_tasks.discard)
@@ -1,18 +1,20 @@
 import asyncio
 import os
-from typing import List
+from typing import Optional
 from loguru import logger
 from twikit import Client
 
 from app.config import get_twitter_credentials
+from app.services.twitter.mock_client import MockTwitterClient
+from app.services.twitter.session_store import SessionRecord, get_session_store
 
 USE_TWITTER_MOCKS = os.getenv("USE_TWITTER_MOCKS", "false").lower() == "true"
 ExecutionStopError = (asyncio.CancelledError, KeyboardInterrupt, SystemError)
 
 class TwitterClient:
     def __init__(self):
-        self.client = Client('en-US')
-        self.client.load_cookies('cookies.json')
+        self._client = None
+        self._session: Optional[SessionRecord] = None
         self.credentials = get_twitter_credentials()
         self.is_authenticated = False
         self.auth_retries = 0
@@ -20,6 +22,40 @@ class TwitterClient:
         self.retry_delay = 30  # seconds
         logger.info(f'🙍‍♂️  Username: {self.credentials["username"]}')
 
+    @property
+    def client(self):
+        """twikit client, built on first use so importing the app does no I/O"""
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+
+    def _create_client(self):
+        if USE_TWITTER_MOCKS:
+            return MockTwitterClient.from_env()
+
+        client = Client('en-US')
+        record = get_session_store().load()
+        if record:
+            client.set_cookies(record.cookies)
+            self._session = record
+        else:
+            logger.warning('🍪  No saved session; will log in on first request')
+        return client
+
+    def _use_session(self, record: SessionRecord):
+        client = Client('en-US')
+        client.set_cookies(record.cookies)
+        self.client = client
+        self._session = record
+
+    def _mark_session_good(self):
+        if self._session:
+            get_session_store().mark_good(self._session)
+
     async def ensure_authenticated(self):
         if USE_TWITTER_MOCKS:
             logger.info("📙  Mock mode is enabled; skipping authentication.")
@@ -53,9 +89,14 @@ class TwitterClient:
             # First try to verify if existing cookies are valid
             if await self._verify_existing_session():
                 logger.info('✅  Using existing session')
+                self._mark_session_good()
                 self.is_authenticated = True
                 return
 
+            # Then the last session known to work, which is much cheaper than a login
+            if await self._restore_good_session():
+                return
+
             # If not, perform full authentication
             await self._perform_full_authentication()
             
@@ -77,63 +118,58 @@ class TwitterClient:
         except Exception:
             return False
 
+    async def _restore_good_session(self) -> bool:
+        """Fall back to the last session verified against Twitter; one worker at a time promotes it"""
+        store = get_session_store()
+        async with store.lock():
+            # Read under the lock: a worker that logged in meanwhile has replaced it
+            good = store.load_good()
+            if not good or good == self._session:
+                return False
+
+            self._use_session(good)
+            if not await self._verify_existing_session():
+                return False
+
+            # Promote it so the next worker start loads a working session directly
+            self._session = store.save(good.cookies)
+            store.mark_good(self._session)
+
+        logger.info(f'✅  Restored last good session (version {good.version})')
+        self.is_authenticated = True
+        self.auth_retries = 0
+        return True
+
     async def _perform_full_authentication(self):
-        """Perform full authentication process"""
-        self.client = Client('en-US')
-        
-        # Perform login
-        await self.client.login(
-            auth_info_1=self.credentials['username'],
-            auth_info_2=self.credentials['email'],
-            password=self.credentials['password']
-        )
-        
-        # Save new cookies
-        self.client.save_cookies('cookies.json')
+        """Perform full authentication process; one worker at a time logs in"""
+        store = get_session_store()
+        async with store.lock():
+            # Another worker may have logged in while this one waited for the lock
+            latest = store.load()
+            if latest and (self._session is None or latest.version > self._session.version):
+                self._use_session(latest)
+                if await self._verify_existing_session():
+                    logger.info(f'✅  Using session saved by another worker (version {latest.version})')
+                    self._mark_session_good()
+                    self.is_authenticated = True
+                    self.auth_retries = 0
+                    return
+
+            self.client = Client('en-US')
+
+            # Perform login
+            await self.client.login(
+                auth_info_1=self.credentials['username'],
+                auth_info_2=self.credentials['email'],
+                password=self.credentials['password']
+            )
+
+            # Save new cookies; a login only succeeds with a working session
+            self._session = store.save(self.client.get_cookies())
+            store.mark_good(self._session)
+
         self.is_authenticated = True
         self.auth_retries = 0  # Reset retry counter on success
-        logger.info('✅  Authentication successful')
-
-    @staticmethod
-    def get_photo_urls(media_list: List) -> List[str]:
-        if not media_list:
-            return []
-        
-        return [
-            item['media_url_https'] 
-            for item in media_list 
-            if item.get('type') == 'photo' 
-            and item.get('ext_media_availability', {}).get('status') == 'Available'
-        ]
-
-    def process_tweet(self, tweet, tweet_count):
-        if USE_TWITTER_MOCKS:
-            photo_urls = self.get_photo_urls(tweet['media'] if 'media' in tweet else [])
-            result = {
-                'tweet_id': tweet['id'],
-                'tweet_user_name': tweet['user']['name'],
-                'tweet_user_nick': tweet['user']['screen_name'],
-                'text': tweet['text'],
-                'created_at': str(tweet['created_at']),
-                'retweets': tweet['retweet_count'],
-                'likes': tweet['favorite_count'],
-                'photo_urls': photo_urls,
-                'tweet_lang': tweet['lang'],
-            }
-        else:
-            photo_urls = self.get_photo_urls(tweet.media if hasattr(tweet, 'media') else [])
-            result = {
-                'tweet_id': tweet.id,
-                'tweet_user_name': tweet.user.name,
-                'tweet_user_nick': tweet.user.screen_name,
-                'text': tweet.text,
-                'created_at': str(tweet.created_at),
-                'retweets': tweet.retweet_count,
-                'likes': tweet.favorite_count,
-                'photo_urls': photo_urls,
-                'tweet_lang': tweet.lang,
-            }
-        
-        return result
+        logger.info(f'✅  Authentication successful (session version {self._session.version})')
 
 twitter_client = TwitterClient() 
\ No newline at end of file
@@ -0,0 +1,69 @@
+from typing import Dict, List, Tuple
+
+from loguru import logger
+from supabase import Client
+
+from app.services.system.pacer import pace
+from app.services.twitter.client import twitter_client
+from app.services.twitter.tweet_service import get_liked_tweet_ids, set_tweets_liked
+from app.utils.twitter import handle_twitter_request
+
+async def favorite(tweet_id: str, like: bool = True):
+    """Like (or unlike) one tweet, spaced with every other write through `twitter.write`"""
+    async def do_favorite():
+        return await twitter_client.client.favorite_tweet(tweet_id)
+
+    async def do_unfavorite():
+        return await twitter_client.client.unfavorite_tweet(tweet_id)
+
+    await pace('twitter.write')
+    if like:
+        return await handle_twitter_request(do_favorite, method='favorite_tweet')
+    return await handle_twitter_request(do_unfavorite, method='unfavorite_tweet')
+
+async def bulk_set_liked(supabase: Client, tweet_ids: List[str], like: bool) -> Tuple[Dict[str, str], Dict[str, str], int]:
+    """
+    Like or unlike tweets one after another, in request order.
+
+    Tweets already marked is_liked are skipped when liking. The flag of every tweet that
+    changed is written back in a single update at the end.
+
+    Returns:
+        (results, errors, updated_rows): per-id status (liked/unliked/skipped/failed),
+        per-id error messages, and the number of tweets rows updated
+    """
+    unique_ids = list(dict.fromkeys(str(tweet_id) for tweet_id in tweet_ids))
+    done_status = 'liked' if like else 'unliked'
+
+    already_liked = set()
+    if like:
+        try:
+            already_liked = await get_liked_tweet_ids(supabase, unique_ids)
+        except Exception as e:
+            logger.warning(f"⚠️  Could not read liked flags, liking all {len(unique_ids)} tweets: {str(e)}")
+
+    results: Dict[str, str] = {}
+    errors: Dict[str, str] = {}
+    changed = []
+    for tweet_id in unique_ids:
+        if tweet_id in already_liked:
+            results[tweet_id] = 'skipped'
+            continue
+        try:
+            await favorite(tweet_id, like)
+        except Exception as e:
+            results[tweet_id] = 'failed'
+            errors[tweet_id] = getattr(e, 'detail', None) or str(e)
+            continue
+        results[tweet_id] = done_status
+        changed.append(tweet_id)
+
+    updated_rows = 0
+    if changed:
+        try:
+            updated_rows = await set_tweets_liked(supabase, changed, like)
+        except Exception as e:
+            logger.error(f"Error updating is_liked for {len(changed)} tweets: {str(e)}")
+
+    logger.info(f"💜  Bulk {'like' if like else 'unlike'}: {len(changed)} {done_status}, {len(unique_ids) - len(changed) - len(errors)} skipped, {len(errors)} failed")
+    return results, errors, updated_rows
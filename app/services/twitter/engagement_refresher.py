@@ -0,0 +1,133 @@
+import asyncio
+import math
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from app.repositories.twitter.tweet_repository import get_tweet_repository
+from app.services.system.file_lock import file_lock
+from app.services.system.metrics import TWEET_REFRESHES
+from app.services.system.supabase import get_supabase
+from app.services.twitter.tweet_lookup import get_tweets_by_ids
+from app.services.twitter.tweet_service import update_tweet_counters
+
+TWEET_REFRESH_ENABLED = os.getenv("TWEET_REFRESH_ENABLED", "false").lower() == "true"
+TWEET_REFRESH_INTERVAL = float(os.getenv("TWEET_REFRESH_INTERVAL", "300"))  # seconds between cycles
+TWEET_REFRESH_BATCH = int(os.getenv("TWEET_REFRESH_BATCH", "100"))  # tweets re-fetched per cycle
+TWEET_REFRESH_TRACKED = int(os.getenv("TWEET_REFRESH_TRACKED", "1000"))  # newest candidates considered
+TWEET_REFRESH_MAX_AGE = float(os.getenv("TWEET_REFRESH_MAX_AGE", str(48 * 3600)))  # seconds since saved
+TWEET_REFRESH_MIN_INTERVAL = float(os.getenv("TWEET_REFRESH_MIN_INTERVAL", "900"))  # seconds between checks of one tweet
+TWEET_REFRESH_DECAY = float(os.getenv("TWEET_REFRESH_DECAY", str(6 * 3600)))  # seconds of age worth one point
+TWEET_REFRESH_LOCK_PATH = os.getenv("TWEET_REFRESH_LOCK_PATH", os.path.join(tempfile.gettempdir(), "comagency-tweet-refresher.lock"))
+
+def refresh_priority(likes_per_hour: float, age: float) -> float:
+    """Log likes-per-hour growth minus one point per TWEET_REFRESH_DECAY of age"""
+    return math.log1p(max(0.0, likes_per_hour)) - age / TWEET_REFRESH_DECAY
+
+class EngagementRefresher:
+    """
+    Keeps the counters of tracked tweets (unhandled reply candidates saved within
+    TWEET_REFRESH_MAX_AGE) fresh.
+
+    Every cycle the tweets not checked for TWEET_REFRESH_MIN_INTERVAL are ranked by
+    recency and engagement velocity, and the top TWEET_REFRESH_BATCH are re-fetched through
+    the multi-id lookup (`twitter.lookup` budget). Only tweets whose counts changed are
+    written, in one bulk update, so database cost follows the changes, not the table.
+    Only one worker per host refreshes (advisory lock).
+    """
+
+    def __init__(self, interval: float = TWEET_REFRESH_INTERVAL, batch_size: int = TWEET_REFRESH_BATCH):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._checked_at: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh_once(self) -> Tuple[int, int]:
+        """Run one cycle; returns (tweets checked, tweets changed)"""
+        repository = get_tweet_repository()
+        now = time.time()
+        since = datetime.fromtimestamp(now - TWEET_REFRESH_MAX_AGE, timezone.utc)
+        tracked = await repository.get_tracked_counters(since, TWEET_REFRESH_TRACKED)
+
+        tracked_ids = {tweet.id for tweet in tracked}
+        self._checked_at = {tweet_id: checked_at for tweet_id, checked_at in self._checked_at.items() if tweet_id in tracked_ids}
+        due = [tweet for tweet in tracked if now - self._checked_at.get(tweet.id, 0.0) >= TWEET_REFRESH_MIN_INTERVAL]
+        if not due:
+            return 0, 0
+
+        try:
+            velocities = await repository.get_engagement_velocity([tweet.id for tweet in due])
+        except Exception as e:
+            logger.warning(f"⚠️  Could not read engagement velocity, refreshing newest first: {str(e)}")
+            velocities = {}
+        due.sort(
+            key=lambda tweet: refresh_priority(
+                velocities[tweet.id].likes_per_hour if tweet.id in velocities else 0.0,
+                now - tweet.created_at.timestamp()
+            ),
+            reverse=True
+        )
+        batch = due[:self.batch_size]
+
+        fetched, errors = await get_tweets_by_ids([tweet.id for tweet in batch], use_cache=False)
+        for tweet in batch:
+            self._checked_at[tweet.id] = now
+
+        changed = [
+            {'id': tweet.id, 'likes_count': fetched[tweet.id].favorite_count, 'retweets_count': fetched[tweet.id].retweet_count}
+            for tweet in batch
+            if tweet.id in fetched
+            and (fetched[tweet.id].favorite_count, fetched[tweet.id].retweet_count) != (tweet.likes_count, tweet.retweets_count)
+        ]
+        updated = await update_tweet_counters(get_supabase(), changed)
+
+        TWEET_REFRESHES.inc(len(changed), result='changed')
+        TWEET_REFRESHES.inc(len(fetched) - len(changed), result='unchanged')
+        TWEET_REFRESHES.inc(len(errors), result='failed')
+        logger.info(f"📈  Refreshed {len(batch)} of {len(due)} due tweets: {updated} changed, {len(errors)} failed")
+        return len(batch), updated
+
+    async def _refresh_forever(self):
+        while True:
+            try:
+                await self.refresh_once()
+            except Exception as e:
+                logger.error(f"Engagement refresh failed: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    async def _run(self):
+        while True:
+            try:
+                async with file_lock(TWEET_REFRESH_LOCK_PATH, timeout=0):
+                    logger.info(f"📈  Refreshing up to {self.batch_size} tracked tweets every {self.interval:.0f}s")
+                    await self._refresh_forever()
+            except TimeoutError:
+                await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if not self._task:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+engagement_refresher = EngagementRefresher()
+
+def start_engagement_refresher():
+    if TWEET_REFRESH_ENABLED:
+        engagement_refresher.start()
+
+async def stop_engagement_refresher():
+    await engagement_refresher.stop()
@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+import httpx
+from twikit.errors import (
+    AccountLocked,
+    AccountSuspended,
+    Forbidden,
+    NotFound,
+    RequestTimeout,
+    ServerError,
+    TooManyRequests,
+    TweetNotAvailable,
+    Unauthorized,
+    UserNotFound,
+    UserUnavailable,
+)
+
+AUTH = 'auth'
+RATE_LIMIT = 'rate_limit'
+NOT_FOUND = 'not_found'
+TRANSIENT = 'transient'
+CLIENT = 'client'
+
+def classify_error(error: BaseException) -> str:
+    """Bucket a twikit/httpx error by how the caller should react to it"""
+    if isinstance(error, TooManyRequests):
+        return RATE_LIMIT
+    if isinstance(error, (Unauthorized, Forbidden, AccountLocked, AccountSuspended)):
+        return AUTH
+    if isinstance(error, (NotFound, TweetNotAvailable, UserNotFound, UserUnavailable)):
+        return NOT_FOUND
+    if isinstance(error, (ServerError, RequestTimeout, httpx.TransportError, asyncio.TimeoutError, ConnectionError)):
+        return TRANSIENT
+    return CLIENT
+
+def rate_limit_retry_after(error: TooManyRequests, default: float = 60.0) -> float:
+    """Seconds until the rate limit window resets, from x-rate-limit-reset when present"""
+    reset = getattr(error, 'rate_limit_reset', None)
+    if not reset:
+        return default
+    return max(1.0, reset - time.time())
@@ -0,0 +1,267 @@
+import asyncio
+import json
+import os
+import tempfile
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from loguru import logger
+
+from app.services.system.file_lock import atomic_write_text, file_lock
+from app.services.system.metrics import MENTION_QUEUE_DEPTH, MENTIONS_PROCESSED
+from app.services.system.pacer import pace
+from app.services.system.supabase import get_supabase
+from app.services.twitter.client import twitter_client
+from app.services.twitter.reply_queue import ReplyCandidate, ReplyQueue, tweet_timestamp
+from app.services.twitter.tweet_service import get_processed_tweet_ids, mark_tweet_processed
+from app.utils.twitter import before_non_idempotent_call, handle_twitter_request
+from app.utils.twitter.normalizer import tweet_to_db_row
+
+MENTION_INGESTION_ENABLED = os.getenv("MENTION_INGESTION_ENABLED", "false").lower() == "true"
+MENTION_POLL_INTERVAL = float(os.getenv("MENTION_POLL_INTERVAL", "60"))  # seconds
+MENTION_POLL_MAX_PAGES = int(os.getenv("MENTION_POLL_MAX_PAGES", "3"))
+MENTION_WORKERS = int(os.getenv("MENTION_WORKERS", "2"))
+MENTION_QUEUE_SIZE = int(os.getenv("MENTION_QUEUE_SIZE", "500"))
+MENTION_MAX_ATTEMPTS = int(os.getenv("MENTION_MAX_ATTEMPTS", "3"))
+MENTION_STATE_PATH = os.getenv("MENTION_STATE_PATH", os.path.join(tempfile.gettempdir(), "comagency-mentions.json"))
+
+async def reply_to_mention(tweet_id: str) -> Any:
+    """Default handler: the reply-mention task"""
+    # Imported here: the task lives with the endpoints, which import this package
+    from app.api.endpoints.twitter.tasks.reply_mention import reply_mention
+    from app.models.schemas.tasks import HandleMentionRequest
+
+    return await reply_mention(HandleMentionRequest(tweet_id=tweet_id))
+
+class MentionInbox:
+    """
+    Polls mention notifications and feeds new mentions to a bounded pool of reply workers.
+
+    Mentions wait in a ReplyQueue, so when replies are scarce (`twitter.reply` budget) the
+    freshest, most engaging ones go first and mentions past the max age are recorded as
+    not replied to instead of costing an LLM call.
+
+    Polling reads from the newest mention down to the persisted high-water mark (the newest
+    mention id seen so far), so a quiet inbox costs one notifications call per interval.
+    Each mention is checked against the processed ledger (`tweets.is_processed`) and the
+    mentions already queued, so nothing is replied to twice. A mention is recorded as
+    processed right before its reply is posted, so a reply that fails while posting (it may
+    have gone out) is final. A mention whose reply fails earlier is picked up again by a
+    later poll, and after `max_attempts` failures it is recorded with is_no_reply.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str], Awaitable[Any]] = reply_to_mention,
+        workers: int = MENTION_WORKERS,
+        queue_size: int = MENTION_QUEUE_SIZE,
+        interval: float = MENTION_POLL_INTERVAL,
+        max_attempts: int = MENTION_MAX_ATTEMPTS,
+        state_path: str = MENTION_STATE_PATH
+    ):
+        self.handler = handler
+        self.workers = workers
+        self.queue_size = queue_size
+        self.interval = interval
+        self.max_attempts = max_attempts
+        self.state_path = state_path
+        self.queue: Optional[ReplyQueue] = None
+        self._expired_rows: List[Dict[str, Any]] = []
+        self.high_water_mark: Optional[str] = None
+        self._pending: Set[str] = set()
+        self._attempts: Counter = Counter()
+        self._tasks: List[asyncio.Task] = []
+
+    def _load_high_water_mark(self) -> Optional[str]:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as state_file:
+                return json.load(state_file).get('high_water_mark')
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"📥  Ignoring unreadable mention state {self.state_path}: {str(e)}")
+            return None
+
+    def _save_high_water_mark(self, tweet_id: str):
+        self.high_water_mark = tweet_id
+        atomic_write_text(self.state_path, json.dumps({'high_water_mark': tweet_id}))
+
+    async def _fetch_mentions(self) -> List[Any]:
+        """Mention tweets from the newest down to the high-water mark, newest first"""
+        high_water_mark = int(self.high_water_mark or 0)
+        page = None
+        mentions = []
+
+        async def get_mentions_page():
+            if page is None:
+                return await twitter_client.client.get_notifications('Mentions')
+            return await page.next()
+
+        for _ in range(MENTION_POLL_MAX_PAGES):
+            await pace('twitter.notifications')
+            page = await handle_twitter_request(get_mentions_page, method='get_notifications')
+            if not page:
+                break
+            tweets = [notification.tweet for notification in page if getattr(notification, 'tweet', None) is not None]
+            mentions.extend(tweets)
+            if any(int(tweet.id) <= high_water_mark for tweet in tweets) or not getattr(page, 'next_cursor', None):
+                break
+        return mentions
+
+    async def poll(self) -> int:
+        """One incremental poll; returns the number of mentions queued"""
+        await self._record_expired()
+        mentions = await self._fetch_mentions()
+        if not mentions:
+            return 0
+
+        own_username = (twitter_client.credentials.get('username') or '').lower()
+        candidates: Dict[str, Any] = {}
+        for tweet in mentions:
+            if tweet.id in self._pending or tweet.id in candidates:
+                continue
+            if own_username and tweet.user.screen_name.lower() == own_username:
+                continue
+            candidates[tweet.id] = tweet
+
+        processed = await get_processed_tweet_ids(get_supabase(), list(candidates))
+        fresh = sorted((tweet for tweet_id, tweet in candidates.items() if tweet_id not in processed), key=lambda tweet: int(tweet.id))
+
+        for tweet in fresh:
+            self._pending.add(tweet.id)
+            await self.queue.put(ReplyCandidate(
+                tweet_id=tweet.id,
+                payload=tweet_to_db_row(tweet),
+                likes=getattr(tweet, 'favorite_count', 0) or 0,
+                retweets=getattr(tweet, 'retweet_count', 0) or 0,
+                followers=getattr(tweet.user, 'followers_count', 0) or 0,
+                posted_at=tweet_timestamp(getattr(tweet, 'created_at', None), tweet.id)
+            ))
+        MENTION_QUEUE_DEPTH.set(self.queue.qsize())
+
+        newest_id = max((tweet.id for tweet in mentions), key=int)
+        if int(newest_id) > int(self.high_water_mark or 0):
+            self._save_high_water_mark(newest_id)
+
+        if fresh:
+            logger.info(f"📥  Queued {len(fresh)} new mentions (high-water mark {self.high_water_mark})")
+        return len(fresh)
+
+    async def _process(self, tweet_row: Dict[str, Any]):
+        tweet_id = tweet_row['id']
+        post_started = False
+
+        async def record_before_posting():
+            # A reply that times out may still have been posted: record the mention first,
+            # so neither a retry nor a later poll can post a second reply
+            nonlocal post_started
+            await mark_tweet_processed(get_supabase(), tweet_row)
+            post_started = True
+
+        try:
+            with before_non_idempotent_call(record_before_posting):
+                reply = await self.handler(tweet_id)
+        except Exception as e:
+            if post_started:
+                MENTIONS_PROCESSED.inc(outcome='failed')
+                logger.error(f"Reply to mention {tweet_id} failed while posting and is not retried; it may have been posted: {str(e)}")
+                self._attempts.pop(tweet_id, None)
+                self._pending.discard(tweet_id)
+                return
+            self._attempts[tweet_id] += 1
+            if self._attempts[tweet_id] < self.max_attempts:
+                MENTIONS_PROCESSED.inc(outcome='retry')
+                logger.warning(f"📥  Reply to mention {tweet_id} failed (attempt {self._attempts[tweet_id]}): {str(e)}")
+                self._pending.discard(tweet_id)
+                return
+            MENTIONS_PROCESSED.inc(outcome='failed')
+            logger.error(f"Giving up on mention {tweet_id} after {self._attempts[tweet_id]} attempts: {str(e)}")
+            reply = None
+
+        try:
+            await mark_tweet_processed(get_supabase(), tweet_row, reply_id=getattr(reply, 'id', None), is_no_reply=reply is None)
+        except Exception as e:
+            # Stays pending in this process so it is not replied to again
+            logger.error(f"Error recording mention {tweet_id} as processed: {str(e)}")
+            return
+
+        if reply is not None:
+            MENTIONS_PROCESSED.inc(outcome='replied')
+            logger.info(f"📥  Replied to mention {tweet_id} with {reply.id}")
+        self._attempts.pop(tweet_id, None)
+        self._pending.discard(tweet_id)
+
+    def _on_drop(self, candidate: ReplyCandidate, reason: str):
+        if reason == 'expired':
+            # Recorded as not replied to, so later polls do not bring it back
+            self._expired_rows.append(candidate.payload)
+        else:
+            self._pending.discard(candidate.tweet_id)
+
+    async def _record_expired(self):
+        expired, self._expired_rows = self._expired_rows, []
+        for tweet_row in expired:
+            try:
+                await mark_tweet_processed(get_supabase(), tweet_row, is_no_reply=True)
+                self._pending.discard(tweet_row['id'])
+            except Exception as e:
+                # Stays pending in this process; it would only expire again
+                logger.error(f"Error recording expired mention {tweet_row['id']}: {str(e)}")
+        if expired:
+            logger.info(f"📥  Skipped {len(expired)} mentions older than the reply max age")
+
+    async def _work(self):
+        while True:
+            # Take reply capacity first, then spend it on the best mention waiting at that point
+            await pace('twitter.reply')
+            candidate = await self.queue.get()
+            MENTION_QUEUE_DEPTH.set(self.queue.qsize())
+            await self._process(candidate.payload)
+
+    async def _poll_forever(self):
+        while True:
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.error(f"Mention poll failed: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    async def _run(self):
+        # One worker per host ingests; the others retry the lock and take over on exit
+        while True:
+            try:
+                async with file_lock(f"{self.state_path}.lock", timeout=0):
+                    self.high_water_mark = self._load_high_water_mark()
+                    logger.info(f"📥  Ingesting mentions every {self.interval:.0f}s with {self.workers} reply workers")
+                    # Workers only run next to the poller: each one holds a `twitter.reply`
+                    # token while it waits, so idle processes must not start any
+                    workers = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+                    try:
+                        await self._poll_forever()
+                    finally:
+                        for worker in workers:
+                            worker.cancel()
+                        await asyncio.gather(*workers, return_exceptions=True)
+            except TimeoutError:
+                await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._tasks:
+            return
+        self.queue = ReplyQueue(maxsize=self.queue_size, on_drop=self._on_drop)
+        self._tasks = [asyncio.create_task(self._run())]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+mention_inbox = MentionInbox()
+
+def start_mention_ingestion():
+    if MENTION_INGESTION_ENABLED:
+        mention_inbox.start()
+
+async def stop_mention_ingestion():
+    await mention_inbox.stop()
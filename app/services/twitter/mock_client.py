@@ -0,0 +1,389 @@
+import asyncio
+import json
+import os
+import random
+import re
+import time
+from collections import Counter, defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from twikit.errors import NotFound, ServerError, TooManyRequests
+
+MOCKS_DIR = os.path.join(os.path.dirname(__file__), "../../mocks")
+DEFAULT_CORPUS_PATH = os.path.join(MOCKS_DIR, "tweets.mock.json")
+SYNTHETIC_TWEET_ID = 1880000000000000000
+TWITTER_DATE_FORMAT = "%a %b %d %H:%M:%S +0000 %Y"
+WORDS = (
+    "agents", "inference", "latency", "model", "tokens", "context", "memory", "retrieval",
+    "benchmark", "training", "weights", "eval", "pipeline", "GPU", "open-source", "reasoning",
+)
+
+class MockUser:
+    def __init__(
+        self,
+        user_id: str,
+        name: str,
+        screen_name: str,
+        followers_count: int = 0,
+        profile_image_url: Optional[str] = None
+    ):
+        self.id = user_id
+        self.name = name
+        self.screen_name = screen_name
+        self.followers_count = followers_count
+        self.profile_image_url = profile_image_url or f"https://pbs.twimg.com/profile_images/{user_id}/avatar_normal.jpg"
+
+class MockTweet:
+    def __init__(
+        self,
+        tweet_id: str,
+        user: MockUser,
+        text: str,
+        created_at: str,
+        retweet_count: int = 0,
+        favorite_count: int = 0,
+        lang: str = "en",
+        media: Optional[List[Dict[str, Any]]] = None,
+        in_reply_to: Optional[str] = None
+    ):
+        self.id = tweet_id
+        self.user = user
+        self.text = text
+        self.full_text = text
+        self.created_at = created_at
+        self.lang = lang
+        self.retweet_count = retweet_count
+        self.favorite_count = favorite_count
+        self.reply_count = 0
+        self.media = media or []
+        self.in_reply_to = in_reply_to
+        self.favorited = False
+        self.replies: Optional["MockResult"] = None
+
+class MockNotification:
+    """twikit.Notification look-alike for a mention"""
+
+    def __init__(self, notification_id: str, tweet: MockTweet, timestamp_ms: int):
+        self.id = notification_id
+        self.tweet = tweet
+        self.from_user = tweet.user
+        self.timestamp_ms = timestamp_ms
+        self.message = f"{tweet.user.name} mentioned you"
+
+class MockResult:
+    """twikit.utils.Result look-alike: an iterable page with an async next() and a cursor"""
+
+    def __init__(self, results: List[Any], fetch_next: Optional[Callable] = None, next_cursor: Optional[str] = None):
+        self._results = results
+        self._fetch_next = fetch_next
+        self.next_cursor = next_cursor
+
+    async def next(self) -> "MockResult":
+        if self._fetch_next is None:
+            return MockResult([])
+        return await self._fetch_next()
+
+    def __iter__(self):
+        return iter(self._results)
+
+    def __getitem__(self, index):
+        return self._results[index]
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        return repr(self._results)
+
+class MockTwitterClient:
+    """
+    Drop-in replacement for twikit.Client used when USE_TWITTER_MOCKS is enabled.
+
+    Tweets come from the fixture corpus in app/mocks, followed by synthetic tweets so that
+    pagination never runs dry before `max_pages`. Reply trees are served from the corpus
+    (or synthesized for generated tweets). Every upstream method sleeps for `latency`
+    plus up to `jitter`, is counted in `calls`, and can fail with TooManyRequests either
+    once a method exceeds `rate_limit` calls per `rate_window` seconds or at random with
+    probability `error_rate`, and with ServerError at random with probability
+    `server_error_rate`.
+    """
+
+    def __init__(
+        self,
+        corpus_path: Optional[str] = DEFAULT_CORPUS_PATH,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: Optional[int] = None,
+        rate_window: float = 900.0,
+        error_rate: float = 0.0,
+        server_error_rate: float = 0.0,
+        page_size: int = 20,
+        max_pages: int = 50,
+        replies_per_tweet: int = 5,
+        seed: int = 1
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.error_rate = error_rate
+        self.server_error_rate = server_error_rate
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.replies_per_tweet = replies_per_tweet
+        self.calls: Counter = Counter()
+        self._call_times: Dict[str, Deque[float]] = defaultdict(deque)
+        self._random = random.Random(seed)
+        self._next_id = SYNTHETIC_TWEET_ID
+        self._tweets: Dict[str, MockTweet] = {}
+        self._children: Dict[str, List[str]] = defaultdict(list)
+        self._users: List[MockUser] = []
+        self._corpus_ids: List[str] = []
+        self._mentions: List[MockNotification] = []
+        self.me = MockUser("1", "Comagency", os.getenv("TWITTER_USERNAME") or "comagency_bot")
+
+        if corpus_path and os.path.exists(corpus_path):
+            self._load_corpus(corpus_path)
+        if not self._users:
+            self._users = [
+                MockUser(str(10_000 + i), f"User {i}", f"user_{i}", self._random.randint(10, 500_000))
+                for i in range(200)
+            ]
+
+    @classmethod
+    def from_env(cls) -> "MockTwitterClient":
+        rate_limit = os.getenv("TWITTER_MOCK_RATE_LIMIT")
+        return cls(
+            corpus_path=os.getenv("TWITTER_MOCK_CORPUS", DEFAULT_CORPUS_PATH),
+            latency=float(os.getenv("TWITTER_MOCK_LATENCY_MS", "0")) / 1000,
+            jitter=float(os.getenv("TWITTER_MOCK_JITTER_MS", "0")) / 1000,
+            rate_limit=int(rate_limit) if rate_limit else None,
+            rate_window=float(os.getenv("TWITTER_MOCK_RATE_WINDOW", "900")),
+            error_rate=float(os.getenv("TWITTER_MOCK_ERROR_RATE", "0")),
+            server_error_rate=float(os.getenv("TWITTER_MOCK_SERVER_ERROR_RATE", "0")),
+            page_size=int(os.getenv("TWITTER_MOCK_PAGE_SIZE", "20")),
+        )
+
+    def _load_corpus(self, path: str):
+        with open(path, encoding="utf-8") as corpus_file:
+            corpus = json.load(corpus_file)
+
+        users = {
+            item["id"]: MockUser(
+                item["id"], item["name"], item["screen_name"],
+                item.get("followers_count", 0), item.get("profile_image_url")
+            )
+            for item in corpus.get("users", [])
+        }
+        self._users = list(users.values())
+
+        for item in corpus.get("tweets", []):
+            tweet = MockTweet(
+                tweet_id=item["id"],
+                user=users[item["user_id"]],
+                text=item["text"],
+                created_at=item["created_at"],
+                retweet_count=item.get("retweet_count", 0),
+                favorite_count=item.get("favorite_count", 0),
+                lang=item.get("lang", "en"),
+                media=item.get("media"),
+                in_reply_to=item.get("in_reply_to")
+            )
+            self._add(tweet)
+            self._corpus_ids.append(tweet.id)
+
+    def _add(self, tweet: MockTweet):
+        self._tweets[tweet.id] = tweet
+        if tweet.in_reply_to:
+            self._children[tweet.in_reply_to].append(tweet.id)
+            parent = self._tweets.get(tweet.in_reply_to)
+            if parent:
+                parent.reply_count += 1
+                parent.replies = None
+
+    async def _upstream(self, method: str):
+        self.calls[method] += 1
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise TooManyRequests(f"Injected rate limit for {method}", headers={'x-rate-limit-reset': str(int(time.time()) + 60)})
+        if self.server_error_rate and self._random.random() < self.server_error_rate:
+            raise ServerError(f"Injected server error for {method}")
+        if self.rate_limit is not None:
+            now = time.monotonic()
+            window = self._call_times[method]
+            while window and now - window[0] > self.rate_window:
+                window.popleft()
+            if len(window) >= self.rate_limit:
+                reset = int(time.time() + self.rate_window - (now - window[0]))
+                raise TooManyRequests(f"Rate limit exceeded for {method}", headers={'x-rate-limit-reset': str(reset)})
+            window.append(now)
+        delay = self.latency + (self._random.random() * self.jitter if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _new_tweet(
+        self,
+        text: Optional[str] = None,
+        in_reply_to: Optional[str] = None,
+        user: Optional[MockUser] = None
+    ) -> MockTweet:
+        self._next_id += 1
+        tweet_id = str(self._next_id)
+        has_photo = self._random.random() < 0.2
+        created_at = datetime.now(timezone.utc) - timedelta(minutes=self._random.randint(0, 1440))
+        tweet = MockTweet(
+            tweet_id=tweet_id,
+            user=user or self._random.choice(self._users),
+            text=text or " ".join(self._random.choice(WORDS) for _ in range(self._random.randint(8, 30))),
+            created_at=created_at.strftime(TWITTER_DATE_FORMAT),
+            retweet_count=self._random.randint(0, 500),
+            favorite_count=self._random.randint(0, 5000),
+            media=[{
+                'type': 'photo',
+                'media_url_https': f"https://pbs.twimg.com/media/{tweet_id}.jpg",
+                'ext_media_availability': {'status': 'Available'}
+            }] if has_photo else [],
+            in_reply_to=in_reply_to
+        )
+        self._add(tweet)
+        return tweet
+
+    def _page(self, method: str, source: List[str], make_tweet: Callable[[], MockTweet], page: int) -> MockResult:
+        start = page * self.page_size
+        tweets = [self._tweets[tweet_id] for tweet_id in source[start:start + self.page_size]]
+        while len(tweets) < self.page_size:
+            tweets.append(make_tweet())
+        has_next = page + 1 < self.max_pages
+
+        async def fetch_next():
+            await self._upstream(method)
+            return self._page(method, source, make_tweet, page + 1)
+
+        return MockResult(tweets, fetch_next if has_next else None, f"{method}:{page + 1}" if has_next else None)
+
+    def _replies(self, tweet: MockTweet) -> MockResult:
+        if not self._children.get(tweet.id) and tweet.id not in self._corpus_ids:
+            for _ in range(self.replies_per_tweet):
+                self._new_tweet(in_reply_to=tweet.id)
+        children = [self._tweets[child_id] for child_id in self._children.get(tweet.id, [])]
+        tweet.reply_count = len(children)
+        return MockResult(children)
+
+    def _search_source(self, query: str) -> List[str]:
+        phrases = [phrase.lower() for phrase in re.findall(r'"([^"]+)"', query)]
+        if not phrases:
+            phrases = [
+                term.lower() for term in query.split()
+                if ':' not in term and not term.startswith('-')
+            ]
+        matches = [
+            self._tweets[tweet_id] for tweet_id in self._corpus_ids
+            if any(phrase in self._tweets[tweet_id].text.lower() for phrase in phrases)
+        ]
+        if '-filter:replies' in query:
+            matches = [tweet for tweet in matches if not tweet.in_reply_to]
+        return [tweet.id for tweet in matches]
+
+    @staticmethod
+    def _cursor_page(cursor: Optional[str]) -> int:
+        if not cursor:
+            return 0
+        _, _, page = cursor.rpartition(':')
+        return int(page) if page.isdigit() else 0
+
+    def seed_tweet(self, in_reply_to: Optional[str] = None) -> MockTweet:
+        """Create a tweet (optionally a reply) without counting an upstream call"""
+        return self._new_tweet(in_reply_to=in_reply_to)
+
+    def seed_mention(self, in_reply_to: Optional[str] = None) -> MockTweet:
+        """Create a tweet mentioning the account and its notification, without an upstream call"""
+        tweet = self._new_tweet(
+            text=f"@{self.me.screen_name} {' '.join(self._random.choice(WORDS) for _ in range(10))}?",
+            in_reply_to=in_reply_to
+        )
+        self._mentions.append(MockNotification(f"mention-{tweet.id}", tweet, int(time.time() * 1000)))
+        return tweet
+
+    # twikit.Client surface used by the app
+
+    async def search_tweet(self, query: str, product: str = 'Top', count: int = 20, cursor: Optional[str] = None):
+        await self._upstream('search_tweet')
+        phrase = (re.findall(r'"([^"]+)"', query) or [query.split()[0] if query.split() else ''])[0]
+        make_tweet = lambda: self._new_tweet(text=f"{phrase} {' '.join(self._random.choice(WORDS) for _ in range(12))}")
+        return self._page('search_tweet', self._search_source(query), make_tweet, self._cursor_page(cursor))
+
+    async def get_timeline(self, count: int = 20, seen_tweet_ids=None, cursor: Optional[str] = None):
+        await self._upstream('get_timeline')
+        return self._page('get_timeline', self._corpus_ids, self._new_tweet, self._cursor_page(cursor))
+
+    async def get_latest_timeline(self, count: int = 20, seen_tweet_ids=None, cursor: Optional[str] = None):
+        await self._upstream('get_latest_timeline')
+        return self._page('get_latest_timeline', list(reversed(self._corpus_ids)), self._new_tweet, self._cursor_page(cursor))
+
+    async def get_tweet_by_id(self, tweet_id: str, cursor: Optional[str] = None):
+        await self._upstream('get_tweet_by_id')
+        tweet = self._tweets.get(str(tweet_id))
+        if tweet is None:
+            raise NotFound(f"Tweet {tweet_id} not found")
+        if tweet.replies is None:
+            tweet.replies = self._replies(tweet)
+        return tweet
+
+    async def get_tweets_by_ids(self, ids: List[str]):
+        await self._upstream('get_tweets_by_ids')
+        return [self._tweets.get(str(tweet_id)) for tweet_id in ids]
+
+    async def get_notifications(self, type: str, count: int = 40, cursor: Optional[str] = None):
+        await self._upstream('get_notifications')
+        notifications = list(reversed(self._mentions)) if type in ('All', 'Mentions') else []
+        page = self._cursor_page(cursor)
+
+        def make_page(page: int) -> MockResult:
+            results = notifications[page * count:(page + 1) * count]
+            has_next = (page + 1) * count < len(notifications)
+
+            async def fetch_next():
+                await self._upstream('get_notifications')
+                return make_page(page + 1)
+
+            return MockResult(results, fetch_next if has_next else None, f"get_notifications:{page + 1}" if has_next else None)
+
+        return make_page(page)
+
+    async def create_tweet(self, text: str = '', media_ids=None, poll_uri=None, reply_to: Optional[str] = None, **kwargs):
+        await self._upstream('create_tweet')
+        if reply_to and str(reply_to) not in self._tweets:
+            raise NotFound(f"Tweet {reply_to} not found")
+        tweet = self._new_tweet(text=text, in_reply_to=str(reply_to) if reply_to else None, user=self.me)
+        tweet.retweet_count = tweet.favorite_count = 0
+        tweet.media = []
+        return tweet
+
+    async def favorite_tweet(self, tweet_id: str):
+        await self._upstream('favorite_tweet')
+        tweet = self._tweets.get(str(tweet_id))
+        if tweet is None:
+            raise NotFound(f"Tweet {tweet_id} not found")
+        tweet.favorited = True
+
+    async def unfavorite_tweet(self, tweet_id: str):
+        await self._upstream('unfavorite_tweet')
+        tweet = self._tweets.get(str(tweet_id))
+        if tweet is None:
+            raise NotFound(f"Tweet {tweet_id} not found")
+        tweet.favorited = False
+
+    async def login(self, **kwargs):
+        await self._upstream('login')
+
+    def get_cookies(self) -> dict:
+        return {}
+
+    def set_cookies(self, cookies: dict, clear_cookies: bool = False):
+        pass
+
+    def load_cookies(self, path: str):
+        pass
+
+    def save_cookies(self, path: str):
+        pass
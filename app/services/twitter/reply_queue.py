@@ -0,0 +1,166 @@
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+from app.services.system.metrics import REPLY_QUEUE_DROPPED
+
+REPLY_DECAY_SECONDS = float(os.getenv("REPLY_DECAY_SECONDS", "3600"))
+REPLY_AGING_RATE = float(os.getenv("REPLY_AGING_RATE", "0.5"))  # points per (wait / decay) squared
+REPLY_REKEY_INTERVAL = float(os.getenv("REPLY_REKEY_INTERVAL", "60"))  # seconds between aging re-keys
+REPLY_MAX_AGE = float(os.getenv("REPLY_MAX_AGE", str(24 * 3600)))  # seconds since the tweet was posted
+REPLY_QUEUE_SIZE = int(os.getenv("REPLY_QUEUE_SIZE", "500"))
+REPLY_VELOCITY_WEIGHT = float(os.getenv("REPLY_VELOCITY_WEIGHT", "1"))
+
+TWITTER_DATE_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+TWITTER_EPOCH_MS = 1288834974657
+
+def tweet_timestamp(created_at: Any, tweet_id: Any = None) -> float:
+    """Posting time as epoch seconds, from Twitter's created_at or else the snowflake id"""
+    if isinstance(created_at, datetime):
+        return created_at.timestamp()
+    if created_at:
+        try:
+            return datetime.strptime(str(created_at), TWITTER_DATE_FORMAT).timestamp()
+        except ValueError:
+            pass
+    try:
+        return ((int(tweet_id) >> 22) + TWITTER_EPOCH_MS) / 1000
+    except (TypeError, ValueError):
+        return time.time()
+
+def engagement_score(likes: int, retweets: int, followers: int = 0) -> float:
+    """log of weighted engagement: a tweet needs e times the engagement to gain one point"""
+    return math.log1p(max(0, likes) + 2 * max(0, retweets) + max(0, followers) / 1000)
+
+def reply_priority(
+    likes: int,
+    retweets: int,
+    followers: int,
+    posted_at: float,
+    now: Optional[float] = None,
+    likes_per_hour: float = 0.0
+) -> float:
+    """Engagement, plus log likes-per-hour growth when known, minus one point per REPLY_DECAY_SECONDS of tweet age"""
+    age = (now or time.time()) - posted_at
+    velocity = REPLY_VELOCITY_WEIGHT * math.log1p(max(0.0, likes_per_hour))
+    return engagement_score(likes, retweets, followers) + velocity - age / REPLY_DECAY_SECONDS
+
+@dataclass
+class ReplyCandidate:
+    tweet_id: str
+    payload: Any
+    likes: int = 0
+    retweets: int = 0
+    followers: int = 0
+    posted_at: float = field(default_factory=time.time)
+    enqueued_at: float = 0.0
+
+class ReplyQueue:
+    """
+    Bounded priority queue of reply work.
+
+    The priority of a waiting item at time t is
+
+        engagement - (t - posted_at) / decay + aging * ((t - enqueued_at) / decay) ** 2
+
+    Fresh, high-engagement tweets come first. The wait bonus grows quadratically, so the gap
+    between a long-waiting item and a newer arrival keeps shrinking and the older item
+    eventually overtakes any arrival with bounded engagement: waiting items are not starved.
+    (A linear bonus would only slow the decay and never change the order.) The -t/decay
+    term is the same for every item and is left out of the heap keys; the wait bonus does
+    change the order, so the heap is re-keyed at most every `rekey_interval` seconds. Items
+    older than `max_age` are dropped instead of returned, and when the queue is full the
+    lowest-priority item is evicted.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = REPLY_QUEUE_SIZE,
+        decay: float = REPLY_DECAY_SECONDS,
+        aging: float = REPLY_AGING_RATE,
+        max_age: float = REPLY_MAX_AGE,
+        rekey_interval: float = REPLY_REKEY_INTERVAL,
+        on_drop: Optional[Callable[[ReplyCandidate, str], None]] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        self.maxsize = maxsize
+        self.decay = decay
+        self.aging = aging
+        self.max_age = max_age
+        self.rekey_interval = rekey_interval
+        self.on_drop = on_drop
+        self.clock = clock
+        self._origin = clock()
+        self._keyed_at = self._origin
+        self._heap: List[Tuple[float, int, ReplyCandidate]] = []
+        self._counter = itertools.count()
+        self._changed = asyncio.Condition()
+
+    def _key(self, candidate: ReplyCandidate, now: float) -> float:
+        # Negated for the min-heap; times relative to the queue's creation keep floats small
+        wait = max(0.0, now - candidate.enqueued_at) / self.decay
+        return -(
+            engagement_score(candidate.likes, candidate.retweets, candidate.followers)
+            + (candidate.posted_at - self._origin) / self.decay
+            + self.aging * wait * wait
+        )
+
+    def _rekey(self, now: float):
+        """Recompute the wait bonus of every item; between re-keys waiting items age late by
+        at most `rekey_interval`"""
+        if now - self._keyed_at < self.rekey_interval:
+            return
+        self._heap = [(self._key(candidate, now), order, candidate) for _, order, candidate in self._heap]
+        heapq.heapify(self._heap)
+        self._keyed_at = now
+
+    def _is_expired(self, candidate: ReplyCandidate) -> bool:
+        return self.clock() - candidate.posted_at > self.max_age
+
+    def _drop(self, candidate: ReplyCandidate, reason: str):
+        REPLY_QUEUE_DROPPED.inc(reason=reason)
+        if self.on_drop:
+            self.on_drop(candidate, reason)
+
+    async def put(self, candidate: ReplyCandidate) -> bool:
+        """Queue a candidate; returns False when it was dropped (too old, or the lowest when full)"""
+        if self._is_expired(candidate):
+            self._drop(candidate, 'expired')
+            return False
+
+        now = candidate.enqueued_at = self.clock()
+        async with self._changed:
+            self._rekey(now)
+            heapq.heappush(self._heap, (self._key(candidate, now), next(self._counter), candidate))
+            if len(self._heap) > self.maxsize:
+                worst = max(range(len(self._heap)), key=lambda index: self._heap[index][:2])
+                _, _, evicted = self._heap[worst]
+                self._heap[worst] = self._heap[-1]
+                self._heap.pop()
+                heapq.heapify(self._heap)
+                self._drop(evicted, 'evicted')
+                if evicted is candidate:
+                    return False
+            self._changed.notify()
+        return True
+
+    async def get(self) -> ReplyCandidate:
+        """Wait for the highest-priority candidate that is still worth handling"""
+        async with self._changed:
+            while True:
+                await self._changed.wait_for(lambda: self._heap)
+                self._rekey(self.clock())
+                _, _, candidate = heapq.heappop(self._heap)
+                if self._is_expired(candidate):
+                    self._drop(candidate, 'expired')
+                    continue
+                return candidate
+
+    def qsize(self) -> int:
+        return len(self._heap)
@@ -0,0 +1,191 @@
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncContextManager, Dict, Iterator, Optional
+
+from loguru import logger
+
+from app.services.system.file_lock import atomic_write_text, file_lock
+
+TWITTER_SESSION_BACKEND = os.getenv("TWITTER_SESSION_BACKEND", "file")
+TWITTER_COOKIES_PATH = os.getenv("TWITTER_COOKIES_PATH", "cookies.json")
+TWITTER_SESSION_DB_PATH = os.getenv("TWITTER_SESSION_DB_PATH", "twitter_session.sqlite3")
+TWITTER_SESSION_HISTORY = int(os.getenv("TWITTER_SESSION_HISTORY", "5"))
+
+@dataclass(frozen=True)
+class SessionRecord:
+    cookies: Dict[str, str]
+    version: int
+    saved_at: float
+
+class SessionStore(ABC):
+    """Persisted twikit session (cookies) shared by all workers on the host.
+
+    Every save gets the next version number. Once a session has been verified against
+    Twitter it is marked good and kept as a backup, so a corrupted or expired current
+    session falls back to the last good one before paying for a full login.
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[SessionRecord]:
+        ...
+
+    @abstractmethod
+    def load_good(self) -> Optional[SessionRecord]:
+        ...
+
+    @abstractmethod
+    def save(self, cookies: Dict[str, str]) -> SessionRecord:
+        ...
+
+    @abstractmethod
+    def mark_good(self, record: SessionRecord) -> None:
+        ...
+
+    @abstractmethod
+    def lock(self) -> AsyncContextManager[None]:
+        """Exclusive cross-process lock held while logging in and saving"""
+        ...
+
+class FileSessionStore(SessionStore):
+    """`cookies.json` plus a `.good` backup, each replaced atomically.
+
+    Plain twikit cookie files (from `Client.save_cookies`) are read as version 0.
+    """
+
+    def __init__(self, path: str = TWITTER_COOKIES_PATH):
+        self.path = path
+        self.good_path = f"{path}.good"
+        self.lock_path = f"{path}.lock"
+
+    @staticmethod
+    def _read(path: str) -> Optional[SessionRecord]:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as session_file:
+                data = json.load(session_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"🍪  Ignoring unreadable session file {path}: {str(e)}")
+            return None
+        if not isinstance(data, dict):
+            logger.warning(f"🍪  Ignoring malformed session file {path}")
+            return None
+        if isinstance(data.get('cookies'), dict):
+            return SessionRecord(data['cookies'], int(data.get('version', 0)), float(data.get('saved_at', 0)))
+        return SessionRecord(data, 0, os.path.getmtime(path))
+
+    @staticmethod
+    def _write(path: str, record: SessionRecord) -> None:
+        atomic_write_text(path, json.dumps({
+            'version': record.version,
+            'saved_at': record.saved_at,
+            'cookies': record.cookies,
+        }))
+
+    def load(self) -> Optional[SessionRecord]:
+        return self._read(self.path)
+
+    def load_good(self) -> Optional[SessionRecord]:
+        return self._read(self.good_path)
+
+    def save(self, cookies: Dict[str, str]) -> SessionRecord:
+        versions = [record.version for record in (self.load(), self.load_good()) if record]
+        record = SessionRecord(dict(cookies), max(versions, default=0) + 1, time.time())
+        self._write(self.path, record)
+        return record
+
+    def mark_good(self, record: SessionRecord) -> None:
+        good = self.load_good()
+        if good and good.version >= record.version and good.cookies == record.cookies:
+            return
+        self._write(self.good_path, record)
+
+    def lock(self) -> AsyncContextManager[None]:
+        return file_lock(self.lock_path)
+
+class SqliteSessionStore(SessionStore):
+    """Session history in SQLite, newest row current; keeps the last `history` versions"""
+
+    def __init__(self, path: str = TWITTER_SESSION_DB_PATH, history: int = TWITTER_SESSION_HISTORY):
+        self.path = path
+        self.history = history
+        self.lock_path = f"{path}.lock"
+        with self._transaction() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS twitter_sessions ("
+                "version INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "cookies TEXT NOT NULL, "
+                "saved_at REAL NOT NULL, "
+                "is_good INTEGER NOT NULL DEFAULT 0)"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    @staticmethod
+    def _record(row) -> Optional[SessionRecord]:
+        if not row:
+            return None
+        try:
+            return SessionRecord(json.loads(row[1]), row[0], row[2])
+        except ValueError as e:
+            logger.warning(f"🍪  Ignoring unreadable session version {row[0]}: {str(e)}")
+            return None
+
+    def load(self) -> Optional[SessionRecord]:
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT version, cookies, saved_at FROM twitter_sessions ORDER BY version DESC LIMIT 1"
+            ).fetchone()
+        return self._record(row)
+
+    def load_good(self) -> Optional[SessionRecord]:
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT version, cookies, saved_at FROM twitter_sessions WHERE is_good = 1 "
+                "ORDER BY version DESC LIMIT 1"
+            ).fetchone()
+        return self._record(row)
+
+    def save(self, cookies: Dict[str, str]) -> SessionRecord:
+        saved_at = time.time()
+        with self._transaction() as db:
+            cursor = db.execute(
+                "INSERT INTO twitter_sessions (cookies, saved_at) VALUES (?, ?)",
+                (json.dumps(cookies), saved_at)
+            )
+            version = cursor.lastrowid
+            # Keep recent history, and always the newest good version
+            db.execute(
+                "DELETE FROM twitter_sessions WHERE version <= ? AND version NOT IN "
+                "(SELECT COALESCE(MAX(version), -1) FROM twitter_sessions WHERE is_good = 1)",
+                (version - self.history,)
+            )
+        return SessionRecord(dict(cookies), version, saved_at)
+
+    def mark_good(self, record: SessionRecord) -> None:
+        with self._transaction() as db:
+            db.execute("UPDATE twitter_sessions SET is_good = 1 WHERE version = ?", (record.version,))
+
+    def lock(self) -> AsyncContextManager[None]:
+        return file_lock(self.lock_path)
+
+@lru_cache()
+def get_session_store() -> SessionStore:
+    if TWITTER_SESSION_BACKEND == 'sqlite':
+        return SqliteSessionStore()
+    if TWITTER_SESSION_BACKEND == 'file':
+        return FileSessionStore()
+    raise ValueError(f"Unknown TWITTER_SESSION_BACKEND: {TWITTER_SESSION_BACKEND}")
@@ -0,0 +1,71 @@
+import os
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from loguru import logger
+
+from app.models.schemas.search import TimelineParams
+from app.services.system.pacer import pace
+from app.services.twitter.client import twitter_client
+from app.utils.twitter import handle_twitter_request
+from app.utils.twitter.normalizer import TweetRecord, tweets_to_records
+
+TIMELINE_MAX_PAGES = int(os.getenv("TIMELINE_MAX_PAGES", "20"))
+
+# Timeline name -> twikit.Client method
+TIMELINES = {
+    'for_you': 'get_timeline',
+    'latest': 'get_latest_timeline',
+}
+
+async def timeline_pages(timeline: str, cursor: Optional[str] = None, max_pages: int = TIMELINE_MAX_PAGES) -> AsyncIterator[Any]:
+    """
+    Pages of a home timeline from `cursor` on, newest first, each paced through
+    `twitter.timeline`, until the timeline ends or `max_pages` were fetched.
+
+    Every page is requested from the current client by cursor, so pages after a
+    re-authentication use the new session.
+    """
+    method = TIMELINES[timeline]
+
+    async def get_timeline_page():
+        return await getattr(twitter_client.client, method)(cursor=cursor)
+
+    for _ in range(max_pages):
+        await pace('twitter.timeline')
+        page = await handle_twitter_request(get_timeline_page, method=method)
+        if not page:
+            return
+        yield page
+        cursor = getattr(page, 'next_cursor', None)
+        if not cursor:
+            return
+
+async def collect_timeline_records(timeline: str, params: TimelineParams) -> Tuple[List[TweetRecord], Optional[str]]:
+    """
+    Follow a home timeline's cursors, one paced page at a time, until `minimum_tweets`
+    distinct tweets are collected.
+
+    Whole pages are kept (so more than `minimum_tweets` may come back) and the returned
+    cursor points right after the last page, so passing it back as `params.cursor`
+    continues without gaps or re-fetching.
+
+    Returns:
+        (records, next_cursor); next_cursor is None when the timeline is exhausted
+    """
+    next_cursor = params.cursor
+    seen_ids = set()
+    tweets = []
+
+    async for page in timeline_pages(timeline, params.cursor):
+        # Timelines repeat tweets across pages
+        for tweet in page:
+            if tweet.id not in seen_ids:
+                seen_ids.add(tweet.id)
+                tweets.append(tweet)
+
+        next_cursor = getattr(page, 'next_cursor', None)
+        if len(tweets) >= params.minimum_tweets:
+            break
+
+    logger.info(f"📜  Collected {len(tweets)} tweets from the {timeline} timeline")
+    return tweets_to_records(tweets), next_cursor
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from loguru import logger
+
+from app.models.schemas.search import TweetData
+from app.services.system.file_lock import file_lock
+from app.services.twitter.timeline import timeline_pages
+from app.services.twitter.tweet_service import queue_tweet_records
+from app.utils.twitter.normalizer import TweetRecord, records_to_tweet_data, tweets_to_records
+
+TIMELINE_FOLLOWER_ENABLED = os.getenv("TIMELINE_FOLLOWER_ENABLED", "false").lower() == "true"
+TIMELINE_FOLLOWER_TIMELINES = [
+    name.strip() for name in os.getenv("TIMELINE_FOLLOWER_TIMELINES", "latest,for_you").split(",") if name.strip()
+]
+TIMELINE_POLL_INTERVAL = float(os.getenv("TIMELINE_POLL_INTERVAL", "60"))  # seconds
+TIMELINE_POLL_MAX_PAGES = int(os.getenv("TIMELINE_POLL_MAX_PAGES", "3"))
+TIMELINE_BUFFER_SIZE = int(os.getenv("TIMELINE_BUFFER_SIZE", "1000"))
+TIMELINE_FOLLOWER_SAVE = os.getenv("TIMELINE_FOLLOWER_SAVE", "false").lower() == "true"
+TIMELINE_STATE_PATH = os.getenv("TIMELINE_STATE_PATH", os.path.join(tempfile.gettempdir(), "comagency-timelines.sqlite3"))
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS timeline_entries ("
+    "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "timeline TEXT NOT NULL, "
+    "tweet_id TEXT NOT NULL, "
+    "data TEXT NOT NULL, "
+    "UNIQUE (timeline, tweet_id))",
+    "CREATE TABLE IF NOT EXISTS timeline_state ("
+    "timeline TEXT PRIMARY KEY, "
+    "newest_id TEXT, "
+    "polled_at REAL NOT NULL)",
+)
+
+class TimelineBuffer:
+    """Ring buffer of the newest tweets per timeline, in one SQLite file shared by all workers.
+
+    Entries keep their arrival order (`seq`): For You is not sorted by id, so "newer than
+    since_id" means "arrived after since_id". Only the last `size` entries per timeline are kept.
+    """
+
+    def __init__(self, path: str = TIMELINE_STATE_PATH, size: int = TIMELINE_BUFFER_SIZE):
+        self.path = path
+        self.size = size
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        # Connections must not cross a fork
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+            self._pid = os.getpid()
+        return self._connection
+
+    def append(self, timeline: str, tweets: List[TweetData]) -> Optional[str]:
+        """Add tweets (oldest first) not buffered yet; returns the newest buffered id"""
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.executemany(
+                    "INSERT OR IGNORE INTO timeline_entries (timeline, tweet_id, data) VALUES (?, ?, ?)",
+                    [(timeline, tweet.tweet_id, json.dumps(tweet.model_dump())) for tweet in tweets]
+                )
+                db.execute(
+                    "DELETE FROM timeline_entries WHERE timeline = ? AND seq <= "
+                    "(SELECT seq FROM timeline_entries WHERE timeline = ? ORDER BY seq DESC LIMIT 1 OFFSET ?)",
+                    (timeline, timeline, self.size)
+                )
+                row = db.execute(
+                    "SELECT tweet_id FROM timeline_entries WHERE timeline = ? ORDER BY seq DESC LIMIT 1", (timeline,)
+                ).fetchone()
+                newest_id = row[0] if row else None
+                db.execute(
+                    "INSERT INTO timeline_state (timeline, newest_id, polled_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(timeline) DO UPDATE SET newest_id = excluded.newest_id, polled_at = excluded.polled_at",
+                    (timeline, newest_id, time.time())
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return newest_id
+
+    def contains(self, timeline: str, tweet_ids: List[str]) -> set:
+        if not tweet_ids:
+            return set()
+        with self._lock:
+            rows = self._db().execute(
+                f"SELECT tweet_id FROM timeline_entries WHERE timeline = ? AND tweet_id IN ({','.join('?' * len(tweet_ids))})",
+                (timeline, *tweet_ids)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def since(self, timeline: str, since_id: Optional[str], limit: int) -> List[TweetData]:
+        """Up to `limit` buffered tweets that arrived after `since_id`, oldest first.
+
+        Without since_id (or when it has been evicted) the newest `limit` tweets come back.
+        """
+        with self._lock:
+            db = self._db()
+            row = db.execute(
+                "SELECT seq FROM timeline_entries WHERE timeline = ? AND tweet_id = ?", (timeline, since_id)
+            ).fetchone() if since_id else None
+            if row:
+                rows = db.execute(
+                    "SELECT data FROM timeline_entries WHERE timeline = ? AND seq > ? ORDER BY seq LIMIT ?",
+                    (timeline, row[0], limit)
+                ).fetchall()
+            else:
+                rows = db.execute(
+                    "SELECT data FROM (SELECT seq, data FROM timeline_entries WHERE timeline = ? ORDER BY seq DESC LIMIT ?) "
+                    "ORDER BY seq",
+                    (timeline, limit)
+                ).fetchall()
+        return [TweetData.model_construct(**json.loads(data)) for (data,) in rows]
+
+    def state(self, timeline: str) -> Tuple[Optional[str], Optional[float]]:
+        """(newest buffered id, time of the last successful poll)"""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT newest_id, polled_at FROM timeline_state WHERE timeline = ?", (timeline,)
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+timeline_buffer = TimelineBuffer()
+
+async def poll_timeline(timeline: str, buffer: TimelineBuffer = timeline_buffer) -> int:
+    """Fetch pages from the top of a timeline until a buffered tweet shows up; returns new tweets"""
+    new_records: List[TweetRecord] = []
+    seen_ids = set()
+
+    async for page in timeline_pages(timeline, max_pages=TIMELINE_POLL_MAX_PAGES):
+        records = [record for record in tweets_to_records(page) if record.tweet_id not in seen_ids]
+        seen_ids.update(record.tweet_id for record in records)
+        buffered = await asyncio.to_thread(buffer.contains, timeline, [record.tweet_id for record in records])
+        new_records.extend(record for record in records if record.tweet_id not in buffered)
+        # Caught up with what the buffer already has
+        if buffered:
+            break
+
+    # Pages are newest first; the buffer is in arrival order
+    new_records.reverse()
+    newest_id = await asyncio.to_thread(buffer.append, timeline, records_to_tweet_data(new_records))
+    if new_records:
+        logger.info(f"📜  {timeline} timeline: {len(new_records)} new tweets, newest {newest_id}")
+        if TIMELINE_FOLLOWER_SAVE:
+            await queue_tweet_records(new_records)
+    return len(new_records)
+
+class TimelineFollower:
+    """Polls the configured timelines into the shared buffer.
+
+    Only one worker per host follows (it holds an advisory lock on the buffer file); the
+    others retry the lock every interval and take over if the follower's process exits.
+    """
+
+    def __init__(self, timelines: List[str], interval: float = TIMELINE_POLL_INTERVAL, buffer: TimelineBuffer = timeline_buffer):
+        self.timelines = timelines
+        self.interval = interval
+        self.buffer = buffer
+        self._task: Optional[asyncio.Task] = None
+
+    async def _follow(self):
+        while True:
+            for timeline in self.timelines:
+                try:
+                    await poll_timeline(timeline, self.buffer)
+                except Exception as e:
+                    logger.error(f"Timeline follower failed to poll {timeline}: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    async def _run(self):
+        while True:
+            try:
+                async with file_lock(f"{self.buffer.path}.lock", timeout=0):
+                    logger.info(f"📜  Following timelines: {', '.join(self.timelines)} (every {self.interval:.0f}s)")
+                    await self._follow()
+            except TimeoutError:
+                await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if not self._task:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+timeline_follower = TimelineFollower(TIMELINE_FOLLOWER_TIMELINES)
+
+def start_timeline_follower():
+    if TIMELINE_FOLLOWER_ENABLED:
+        timeline_follower.start()
+
+async def stop_timeline_follower():
+    await timeline_follower.stop()
@@ -0,0 +1,73 @@
+import asyncio
+import os
+from typing import Dict, List, Tuple
+
+from loguru import logger
+
+from app.models.schemas.tweet import TweetDetails
+from app.services.system.cache import TTLCache
+from app.services.system.pacer import pace
+from app.services.system.resilience import UpstreamUnavailableError
+from app.services.twitter.client import twitter_client
+from app.utils.twitter import ExecutionStopError, handle_twitter_request
+from app.utils.twitter.normalizer import tweet_to_details
+
+TWEET_CACHE_TTL = float(os.getenv("TWEET_CACHE_TTL", "60"))  # seconds
+TWEET_CACHE_SIZE = int(os.getenv("TWEET_CACHE_SIZE", "10000"))
+TWITTER_LOOKUP_CHUNK_SIZE = int(os.getenv("TWITTER_LOOKUP_CHUNK_SIZE", "50"))
+
+tweet_cache: TTLCache[TweetDetails] = TTLCache('tweets', TWEET_CACHE_SIZE, TWEET_CACHE_TTL)
+
+async def _fetch_chunk(ids: List[str]) -> Tuple[Dict[str, TweetDetails], Dict[str, str]]:
+    """One multi-id upstream call; every id of a rejected call gets the call's error.
+
+    An open circuit or a failed upstream call is raised, like on the single-tweet endpoints,
+    so the batch endpoint answers 503 with Retry-After instead of one error string per id.
+    """
+    async def fetch_tweets_by_ids():
+        return await twitter_client.client.get_tweets_by_ids(ids)
+
+    try:
+        await pace('twitter.lookup')
+        tweets = await handle_twitter_request(fetch_tweets_by_ids, method='get_tweets_by_ids')
+    except (ExecutionStopError, UpstreamUnavailableError):
+        raise
+    except Exception as e:
+        detail = getattr(e, 'detail', None) or str(e)
+        logger.warning(f"⚠️  Lookup of {len(ids)} tweets failed: {detail}")
+        return {}, {tweet_id: detail for tweet_id in ids}
+
+    # Deleted or protected tweets come back as None; match the rest by id, not position
+    found = {}
+    for tweet in tweets or []:
+        if tweet is not None:
+            details = tweet_to_details(tweet)
+            found[details.id] = details
+    errors = {tweet_id: "Tweet not found" for tweet_id in ids if tweet_id not in found}
+    return found, errors
+
+async def get_tweets_by_ids(ids: List[str], use_cache: bool = True) -> Tuple[Dict[str, TweetDetails], Dict[str, str]]:
+    """
+    Look up tweets by id: deduped, served from the tweet cache when fresh, the rest
+    fetched in concurrent multi-id chunks under the `twitter.lookup` budget.
+    `use_cache=False` fetches every id (fresh counts) and still refreshes the cache.
+
+    Returns:
+        (tweets, errors), both keyed by tweet id
+    """
+    unique_ids = list(dict.fromkeys(str(tweet_id) for tweet_id in ids))
+    tweets = tweet_cache.get_many(unique_ids) if use_cache else {}
+    missing = [tweet_id for tweet_id in unique_ids if tweet_id not in tweets]
+    errors: Dict[str, str] = {}
+
+    if missing:
+        chunks = [missing[i:i + TWITTER_LOOKUP_CHUNK_SIZE] for i in range(0, len(missing), TWITTER_LOOKUP_CHUNK_SIZE)]
+        for found, failed in await asyncio.gather(*(_fetch_chunk(chunk) for chunk in chunks)):
+            for tweet_id, details in found.items():
+                tweet_cache.set(tweet_id, details)
+            tweets.update(found)
+            errors.update(failed)
+
+    logger.info(f"📚  Looked up {len(unique_ids)} tweets: {len(unique_ids) - len(missing)} cached, {len(missing)} fetched, {len(errors)} failed")
+    # Keep the caller's order
+    return {tweet_id: tweets[tweet_id] for tweet_id in unique_ids if tweet_id in tweets}, errors
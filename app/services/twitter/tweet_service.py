@@ -1,135 +1,351 @@
 import asyncio
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
 
 from loguru import logger
+from postgrest.types import ReturnMethod
 from twikit import Client
 
-from app.models.schemas.tweet import DBTweet, TwitterTweet
+from app.services.system.metrics import TWEET_WRITE_BUFFER_ROWS, TWEET_WRITE_FLUSH_SIZE, TWEET_WRITE_FLUSHES
+from app.services.system.resilience import UpstreamUnavailableError
+from app.services.system.supabase import execute_query, get_supabase
+from app.services.system.tracing import traced
+from app.utils.twitter.normalizer import TweetRecord, records_to_db_rows
 
 USE_TWITTER_MOCKS = os.getenv("USE_TWITTER_MOCKS", "false").lower() == "true"
+TWEET_ENGAGEMENT_SNAPSHOTS = os.getenv("TWEET_ENGAGEMENT_SNAPSHOTS", "true").lower() == "true"
+TWEET_WRITE_BEHIND = os.getenv("TWEET_WRITE_BEHIND", "true").lower() == "true"
+TWEET_WRITE_BUFFER_SIZE = int(os.getenv("TWEET_WRITE_BUFFER_SIZE", "2000"))  # rows
+TWEET_WRITE_FLUSH_ROWS = int(os.getenv("TWEET_WRITE_FLUSH_ROWS", "200"))
+TWEET_WRITE_FLUSH_INTERVAL = float(os.getenv("TWEET_WRITE_FLUSH_INTERVAL", "2"))  # seconds
+TWEET_WRITE_PUT_TIMEOUT = float(os.getenv("TWEET_WRITE_PUT_TIMEOUT", "30"))  # seconds
 
 ExecutionStopError = (asyncio.CancelledError, KeyboardInterrupt, SystemError)
 
-async def save_twitter_tweet(supabase: Client, tweet_data: dict) -> DBTweet:
-    try:
-        twitter_tweet = TwitterTweet.model_validate(tweet_data)
-        db_tweet = twitter_tweet.to_db_tweet()
-
-        existing = supabase.table('tweets')\
-            .select('*')\
-            .eq('id', db_tweet.id)\
-            .execute()
-
-        if existing.data:
-            logger.debug(f"Updating tweet {db_tweet.id}")
-            update_data = {
-                'id': db_tweet.id,
-                'text': db_tweet.text,
-                'author_id': db_tweet.author_id,
-                'author_name': db_tweet.author_name,
-                'author_username': db_tweet.author_username,
-                'author_photo': db_tweet.author_photo,
-                'lang': db_tweet.lang,
-                'retweets_count': db_tweet.retweets_count,
-                'likes_count': db_tweet.likes_count,
-                'updated_at': 'now()'
-            }
+class SearchHit(NamedTuple):
+    """Which saved-search phrase, and the full query built from it, found a tweet"""
+    phrase: str
+    query: str
+
+SearchHits = Dict[str, List[SearchHit]]
+
+def _write_tweet_rows(
+    supabase: Client,
+    tweet_rows: List[Dict[str, Any]],
+    batch_size: int,
+    hits: Optional[SearchHits] = None
+) -> List[Dict[str, Any]]:
+    """Insert new rows and refresh known ones; returns the rows PostgREST sends back.
 
-            if db_tweet.photo_urls:
-                update_data['photo_urls'] = db_tweet.photo_urls
-            if db_tweet.media is not None and len(db_tweet.media) > 0:
-                update_data['media'] = db_tweet.media
-            if db_tweet.meta_data:
-                update_data['meta_data'] = db_tweet.meta_data
+    With `hits`, rows get search_query_by/search_text_by from the first phrase that found
+    them; known rows keep the provenance they already have.
+    """
+    tweet_ids = [tweet_row['id'] for tweet_row in tweet_rows]
+    columns = 'id,search_query_by,search_text_by' if hits is not None else 'id'
+    existing = {}
 
-            result = supabase.table('tweets')\
-                .upsert(update_data, on_conflict='id')\
-                .execute()
+    # The ids go into the request URL, so look them up a write batch at a time
+    for i in range(0, len(tweet_ids), batch_size):
+        existing_tweets = execute_query(
+            supabase.table('tweets').select(columns).in_('id', tweet_ids[i:i + batch_size]),
+            'tweets', 'select'
+        )
+        existing.update((tweet.get('id'), tweet) for tweet in existing_tweets.data)
+
+    updates = []
+    inserts = []
+
+    for tweet_row in tweet_rows:
+        if hits is not None:
+            # Every row of a bulk write must carry the same columns, so known rows
+            # restate their provenance rather than omit it
+            known = existing.get(tweet_row['id']) or {}
+            first = hits[tweet_row['id']][0] if hits.get(tweet_row['id']) else SearchHit('', '')
+            tweet_row = {
+                **tweet_row,
+                'search_query_by': known.get('search_query_by') or first.phrase,
+                'search_text_by': known.get('search_text_by') or first.query,
+            }
+        if tweet_row['id'] in existing:
+            updates.append({**tweet_row, 'updated_at': 'now()'})
         else:
-            logger.debug(f"Creating new tweet {db_tweet.id}")
-            result = supabase.table('tweets')\
-                .insert(db_tweet.model_dump())\
-                .execute()
+            inserts.append(tweet_row)
+
+    results = []
 
-        if not result.data:
-            raise Exception("No data returned from database operation")
+    for i in range(0, len(updates), batch_size):
+        batch = updates[i:i + batch_size]
+        logger.debug(f"💾  Updating {len(batch)} tweets")
+        result = execute_query(
+            supabase.table('tweets').upsert(batch, on_conflict='id'),
+            'tweets', 'upsert'
+        )
+        results.extend(result.data)
 
-        return DBTweet.model_validate(result.data[0])
+    for i in range(0, len(inserts), batch_size):
+        batch = inserts[i:i + batch_size]
+        logger.debug(f"💾  Inserting {len(batch)} tweets")
+        result = execute_query(
+            supabase.table('tweets').insert(batch),
+            'tweets', 'insert'
+        )
+        results.extend(result.data)
 
+    _write_engagement_snapshots(supabase, tweet_rows, batch_size * 4)
+    return results
+
+def _write_engagement_snapshots(supabase: Client, tweet_rows: List[Dict[str, Any]], batch_size: int) -> None:
+    """Append the counts just saved to the engagement history.
+
+    Best effort: a failing history write must not fail the tweet save itself.
+    """
+    if not TWEET_ENGAGEMENT_SNAPSHOTS:
+        return
+    snapshot_rows = [
+        {
+            'tweet_id': tweet_row['id'],
+            'likes_count': tweet_row['likes_count'] or 0,
+            'retweets_count': tweet_row['retweets_count'] or 0,
+        }
+        for tweet_row in tweet_rows
+        if 'likes_count' in tweet_row
+    ]
+    try:
+        for i in range(0, len(snapshot_rows), batch_size):
+            execute_query(
+                supabase.table('tweet_engagement_snapshots').insert(snapshot_rows[i:i + batch_size], returning=ReturnMethod.minimal),
+                'tweet_engagement_snapshots', 'insert'
+            )
     except Exception as e:
-        logger.error(f"Error saving tweet: {str(e)}")
-        raise Exception(f"Error saving tweet: {str(e)}") from e
+        logger.warning(f"⚠️  Could not record engagement snapshots for {len(snapshot_rows)} tweets: {str(e)}")
+
+def _write_search_hits(supabase: Client, hits: SearchHits, batch_size: int) -> int:
+    """Record every (tweet, phrase) match; a tweet found by several phrases gets one row each.
+
+    A repeated match moves searched_at to now, so reads by phrase see the latest hits first.
+    """
+    hit_rows = [
+        {'tweet_id': tweet_id, 'phrase': hit.phrase, 'query': hit.query, 'searched_at': 'now()'}
+        for tweet_id, tweet_hits in hits.items()
+        for hit in tweet_hits
+    ]
+    for i in range(0, len(hit_rows), batch_size):
+        execute_query(
+            supabase.table('tweet_search_hits').upsert(hit_rows[i:i + batch_size], on_conflict='tweet_id,phrase'),
+            'tweet_search_hits', 'upsert'
+        )
+    return len(hit_rows)
+
+@traced('tweet_service.get_liked_tweet_ids')
+async def get_liked_tweet_ids(supabase: Client, tweet_ids: List[str]) -> Set[str]:
+    """Ids among `tweet_ids` already marked is_liked in the tweets table"""
+    result = execute_query(
+        supabase.table('tweets').select('id').in_('id', tweet_ids).eq('is_liked', True),
+        'tweets', 'select'
+    )
+    return {row['id'] for row in result.data}
+
+@traced('tweet_service.set_tweets_liked')
+async def set_tweets_liked(supabase: Client, tweet_ids: Iterable[str], is_liked: bool) -> int:
+    """Set is_liked on every known tweet in one write; returns the number of rows updated"""
+    tweet_ids = list(tweet_ids)
+    if not tweet_ids:
+        return 0
+    result = execute_query(
+        supabase.table('tweets').update({'is_liked': is_liked, 'updated_at': 'now()'}).in_('id', tweet_ids),
+        'tweets', 'update'
+    )
+    return len(result.data)
+
+@traced('tweet_service.update_tweet_counters')
+async def update_tweet_counters(supabase: Client, counters: List[Dict[str, Any]]) -> int:
+    """Write new likes/retweets counts for many tweets in one statement and snapshot them.
+
+    `counters` are {'id', 'likes_count', 'retweets_count'}; rows whose stored counts already
+    match are left alone. Returns the number of rows changed.
+    """
+    if not counters:
+        return 0
+    result = execute_query(supabase.rpc('update_tweet_counters', {'updates': counters}), 'tweets', 'rpc')
+    changed_ids = {row['id'] for row in result.data}
+    _write_engagement_snapshots(supabase, [row for row in counters if row['id'] in changed_ids], batch_size=200)
+    return len(changed_ids)
 
-async def save_twitter_tweets_batch(
+@traced('tweet_service.get_processed_tweet_ids')
+async def get_processed_tweet_ids(supabase: Client, tweet_ids: List[str]) -> Set[str]:
+    """Ids among `tweet_ids` already handled (is_processed) according to the tweets table"""
+    if not tweet_ids:
+        return set()
+    result = execute_query(
+        supabase.table('tweets').select('id').in_('id', tweet_ids).eq('is_processed', True),
+        'tweets', 'select'
+    )
+    return {row['id'] for row in result.data}
+
+@traced('tweet_service.mark_tweet_processed')
+async def mark_tweet_processed(
     supabase: Client,
-    tweets_data: List[Dict[Any, Any]],
-    batch_size: int = 50
-) -> List[DBTweet]:
-    try:
-        db_tweets = []
-        for tweet_data in tweets_data:
-            normalized_data = tweet_data
-            twitter_tweet = TwitterTweet.model_validate(normalized_data)
-            db_tweets.append(twitter_tweet.to_db_tweet())
-
-        tweet_ids = [tweet.id for tweet in db_tweets]
-        existing_tweets = supabase.table('tweets')\
-            .select('id')\
-            .in_('id', tweet_ids)\
-            .execute()
-
-        existing_ids = set(tweet.get('id') for tweet in existing_tweets.data)
-
-        updates = []
-        inserts = []
-
-        for db_tweet in db_tweets:
-            tweet_dict = {
-                'id': db_tweet.id,
-                'text': db_tweet.text,
-                'author_id': db_tweet.author_id,
-                'author_name': db_tweet.author_name,
-                'author_username': db_tweet.author_username,
-                'author_photo': db_tweet.author_photo,
-                'lang': db_tweet.lang,
-                'retweets_count': db_tweet.retweets_count,
-                'likes_count': db_tweet.likes_count,
-                'media': db_tweet.media or [],
-                'photo_urls': db_tweet.photo_urls or [],
-            }
+    tweet_row: Dict[str, Any],
+    reply_id: Optional[str] = None,
+    is_no_reply: bool = False
+) -> None:
+    """Save a handled tweet with is_processed set, so it is never handled again"""
+    processed_row = {**tweet_row, 'is_processed': True, 'is_no_reply': is_no_reply}
+    if reply_id:
+        processed_row['reply_id'] = reply_id
+    _write_tweet_rows(supabase, [processed_row], batch_size=1)
 
-            if db_tweet.meta_data:
-                tweet_dict['meta_data'] = db_tweet.meta_data
-
-            if db_tweet.id in existing_ids:
-                tweet_dict['updated_at'] = 'now()'
-                updates.append(tweet_dict)
-            else:
-                inserts.append(tweet_dict)
-
-        results = []
-
-        for i in range(0, len(updates), batch_size):
-            batch = updates[i:i + batch_size]
-            if batch:
-                logger.debug(f"💾  Updating {len(batch)} tweets")
-                result = supabase.table('tweets')\
-                    .upsert(batch, on_conflict='id')\
-                    .execute()
-                results.extend(result.data)
-
-        for i in range(0, len(inserts), batch_size):
-            batch = inserts[i:i + batch_size]
-            if batch:
-                logger.debug(f"💾  Inserting {len(batch)} tweets")
-                result = supabase.table('tweets')\
-                    .insert(batch)\
-                    .execute()
-                results.extend(result.data)
-
-        return [DBTweet.model_validate(result) for result in results]
+def _merge_hits(target: SearchHits, hits: SearchHits, tweet_id: str) -> None:
+    known = target.setdefault(tweet_id, [])
+    for hit in hits.get(tweet_id, []):
+        if not any(known_hit.phrase == hit.phrase for known_hit in known):
+            known.append(hit)
 
-    except Exception as e:
-        logger.error(f"Error in batch processing tweets: {str(e)}")
-        raise Exception(f"Batch processing failed: {str(e)}") from e
+class TweetWriteBuffer:
+    """Write-behind buffer for `tweets` rows and their search hits.
+
+    Pending rows are coalesced by id: a later row overrides the columns of an earlier one,
+    so the newest counts win. They are written in bulk once `flush_rows` are pending or
+    every `flush_interval` seconds. `put` waits while `max_rows` are pending (and raises
+    UpstreamUnavailableError after `put_timeout`), so a burst slows its callers down instead
+    of growing memory. Until `start()` is called writes go straight through.
+    """
+
+    def __init__(
+        self,
+        max_rows: int = TWEET_WRITE_BUFFER_SIZE,
+        flush_rows: int = TWEET_WRITE_FLUSH_ROWS,
+        flush_interval: float = TWEET_WRITE_FLUSH_INTERVAL,
+        put_timeout: float = TWEET_WRITE_PUT_TIMEOUT,
+        batch_size: int = 50
+    ):
+        self.max_rows = max_rows
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.batch_size = batch_size
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._hits: SearchHits = {}
+        self._changed = asyncio.Condition()
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._is_failing = False
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    async def put(self, tweet_rows: List[Dict[str, Any]], hits: Optional[SearchHits] = None) -> None:
+        hits = hits or {}
+        if self._task is None:
+            await self._write({tweet_row['id']: tweet_row for tweet_row in tweet_rows}, hits)
+            return
+
+        deadline = asyncio.get_running_loop().time() + self.put_timeout
+        async with self._changed:
+            for tweet_row in tweet_rows:
+                tweet_id = tweet_row['id']
+                while tweet_id not in self._rows and len(self._rows) >= self.max_rows:
+                    self._flush_requested.set()
+                    remaining = deadline - asyncio.get_running_loop().time()
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), max(remaining, 0))
+                    except asyncio.TimeoutError:
+                        raise UpstreamUnavailableError('supabase', self.flush_interval) from None
+                self._rows[tweet_id] = {**self._rows.get(tweet_id, {}), **tweet_row}
+                _merge_hits(self._hits, hits, tweet_id)
+            TWEET_WRITE_BUFFER_ROWS.set(len(self._rows))
+            if len(self._rows) >= self.flush_rows:
+                self._flush_requested.set()
+
+    async def _write(self, tweet_rows: Dict[str, Dict[str, Any]], hits: SearchHits) -> None:
+        supabase = get_supabase()
+        await asyncio.to_thread(_write_tweet_rows, supabase, list(tweet_rows.values()), self.batch_size, hits)
+        if any(hits.values()):
+            await asyncio.to_thread(_write_search_hits, supabase, hits, self.batch_size * 4)
+
+    async def flush(self) -> int:
+        """Write everything pending now; returns the number of rows written"""
+        async with self._flush_lock:
+            async with self._changed:
+                tweet_rows, hits = self._rows, self._hits
+                self._rows, self._hits = {}, {}
+            if not tweet_rows:
+                return 0
+            try:
+                await self._write(tweet_rows, hits)
+                TWEET_WRITE_FLUSHES.inc(outcome='success')
+                TWEET_WRITE_FLUSH_SIZE.observe(len(tweet_rows))
+                self._is_failing = False
+                logger.debug(f"💾  Flushed {len(tweet_rows)} buffered tweets")
+                return len(tweet_rows)
+            except Exception as e:
+                TWEET_WRITE_FLUSHES.inc(outcome='error')
+                self._is_failing = True
+                logger.error(f"Error flushing {len(tweet_rows)} buffered tweets, keeping them for the next flush: {str(e)}")
+                async with self._changed:
+                    # Rows put while this flush ran are newer and win
+                    for tweet_id, tweet_row in tweet_rows.items():
+                        self._rows[tweet_id] = {**tweet_row, **self._rows.get(tweet_id, {})}
+                        _merge_hits(self._hits, hits, tweet_id)
+                return 0
+            finally:
+                async with self._changed:
+                    TWEET_WRITE_BUFFER_ROWS.set(len(self._rows))
+                    self._changed.notify_all()
+
+    async def _run(self, stopping: asyncio.Event):
+        while not stopping.is_set():
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+            if self._is_failing:
+                # Full-buffer flush requests would otherwise retry a failing database in a loop
+                try:
+                    await asyncio.wait_for(stopping.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self):
+        if self._task is None:
+            self._stopping = asyncio.Event()
+            self._task = asyncio.create_task(self._run(self._stopping), name='tweet-write-buffer')
+
+    async def stop(self):
+        """Stop the flusher and write what is still pending"""
+        if self._task is None:
+            return
+        # Not cancelled: a flush in progress has already taken its rows out of the buffer
+        # and must finish writing them
+        self._stopping.set()
+        self._flush_requested.set()
+        await self._task
+        self._task = None
+        await self.flush()
+        if self._rows:
+            logger.error(f"Dropping {len(self._rows)} buffered tweets that could not be written on shutdown")
+
+tweet_write_buffer = TweetWriteBuffer()
+
+async def queue_tweet_records(
+    records: List[TweetRecord],
+    hits: Optional[SearchHits] = None,
+    chunk_size: int = 500
+) -> int:
+    """Hand search records to the write-behind buffer chunk by chunk; returns how many were queued"""
+    for i in range(0, len(records), chunk_size):
+        chunk = records[i:i + chunk_size]
+        chunk_hits = {record.tweet_id: hits.get(record.tweet_id, []) for record in chunk} if hits else None
+        await tweet_write_buffer.put(records_to_db_rows(chunk), chunk_hits)
+    return len(records)
+
+def start_tweet_write_buffer():
+    if TWEET_WRITE_BEHIND:
+        tweet_write_buffer.start()
+
+async def stop_tweet_write_buffer():
+    await tweet_write_buffer.stop()
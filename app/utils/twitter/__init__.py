@@ -1,11 +1,11 @@
-from app.utils.twitter.api_utils import handle_twitter_request, ExecutionStopError, twitter_client
-from app.utils.twitter.tweet_utils import process_tweet_details
-from .normalizer import normalize_tweet_data
+from app.utils.twitter.api_utils import before_non_idempotent_call, handle_twitter_request, ExecutionStopError, twitter_client
+from .normalizer import tweet_to_db_row, tweet_to_details
 
 __all__ = [
     'twitter_client',
-    'process_tweet_details',
     'handle_twitter_request',
+    'before_non_idempotent_call',
     'ExecutionStopError',
-    'normalize_tweet_data'
+    'tweet_to_db_row',
+    'tweet_to_details'
 ]
\ No newline at end of file
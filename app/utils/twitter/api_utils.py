@@ -1,18 +1,65 @@
-from typing import Any, Callable
+import asyncio
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional
 from loguru import logger
 from fastapi import HTTPException
+from app.services.system.metrics import TWITTER_REQUEST_DURATION, TWITTER_REQUESTS, TWITTER_RETRIES
+from app.services.system.resilience import HALF_OPEN, OPEN, UpstreamUnavailableError, backoff_delay, get_breaker
+from app.services.system.tracing import span
 from app.services.twitter.client import twitter_client
+from app.services.twitter.errors import AUTH, NOT_FOUND, RATE_LIMIT, TRANSIENT, classify_error, rate_limit_retry_after
+
+TWITTER_RETRY_ATTEMPTS = int(os.getenv("TWITTER_RETRY_ATTEMPTS", "3"))
+TWITTER_RETRY_BASE_DELAY = float(os.getenv("TWITTER_RETRY_BASE_DELAY", "0.5"))
+TWITTER_RETRY_MAX_DELAY = float(os.getenv("TWITTER_RETRY_MAX_DELAY", "8"))
+
+# Trips on repeated transient failures of any call; rate limits trip per-method breakers
+upstream_breaker = get_breaker('twitter')
+
+_before_non_idempotent_call: ContextVar[Optional[Callable[[], Awaitable[None]]]] = ContextVar('before_non_idempotent_call', default=None)
 
 class ExecutionStopError(Exception):
     pass
 
-async def handle_twitter_request(func: Callable, *args: Any, **kwargs: Any) -> Any:
+@contextmanager
+def before_non_idempotent_call(hook: Callable[[], Awaitable[None]]) -> Iterator[None]:
+    """Await `hook` right before a non-idempotent call (e.g. posting a tweet) is sent.
+
+    Lets a caller record that a side effect may have happened: when the hook raises, the
+    call is not made. Once the hook returned, a failure may still mean the call went through.
     """
-    Generic handler for Twitter API requests with error handling and authentication
+    token = _before_non_idempotent_call.set(hook)
+    try:
+        yield
+    finally:
+        _before_non_idempotent_call.reset(token)
+
+async def handle_twitter_request(
+    func: Callable,
+    *args: Any,
+    idempotent: bool = True,
+    method: Optional[str] = None,
+    **kwargs: Any
+) -> Any:
+    """
+    Generic handler for Twitter API requests with error handling, authentication and resilience
+
+    Transient errors (5xx, timeouts, connection errors) are retried with jittered exponential
+    backoff, rate limits are waited out when the window resets soon, and an expired session
+    triggers one re-authentication. Non-idempotent calls (`idempotent=False`, e.g. posting a
+    tweet) are never retried, and a hook set with `before_non_idempotent_call` is awaited
+    right before they are sent. Repeated transient failures open the `twitter` circuit, and a
+    rate limit opens the method's circuit until its window resets; while open, calls fail fast.
 
     Args:
         func: Async function that makes the actual Twitter API call
         *args: Positional arguments for the function
+        idempotent: Whether the call may safely be repeated
+        method: Upstream method name for the method's circuit breaker and metrics; defaults
+            to `func.__name__`. Pass it when `func` is a closure wrapping different methods
         **kwargs: Keyword arguments for the function
 
     Returns:
@@ -20,14 +67,108 @@ async def handle_twitter_request(func: Callable, *args: Any, **kwargs: Any) -> A
 
     Raises:
         ExecutionStopError: On various errors that stop execution
+        UpstreamUnavailableError: While a circuit is open or a rate limit cannot be waited out
         HTTPException: On various Twitter API errors with appropriate status codes
     """
+    method = method or getattr(func, '__name__', 'unknown')
+    method_breaker = get_breaker(f'twitter.{method}')
+    started = time.perf_counter()
+    outcome = 'success'
     try:
-        await twitter_client.ensure_authenticated()
-        return await func(*args, **kwargs)
+        with span('twitter.authenticate'):
+            await twitter_client.ensure_authenticated()
+
+        attempt = 0
+        while True:
+            is_method_probe = method_breaker.before_call()
+            try:
+                is_upstream_probe = upstream_breaker.before_call()
+            except UpstreamUnavailableError:
+                if is_method_probe:
+                    method_breaker.release()
+                raise
+
+            hook = None if idempotent else _before_non_idempotent_call.get()
+            if hook is not None:
+                try:
+                    await hook()
+                except BaseException:
+                    upstream_breaker.release()
+                    method_breaker.release()
+                    raise
+
+            try:
+                with span(f'twitter.{method}', method=method, attempt=attempt):
+                    result = await func(*args, **kwargs)
+            except TypeError:
+                upstream_breaker.release()
+                method_breaker.release()
+                raise
+            except Exception as e:
+                category = classify_error(e)
+                delay = None
+
+                if category == TRANSIENT:
+                    upstream_breaker.record_failure(e)
+                    method_breaker.release()
+                    if idempotent and attempt + 1 < TWITTER_RETRY_ATTEMPTS and upstream_breaker.state != OPEN:
+                        delay = backoff_delay(attempt, TWITTER_RETRY_BASE_DELAY, TWITTER_RETRY_MAX_DELAY)
+                elif category == RATE_LIMIT:
+                    upstream_breaker.release()
+                    retry_after = rate_limit_retry_after(e)
+                    if idempotent and attempt + 1 < TWITTER_RETRY_ATTEMPTS and retry_after <= TWITTER_RETRY_MAX_DELAY:
+                        method_breaker.release()
+                        delay = retry_after
+                    else:
+                        method_breaker.trip(retry_after, status_code=429)
+                        outcome = 'rate_limited'
+                        raise UpstreamUnavailableError(f'twitter.{method}', retry_after, status_code=429) from None
+                elif category == AUTH:
+                    upstream_breaker.release()
+                    method_breaker.release()
+                    twitter_client.is_authenticated = False
+                    if idempotent and attempt == 0:
+                        logger.warning(f"🔑  Session rejected during {method}; re-authenticating")
+                        with span('twitter.authenticate'):
+                            await twitter_client.ensure_authenticated()
+                        delay = 0.0
+                else:
+                    # Upstream answered (not found, bad request): it is healthy
+                    upstream_breaker.record_success()
+                    method_breaker.record_success()
+
+                if delay is None:
+                    outcome = category if category in (TRANSIENT, AUTH, NOT_FOUND) else 'error'
+                    raise
+
+                TWITTER_RETRIES.inc(method=method, category=category)
+                logger.warning(f"🔁  Retrying {method} after {category} error ({attempt + 1}/{TWITTER_RETRY_ATTEMPTS}) in {delay:.2f}s: {str(e)}")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            finally:
+                # Probes that ended in a cancellation must not keep the circuit half-open forever
+                if is_upstream_probe and upstream_breaker.state == HALF_OPEN:
+                    upstream_breaker.release()
+                if is_method_probe and method_breaker.state == HALF_OPEN:
+                    method_breaker.release()
+
+            upstream_breaker.record_success()
+            method_breaker.record_success()
+            return result
+    except UpstreamUnavailableError:
+        if outcome == 'success':
+            outcome = 'circuit_open'
+        raise
     except TypeError as e:
+        outcome = 'invalid_request'
         logger.error(f"Type error in Twitter API request: {str(e)}")
         raise HTTPException(status_code=400, detail=f"Invalid request format: {str(e)}") from None
     except Exception as e:
+        if outcome == 'success':
+            outcome = 'error'
         logger.error(f"Twitter API error: {str(e)}")
-        raise ExecutionStopError(str(e)) from None
\ No newline at end of file
+        raise ExecutionStopError(str(e)) from None
+    finally:
+        TWITTER_REQUESTS.inc(method=method, outcome=outcome)
+        TWITTER_REQUEST_DURATION.observe(time.perf_counter() - started, method=method)
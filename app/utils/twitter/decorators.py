@@ -1,6 +1,7 @@
 from functools import wraps
 from fastapi import HTTPException
 from loguru import logger
+from app.services.system.resilience import UpstreamUnavailableError
 from app.utils.twitter import ExecutionStopError
 
 def handle_twitter_endpoint(operation_name: str):
@@ -9,7 +10,7 @@ def handle_twitter_endpoint(operation_name: str):
         async def wrapper(*args, **kwargs):
             try:
                 return await func(*args, **kwargs)
-            except ExecutionStopError:
+            except (ExecutionStopError, UpstreamUnavailableError):
                 raise
             except Exception as e:
                 error_msg = f"Failed to {operation_name}: {str(e)}"
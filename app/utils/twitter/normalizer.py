@@ -1,58 +1,282 @@
-from typing import Any, Dict
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
-def normalize_tweet_data(tweet_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalize tweet data to a consistent format for TwitterTweet model"""
-    return {
-        'id': tweet_data['id'],
-        'text': tweet_data['text'],
-        'display_text': tweet_data['display_text'],
-        'retweet_count': tweet_data['retweet_count'],
-        'favorite_count': tweet_data['favorite_count'],
-        'author': {
-            'id': tweet_data['author']['id'],
-            'name': tweet_data['author']['name'],
-            'username': tweet_data['author']['username'],
-            'profile_image_url': tweet_data['author']['profile_image_url']
-        },
-        'lang': tweet_data['lang'],
-        'photo_urls': tweet_data.get('photo_urls', []),
-        'media': tweet_data.get('media', []),
-        'in_reply_to_status_id': tweet_data.get('in_reply_to_status_id'),
-        'in_reply_to_user_id': tweet_data.get('in_reply_to_user_id'),
-        'in_reply_to_screen_name': tweet_data.get('in_reply_to_screen_name'),
-        'in_reply_to': tweet_data.get('in_reply_to')
-    }
+from pydantic import BaseModel
+
+from app.models.schemas.search import TweetData
+from app.models.schemas.tweet import TweetAuthor, TweetDetails
+
+TweetFields = Dict[str, Any]
 
-def normalize_search_tweet_data(tweet_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalize tweet data from search results to a consistent format"""
+class TweetRecord:
+    """Compact search hit kept between the search layer and the DB writer.
 
-    entities = tweet_data.get('entities') or {}
-    media = entities.get('media') or []
-    media = media if isinstance(media, list) else []
+    Slots instead of a pydantic model/dict per tweet; author fields and languages repeat
+    across a run and are interned, photo URLs are a tuple sharing the empty case and the
+    raw media lists are not kept at all.
+    """
+    __slots__ = tuple(TweetData.model_fields)
 
-    photo_urls = [
+    def __init__(self, **fields: Any):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+NO_PHOTOS: tuple = ()
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+def extract_photo_urls(media: Any) -> List[str]:
+    """Photo URLs of available photo media items"""
+    if not isinstance(media, (list, tuple)):
+        return []
+    return [
         item['media_url_https']
         for item in media
-        if isinstance(item, dict) and item.get('type') == 'photo'
+        if isinstance(item, dict)
+        and item.get('type') == 'photo'
+        and item.get('ext_media_availability', {}).get('status') == 'Available'
+        and item.get('media_url_https')
     ]
 
+def _display_text(text: str, in_reply_to_status_id: Any) -> str:
+    """Replies start with @mentions of the thread; drop them from the display text"""
+    if not in_reply_to_status_id:
+        return text.strip()
+    non_mention_words = [word for word in text.split() if not word.startswith('@')]
+    return (' '.join(non_mention_words) if non_mention_words else text).strip()
+
+def _optional_str(value: Any) -> Optional[str]:
+    return str(value) if value else None
+
+def _read_twikit_tweet(tweet: Any) -> TweetFields:
+    """twikit.Tweet or MockTweet"""
+    user = tweet.user
+    text = getattr(tweet, 'text', '') or ''
+    media = getattr(tweet, 'media', None)
+    media = list(media) if isinstance(media, (list, tuple)) else []
+    in_reply_to_status_id = getattr(tweet, 'in_reply_to_status_id', None)
     return {
-        'id': tweet_data['tweet_id'],
-        'text': tweet_data['text'],
-        'display_text': tweet_data['text'],
-        'retweet_count': tweet_data['retweets'],
-        'favorite_count': tweet_data['likes'],
-        'author': {
-            'id': tweet_data['tweet_user_nick'],
-            'name': tweet_data['tweet_user_name'],
-            'username': tweet_data['tweet_user_nick'],
-            'profile_image_url': ''
-        },
-        'lang': tweet_data['tweet_lang'],
-        'photo_urls': photo_urls,
+        'id': str(tweet.id),
+        'text': text,
+        'display_text': _display_text(text, in_reply_to_status_id),
+        'created_at': str(getattr(tweet, 'created_at', '')),
+        'lang': getattr(tweet, 'lang', '') or '',
+        'retweet_count': getattr(tweet, 'retweet_count', 0) or 0,
+        'favorite_count': getattr(tweet, 'favorite_count', 0) or 0,
+        'author_id': str(getattr(user, 'id', '0')),
+        'author_name': getattr(user, 'name', ''),
+        'author_username': getattr(user, 'screen_name', ''),
+        'author_photo': getattr(user, 'profile_image_url_https', None) or getattr(user, 'profile_image_url', None),
+        'in_reply_to_status_id': _optional_str(in_reply_to_status_id),
+        'in_reply_to_user_id': _optional_str(getattr(tweet, 'in_reply_to_user_id', None)),
+        'in_reply_to_screen_name': getattr(tweet, 'in_reply_to_screen_name', None),
+        'in_reply_to': _optional_str(getattr(tweet, 'in_reply_to', None)),
+        'photo_urls': extract_photo_urls(media),
         'media': media,
+    }
+
+def _read_raw_dict(tweet: Dict[str, Any]) -> TweetFields:
+    """Raw tweet dict with a nested `user` (mock fixtures, legacy API payloads)"""
+    user = tweet.get('user') or {}
+    text = tweet.get('text') or tweet.get('full_text') or ''
+    media = tweet.get('media')
+    if media is None:
+        media = (tweet.get('entities') or {}).get('media')
+    media = list(media) if isinstance(media, (list, tuple)) else []
+    in_reply_to_status_id = tweet.get('in_reply_to_status_id') or tweet.get('in_reply_to_status_id_str')
+    return {
+        'id': str(tweet.get('id') or tweet.get('id_str')),
+        'text': text,
+        'display_text': _display_text(text, in_reply_to_status_id),
+        'created_at': str(tweet.get('created_at', '')),
+        'lang': tweet.get('lang') or '',
+        'retweet_count': tweet.get('retweet_count') or 0,
+        'favorite_count': tweet.get('favorite_count') or 0,
+        'author_id': str(user.get('id') or user.get('id_str') or '0'),
+        'author_name': user.get('name', ''),
+        'author_username': user.get('screen_name', ''),
+        'author_photo': user.get('profile_image_url_https') or user.get('profile_image_url'),
+        'in_reply_to_status_id': _optional_str(in_reply_to_status_id),
+        'in_reply_to_user_id': _optional_str(tweet.get('in_reply_to_user_id') or tweet.get('in_reply_to_user_id_str')),
+        'in_reply_to_screen_name': tweet.get('in_reply_to_screen_name'),
+        'in_reply_to': _optional_str(tweet.get('in_reply_to') or in_reply_to_status_id),
+        'photo_urls': extract_photo_urls(media),
+        'media': media,
+    }
+
+def _read_search_row(row: Any) -> TweetFields:
+    """TweetData (or its dict form) returned by the search endpoint, or a TweetRecord"""
+    get = row.get if isinstance(row, dict) else lambda key, default=None: getattr(row, key, default)
+    text = get('text') or ''
+    return {
+        'id': str(get('tweet_id')),
+        'text': text,
+        'display_text': text,
+        'created_at': str(get('created_at') or ''),
+        'lang': get('tweet_lang') or '',
+        'retweet_count': get('retweets') or 0,
+        'favorite_count': get('likes') or 0,
+        'author_id': get('tweet_user_id') or get('tweet_user_nick'),
+        'author_name': get('tweet_user_name'),
+        'author_username': get('tweet_user_nick'),
+        'author_photo': get('tweet_user_photo'),
         'in_reply_to_status_id': None,
         'in_reply_to_user_id': None,
         'in_reply_to_screen_name': None,
-        'in_reply_to': None
-    }
\ No newline at end of file
+        'in_reply_to': None,
+        'photo_urls': list(get('photo_urls') or []),
+        'media': [],
+    }
+
+def _read_details(details: Any) -> TweetFields:
+    """TweetDetails model, or its model_dump() form"""
+    if isinstance(details, dict):
+        author = details['author']
+        get = details.get
+        author_get = author.get
+    else:
+        author = details.author
+        get = lambda key, default=None: getattr(details, key, default)
+        author_get = lambda key, default=None: getattr(author, key, default)
+    return {
+        'id': get('id'),
+        'text': get('text'),
+        'display_text': get('display_text'),
+        'created_at': get('created_at', ''),
+        'lang': get('lang'),
+        'retweet_count': get('retweet_count'),
+        'favorite_count': get('favorite_count'),
+        'author_id': author_get('id'),
+        'author_name': author_get('name'),
+        'author_username': author_get('username'),
+        'author_photo': author_get('profile_image_url'),
+        'in_reply_to_status_id': get('in_reply_to_status_id'),
+        'in_reply_to_user_id': get('in_reply_to_user_id'),
+        'in_reply_to_screen_name': get('in_reply_to_screen_name'),
+        'in_reply_to': get('in_reply_to'),
+        'photo_urls': list(get('photo_urls') or []),
+        'media': list(get('media') or []),
+    }
+
+@lru_cache(maxsize=None)
+def _reader_for_type(source_type: type) -> Callable[[Any], TweetFields]:
+    if issubclass(source_type, TweetDetails):
+        return _read_details
+    if issubclass(source_type, (TweetData, TweetRecord)):
+        return _read_search_row
+    if issubclass(source_type, BaseModel):
+        raise TypeError(f"Unsupported tweet model {source_type.__name__}")
+    return _read_twikit_tweet
+
+def read_tweet(source: Any) -> TweetFields:
+    """Read any supported tweet source into one flat field dict, without intermediate models"""
+    if source is None:
+        raise ValueError("Tweet object is None")
+    if isinstance(source, dict):
+        if 'tweet_id' in source:
+            return _read_search_row(source)
+        if 'author' in source:
+            return _read_details(source)
+        return _read_raw_dict(source)
+    return _reader_for_type(type(source))(source)
+
+def fields_to_db_row(fields: TweetFields) -> Dict[str, Any]:
+    """Flat tweet fields to a `tweets` table row"""
+    return {
+        'id': fields['id'],
+        'text': fields['text'],
+        'author_id': fields['author_id'],
+        'author_name': fields['author_name'],
+        'author_username': fields['author_username'],
+        'author_photo': fields['author_photo'],
+        'lang': fields['lang'],
+        'retweets_count': fields['retweet_count'],
+        'likes_count': fields['favorite_count'],
+        'photo_urls': fields['photo_urls'],
+        'media': fields['media'],
+        'meta_data': {
+            'display_text': fields['display_text'],
+            'in_reply_to_status_id': fields['in_reply_to_status_id'],
+            'in_reply_to_user_id': fields['in_reply_to_user_id'],
+            'in_reply_to_screen_name': fields['in_reply_to_screen_name'],
+            'in_reply_to': fields['in_reply_to'],
+        },
+    }
+
+def fields_to_details(fields: TweetFields) -> TweetDetails:
+    """Flat tweet fields to the API model; the readers already produce valid types"""
+    return TweetDetails.model_construct(
+        id=fields['id'],
+        text=fields['text'],
+        display_text=fields['display_text'],
+        created_at=fields['created_at'],
+        lang=fields['lang'],
+        retweet_count=fields['retweet_count'],
+        favorite_count=fields['favorite_count'],
+        author=TweetAuthor.model_construct(
+            id=fields['author_id'],
+            name=fields['author_name'],
+            username=fields['author_username'],
+            profile_image_url=fields['author_photo'] or None,
+        ),
+        in_reply_to_status_id=fields['in_reply_to_status_id'],
+        in_reply_to_user_id=fields['in_reply_to_user_id'],
+        in_reply_to_screen_name=fields['in_reply_to_screen_name'],
+        in_reply_to=fields['in_reply_to'],
+        photo_urls=fields['photo_urls'],
+        media=fields['media'],
+    )
+
+def tweet_to_db_row(source: Any) -> Dict[str, Any]:
+    """Map a twikit Tweet, raw dict, search row or TweetDetails straight to a DB row"""
+    return fields_to_db_row(read_tweet(source))
+
+def tweet_to_details(source: Any) -> TweetDetails:
+    """Map a twikit Tweet, raw dict or search row straight to the API model"""
+    if isinstance(source, TweetDetails):
+        return source
+    return fields_to_details(read_tweet(source))
+
+def fields_to_search_row(fields: TweetFields) -> TweetData:
+    """Flat tweet fields to the search/timeline API row"""
+    return TweetData.model_construct(
+        tweet_id=fields['id'],
+        tweet_user_name=fields['author_name'],
+        tweet_user_nick=fields['author_username'],
+        text=fields['text'],
+        created_at=fields['created_at'],
+        retweets=fields['retweet_count'],
+        likes=fields['favorite_count'],
+        photo_urls=fields['photo_urls'],
+        tweet_lang=fields['lang'],
+        tweet_user_id=fields['author_id'],
+        tweet_user_photo=fields['author_photo'],
+    )
+
+def fields_to_record(fields: TweetFields) -> TweetRecord:
+    """Flat tweet fields to a compact record: repeated strings interned, raw media dropped"""
+    return TweetRecord(
+        tweet_id=fields['id'],
+        tweet_user_name=_intern(fields['author_name']),
+        tweet_user_nick=_intern(fields['author_username']),
+        text=fields['text'],
+        created_at=fields['created_at'],
+        retweets=fields['retweet_count'],
+        likes=fields['favorite_count'],
+        photo_urls=tuple(fields['photo_urls']) or NO_PHOTOS,
+        tweet_lang=_intern(fields['lang']),
+        tweet_user_id=_intern(fields['author_id']),
+        tweet_user_photo=_intern(fields['author_photo']),
+    )
+
+def tweets_to_records(tweets: Iterable[Any]) -> List[TweetRecord]:
+    """Normalize a page of twikit/mock tweets into compact records"""
+    return [fields_to_record(read_tweet(tweet)) for tweet in tweets]
+
+def records_to_tweet_data(records: Iterable[TweetRecord]) -> List[TweetData]:
+    return [fields_to_search_row(_read_search_row(record)) for record in records]
+
+def records_to_db_rows(records: Iterable[TweetRecord]) -> List[Dict[str, Any]]:
+    return [fields_to_db_row(_read_search_row(record)) for record in records]
@@ -0,0 +1,72 @@
+import asyncio
+import json
+import re
+import time
+from typing import List
+
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+TWEET_ID_PATTERN = re.compile(r'"(?:tweet_)?id": "(\d+)"')
+
+class FakeLLM:
+    """
+    Canned-JSON stand-in for the text models used by gen_text.
+
+    The reply always targets the last tweet id found in the prompt and carries every field
+    the reply tasks read (target_tweet_id, reply_text, sentiment, answer_required).
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    async def respond(self, messages: List[ModelMessage], info: AgentInfo) -> ModelResponse:
+        self.calls += 1
+        prompt = "\n".join(
+            str(getattr(part, 'content', ''))
+            for message in messages
+            for part in message.parts
+        )
+        tweet_ids = TWEET_ID_PATTERN.findall(prompt)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return ModelResponse(parts=[TextPart(json.dumps({
+            "target_tweet_id": tweet_ids[-1] if tweet_ids else "0",
+            "reply_text": "Interesting take. Caching intermediate agent state cut our p95 in half, "
+                          "mostly by avoiding repeated context assembly on every tool call.",
+            "sentiment": "positive",
+            "answer_required": True
+        }))])
+
+    def model(self, model_name: str = '', **kwargs) -> FunctionModel:
+        """Drop-in replacement for the GroqModel/OpenAIModel constructors"""
+        return FunctionModel(self.respond)
+
+class _FakeImage:
+    def __init__(self, url: str):
+        self.url = url
+
+class _FakeImagesResponse:
+    def __init__(self, url: str):
+        self.data = [_FakeImage(url)]
+
+class _FakeImages:
+    def __init__(self, owner: "FakeImageClient"):
+        self._owner = owner
+
+    def generate(self, prompt: str, model: str, **kwargs) -> _FakeImagesResponse:
+        self._owner.calls += 1
+        if self._owner.latency:
+            # Together's client is synchronous, so the fake blocks the same way
+            time.sleep(self._owner.latency)
+        return _FakeImagesResponse(f"{self._owner.base_url}/images/{self._owner.calls}.png")
+
+class FakeImageClient:
+    """Stand-in for together.Together whose image URLs point at the fake HTTP server"""
+
+    def __init__(self, base_url: str, latency: float = 0.0):
+        self.base_url = base_url
+        self.latency = latency
+        self.calls = 0
+        self.images = _FakeImages(self)
@@ -0,0 +1,283 @@
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+# A 1x1 transparent PNG served for generated-image downloads
+PNG_PIXEL = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d4944415478da63f8ffff3f0005fe02fea7d6a4830000000049454e44ae426082"
+)
+
+ROW_DEFAULTS = {
+    'reply_id': None,
+    'is_processed': False,
+    'is_liked': False,
+    'is_no_reply': False,
+    'sentiment': '',
+    'search_query_by': '',
+    'search_text_by': '',
+    'meta_data': {},
+    'media': [],
+    'photo_urls': [],
+}
+
+class FakePostgrest:
+    """
+    Minimal PostgREST stand-in over HTTP for the subset of calls supabase-py makes here:
+    select with eq./in. filters, insert and upsert (merge-duplicates) on `id` or the
+    `on_conflict` columns, and the RPC functions from supabase/migrations/.
+    The same server also serves /images/* so generated-image downloads stay local.
+    """
+
+    def __init__(self, latency: float = 0.0, host: str = '127.0.0.1', port: int = 0):
+        self.latency = latency
+        self.tables: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.calls: Counter = Counter()
+        self.image_downloads = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakePostgrest":
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-postgrest', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def rows(self, table: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self.tables.get(table, {}).values())
+
+    @staticmethod
+    def _text(value: Any) -> str:
+        # Postgres accepts booleans in any case (postgrest-py sends eq.True)
+        return str(value).lower() if isinstance(value, bool) else str(value)
+
+    def _select(self, table: str, params: List[tuple]) -> List[Dict[str, Any]]:
+        rows = self.rows(table)
+        for column, expression in params:
+            if column in ('select', 'order', 'limit', 'offset', 'on_conflict'):
+                continue
+            operator, _, value = expression.partition('.')
+            if value in ('True', 'False'):
+                value = value.lower()
+            if operator == 'eq':
+                rows = [row for row in rows if self._text(row.get(column)) == value]
+            elif operator == 'in':
+                wanted = {item.strip('"') for item in value.strip('()').split(',') if item}
+                rows = [row for row in rows if self._text(row.get(column)) in wanted]
+            elif operator == 'is' and value == 'null':
+                rows = [row for row in rows if row.get(column) is None]
+            elif operator == 'not' and value == 'is.null':
+                rows = [row for row in rows if row.get(column) is not None]
+            elif operator == 'gte':
+                rows = [row for row in rows if row.get(column) is not None and self._text(row[column]) >= value]
+        order = dict(params).get('order')
+        if order:
+            # Stable sorts applied last key first give the multi-column order; nulls sort as largest, like Postgres
+            for key in reversed(order.split(',')):
+                column, _, direction = key.partition('.')
+                rows.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=direction.startswith('desc'))
+        limit = dict(params).get('limit')
+        return rows[:int(limit)] if limit else rows
+
+    def _write(self, table: str, payload: Any, is_upsert: bool, key_columns: tuple = ('id',)) -> Optional[List[Dict[str, Any]]]:
+        now = datetime.now(timezone.utc).isoformat()
+        records = payload if isinstance(payload, list) else [payload]
+        defaults = ROW_DEFAULTS if table == 'tweets' else {}
+        written = []
+        with self._lock:
+            store = self.tables.setdefault(table, {})
+            for record in records:
+                if all(column in record for column in key_columns):
+                    record_id = ','.join(str(record[column]) for column in key_columns)
+                else:
+                    # Append-only tables without an id (engagement snapshots)
+                    record_id = str(len(store))
+                if record_id in store and not is_upsert:
+                    return None
+                row = store.get(record_id) or {**defaults, 'created_at': now}
+                row.update({key: (now if value == 'now()' else value) for key, value in record.items()})
+                row.setdefault('updated_at', now)
+                store[record_id] = row
+                written.append(dict(row))
+        return written
+
+    def _update(self, table: str, params: List[tuple], payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        matched = {row['id'] for row in self._select(table, params)}
+        now = datetime.now(timezone.utc).isoformat()
+        updated = []
+        with self._lock:
+            store = self.tables.setdefault(table, {})
+            for record_id in matched:
+                store[record_id].update({key: (now if value == 'now()' else value) for key, value in payload.items()})
+                updated.append(dict(store[record_id]))
+        return updated
+
+    def _rpc(self, function: str, args: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        if function == 'search_phrase_yield':
+            tweets = {row['id']: row for row in self.rows('tweets')}
+            since = args.get('since')
+            stats: Dict[str, Dict[str, Any]] = {}
+            for hit in self.rows('tweet_search_hits'):
+                tweet = tweets.get(hit['tweet_id'])
+                searched_at = hit.get('searched_at') or hit['created_at']
+                if not tweet or (since and searched_at < since):
+                    continue
+                phrase = stats.setdefault(hit['phrase'], {
+                    'phrase': hit['phrase'], 'tweets': 0, 'processed': 0, 'replied': 0,
+                    'liked': 0, 'no_reply': 0, 'last_hit_at': searched_at,
+                })
+                phrase['tweets'] += 1
+                phrase['processed'] += bool(tweet['is_processed'])
+                phrase['replied'] += tweet['reply_id'] is not None
+                phrase['liked'] += bool(tweet['is_liked'])
+                phrase['no_reply'] += bool(tweet['is_no_reply'])
+                phrase['last_hit_at'] = max(phrase['last_hit_at'], searched_at)
+            return sorted(stats.values(), key=lambda phrase: phrase['tweets'], reverse=True)
+        if function == 'update_tweet_counters':
+            now = datetime.now(timezone.utc).isoformat()
+            changed = []
+            with self._lock:
+                store = self.tables.setdefault('tweets', {})
+                for update in args['updates']:
+                    row = store.get(str(update['id']))
+                    counts = (update['likes_count'], update['retweets_count'])
+                    if row and (row['likes_count'], row['retweets_count']) != counts:
+                        row.update(likes_count=counts[0], retweets_count=counts[1], updated_at=now)
+                        changed.append({'id': row['id']})
+            return changed
+        if function == 'engagement_velocity':
+            cutoff = datetime.fromtimestamp(time.time() - float(args.get('window_hours') or 6) * 3600, timezone.utc).isoformat()
+            wanted = set(args['tweet_ids']) if args.get('tweet_ids') is not None else None
+            series: Dict[str, List[Dict[str, Any]]] = {}
+            for snapshot in self.rows('tweet_engagement_snapshots'):
+                captured_at = snapshot.get('captured_at') or snapshot['created_at']
+                if captured_at >= cutoff and (wanted is None or snapshot['tweet_id'] in wanted):
+                    series.setdefault(snapshot['tweet_id'], []).append({**snapshot, 'captured_at': captured_at})
+            velocities = []
+            for tweet_id, snapshots in series.items():
+                if len(snapshots) < 2:
+                    continue
+                snapshots.sort(key=lambda snapshot: snapshot['captured_at'])
+                first, last = snapshots[0], snapshots[-1]
+                hours = max(
+                    (datetime.fromisoformat(last['captured_at']) - datetime.fromisoformat(first['captured_at'])).total_seconds() / 3600,
+                    1 / 60
+                )
+                velocities.append({
+                    'tweet_id': tweet_id,
+                    'likes_count': last['likes_count'],
+                    'retweets_count': last['retweets_count'],
+                    'likes_per_hour': (last['likes_count'] - first['likes_count']) / hours,
+                    'retweets_per_hour': (last['retweets_count'] - first['retweets_count']) / hours,
+                    'snapshots': len(snapshots),
+                    'first_at': first['captured_at'],
+                    'last_at': last['captured_at'],
+                })
+            velocities.sort(key=lambda velocity: velocity['likes_per_hour'], reverse=True)
+            return velocities[:max(1, min(int(args.get('max_results') or 100), 1000))]
+        if function == 'search_saved_tweets':
+            # Every word must appear; rank is the number of occurrences
+            words = [word.strip('"').lower() for word in args['q'].split() if word.strip('"')]
+            since = args.get('since')
+            hits = []
+            for row in self.rows('tweets'):
+                text = (row.get('text') or '').lower()
+                if not all(word in text for word in words) or (since and row['created_at'] < since):
+                    continue
+                hits.append({
+                    **{column: row.get(column) for column in (
+                        'id', 'text', 'author_name', 'author_username', 'likes_count',
+                        'retweets_count', 'created_at', 'search_query_by'
+                    )},
+                    'rank': float(sum(text.count(word) for word in words)),
+                })
+            hits.sort(key=lambda hit: (hit['rank'], hit['created_at']), reverse=True)
+            return hits[:max(1, min(int(args.get('max_results') or 20), 100))]
+        return None
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str = 'application/json'):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _route(self):
+                parts = urlsplit(self.path)
+                params = parse_qsl(parts.query, keep_blank_values=True)
+                return parts.path, params
+
+            def _body(self) -> Any:
+                length = int(self.headers.get('Content-Length') or 0)
+                return json.loads(self.rfile.read(length) or b'null')
+
+            def _table(self, path: str) -> Optional[str]:
+                prefix = '/rest/v1/'
+                return path[len(prefix):] if path.startswith(prefix) else None
+
+            def do_GET(self):
+                path, params = self._route()
+                if path.startswith('/images/'):
+                    fake.image_downloads += 1
+                    return self._send(200, PNG_PIXEL, 'image/png')
+                table = self._table(path)
+                if not table:
+                    return self._send(404, b'{}')
+                fake.calls[f'GET {table}'] += 1
+                time.sleep(fake.latency)
+                self._send(200, json.dumps(fake._select(table, params)).encode())
+
+            def do_POST(self):
+                path, params = self._route()
+                table = self._table(path)
+                if not table:
+                    return self._send(404, b'{}')
+                if table.startswith('rpc/'):
+                    fake.calls[f'RPC {table[4:]}'] += 1
+                    time.sleep(fake.latency)
+                    result = fake._rpc(table[4:], self._body() or {})
+                    if result is None:
+                        return self._send(404, json.dumps({'code': 'PGRST202', 'message': 'function not found'}).encode())
+                    return self._send(200, json.dumps(result).encode())
+                is_upsert = 'resolution=merge-duplicates' in (self.headers.get('Prefer') or '')
+                fake.calls[f"{'UPSERT' if is_upsert else 'POST'} {table}"] += 1
+                time.sleep(fake.latency)
+                key_columns = tuple((dict(params).get('on_conflict') or 'id').split(','))
+                written = fake._write(table, self._body(), is_upsert, key_columns)
+                if written is None:
+                    return self._send(409, json.dumps({'code': '23505', 'message': 'duplicate key value'}).encode())
+                self._send(201, json.dumps(written).encode())
+
+            def do_PATCH(self):
+                path, params = self._route()
+                table = self._table(path)
+                if not table:
+                    return self._send(404, b'{}')
+                fake.calls[f'PATCH {table}'] += 1
+                time.sleep(fake.latency)
+                self._send(200, json.dumps(fake._update(table, params, self._body())).encode())
+
+        return Handler
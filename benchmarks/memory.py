@@ -0,0 +1,103 @@
+"""
+Peak Python heap of a save-search run, measured with tracemalloc: the legacy pipeline that
+kept every hit as TweetData + normalized dict + DBTweet versus compact TweetRecords written
+chunk by chunk.
+
+    python -m benchmarks.memory --tweets 10000
+"""
+import argparse
+import os
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+os.environ.setdefault('USE_TWITTER_MOCKS', 'true')
+
+from app.models.schemas.tweet import DBTweet, TwitterTweet
+from app.services.twitter.mock_client import MockTwitterClient
+from app.utils.twitter.normalizer import extract_photo_urls, records_to_db_rows, tweets_to_records
+
+from benchmarks.normalize import to_search_row
+
+def returned_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """What PostgREST echoes back for an inserted row"""
+    now = datetime.now(timezone.utc).isoformat()
+    return {**row, 'created_at': now, 'updated_at': now}
+
+def legacy_run(pages: List[List[Any]], batch_size: int) -> int:
+    """search_batch of TweetData, then normalized dicts, then DBTweet results, all held at once"""
+    search_batch = []
+    for page in pages:
+        tweets = []
+        for tweet in page:
+            row = to_search_row(tweet)
+            row.photo_urls = extract_photo_urls(tweet.media)
+            tweets.append(row)
+        search_batch.append({'tweets': tweets})
+
+    normalized = []
+    for batch in search_batch:
+        for tweet in batch['tweets']:
+            data = tweet.model_dump()
+            normalized.append({
+                'id': data['tweet_id'],
+                'text': data['text'],
+                'display_text': data['text'],
+                'retweet_count': data['retweets'],
+                'favorite_count': data['likes'],
+                'author': {'id': data['tweet_user_nick'], 'name': data['tweet_user_name'], 'username': data['tweet_user_nick']},
+                'lang': data['tweet_lang'],
+                'photo_urls': data['photo_urls'],
+            })
+
+    db_tweets = [TwitterTweet.model_validate(data).to_db_tweet() for data in normalized]
+    inserts = [db_tweet.model_dump() for db_tweet in db_tweets]
+    results = []
+    for i in range(0, len(inserts), batch_size):
+        results.extend(returned_row(row) for row in inserts[i:i + batch_size])
+    return len([DBTweet.model_validate(result) for result in results])
+
+def record_run(pages: List[List[Any]], batch_size: int, chunk_size: int = 500) -> int:
+    """Compact records for the whole run, DB rows for one chunk at a time"""
+    records = []
+    for page in pages:
+        records.extend(tweets_to_records(page))
+
+    saved = 0
+    for i in range(0, len(records), chunk_size):
+        rows = records_to_db_rows(records[i:i + chunk_size])
+        for j in range(0, len(rows), batch_size):
+            saved += len([returned_row(row) for row in rows[j:j + batch_size]])
+    return saved
+
+def peak_bytes(run: Callable[..., int], *args: Any) -> int:
+    tracemalloc.start()
+    try:
+        run(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tweets', type=int, default=10000)
+    parser.add_argument('--page-size', type=int, default=20)
+    parser.add_argument('--batch-size', type=int, default=50)
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    client = MockTwitterClient()
+    tweets = [client.seed_tweet() for _ in range(args.tweets)]
+    pages = [tweets[i:i + args.page_size] for i in range(0, len(tweets), args.page_size)]
+
+    legacy = peak_bytes(legacy_run, pages, args.batch_size)
+    compact = peak_bytes(record_run, pages, args.batch_size)
+    print(f"{'pipeline':<10}{'peak MiB':>12}")
+    print('-' * 22)
+    print(f"{'legacy':<10}{legacy / 2 ** 20:>12.2f}")
+    print(f"{'records':<10}{compact / 2 ** 20:>12.2f}")
+    print(f"{args.tweets} tweets: {legacy / compact:.1f}x lower peak")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Per-tweet CPU cost of tweet normalization: the legacy chain of model round trips versus
+the single-pass normalizer in app.utils.twitter.normalizer.
+
+    python -m benchmarks.normalize --tweets 2000 --repeat 5
+"""
+import argparse
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Importing the twitter services package builds the shared client; keep it off the network
+os.environ.setdefault('USE_TWITTER_MOCKS', 'true')
+
+from app.models.schemas.search import TweetData
+from app.models.schemas.tweet import TweetAuthor, TweetDetails, TwitterTweet
+from app.services.twitter.mock_client import MockTwitterClient
+from app.utils.twitter.normalizer import (
+    extract_photo_urls,
+    records_to_db_rows,
+    tweet_to_db_row,
+    tweet_to_details,
+    tweets_to_records,
+)
+
+def legacy_details(tweet: Any) -> TweetDetails:
+    """The former process_tweet_details: a validated TweetDetails per call"""
+    if hasattr(tweet, 'user'):
+        user = tweet.user
+        author = TweetAuthor(
+            id=str(getattr(user, 'id', '0')),
+            name=getattr(user, 'name', ''),
+            username=getattr(user, 'screen_name', ''),
+            profile_image_url=getattr(user, 'profile_image_url_https', None)
+        )
+    else:
+        author = tweet.author
+    media = list(getattr(tweet, 'media', None) or [])
+    return TweetDetails(
+        id=str(tweet.id),
+        text=tweet.text,
+        display_text=tweet.text.strip(),
+        created_at=str(getattr(tweet, 'created_at', '')),
+        lang=getattr(tweet, 'lang', ''),
+        retweet_count=getattr(tweet, 'retweet_count', 0),
+        favorite_count=getattr(tweet, 'favorite_count', 0),
+        author=author,
+        in_reply_to=str(tweet.in_reply_to) if getattr(tweet, 'in_reply_to', None) else None,
+        photo_urls=extract_photo_urls(media),
+        media=media
+    )
+
+def legacy_db_row(twitter_tweet_data: Dict[str, Any]) -> Dict[str, Any]:
+    """The former tweet_service path: validate TwitterTweet, build DBTweetCreate, dump it"""
+    db_tweet = TwitterTweet.model_validate(twitter_tweet_data).to_db_tweet()
+    return db_tweet.model_dump()
+
+def legacy_save_tweet(tweet: Any) -> Dict[str, Any]:
+    """fetch -> details -> details again -> model_dump -> TwitterTweet -> model_dump -> DB row"""
+    details = legacy_details(legacy_details(tweet))
+    twitter_tweet = TwitterTweet(**details.model_dump())
+    return legacy_db_row(twitter_tweet.model_dump())
+
+def single_pass_save_tweet(tweet: Any) -> Dict[str, Any]:
+    return tweet_to_db_row(tweet_to_details(tweet))
+
+def legacy_save_search(row: TweetData) -> Dict[str, Any]:
+    data = row.model_dump()
+    return legacy_db_row({
+        'id': data['tweet_id'],
+        'text': data['text'],
+        'display_text': data['text'],
+        'retweet_count': data['retweets'],
+        'favorite_count': data['likes'],
+        'author': {'id': data['tweet_user_nick'], 'name': data['tweet_user_name'], 'username': data['tweet_user_nick']},
+        'lang': data['tweet_lang'],
+    })
+
+def to_search_row(tweet: Any) -> TweetData:
+    return TweetData(
+        tweet_id=tweet.id,
+        tweet_user_name=tweet.user.name,
+        tweet_user_nick=tweet.user.screen_name,
+        text=tweet.text,
+        created_at=tweet.created_at,
+        retweets=tweet.retweet_count,
+        likes=tweet.favorite_count,
+        photo_urls=[],
+        tweet_lang=tweet.lang
+    )
+
+def legacy_search_page(page: List[Any]) -> List[Dict[str, Any]]:
+    """Per-tweet search rows (validated), then per-tweet DB rows"""
+    return [legacy_save_search(to_search_row(tweet)) for tweet in page]
+
+def batch_search_page(page: List[Any]) -> List[Dict[str, Any]]:
+    return records_to_db_rows(tweets_to_records(page))
+
+def cpu_per_tweet(convert: Callable[[Any], Any], items: List[Any], repeat: int, tweets: int) -> float:
+    """Best-of-`repeat` process CPU time per tweet, in microseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.process_time()
+        for item in items:
+            convert(item)
+        best = min(best, time.process_time() - started)
+    return best / tweets * 1_000_000
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tweets', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--page-size', type=int, default=20, help='tweets per search page for the batch case')
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    client = MockTwitterClient()
+    tweets = [client.seed_tweet() for _ in range(args.tweets)]
+    rows = [to_search_row(tweet) for tweet in tweets]
+    pages = [tweets[i:i + args.page_size] for i in range(0, len(tweets), args.page_size)]
+
+    cases = [
+        ('save-tweet', legacy_save_tweet, single_pass_save_tweet, tweets),
+        ('save-search', legacy_save_search, tweet_to_db_row, rows),
+        ('search-page', legacy_search_page, batch_search_page, pages),
+    ]
+    header = f"{'path':<14}{'legacy us':>12}{'new us':>12}{'speedup':>10}"
+    print(header)
+    print('-' * len(header))
+    for name, legacy, single_pass, items in cases:
+        legacy_us = cpu_per_tweet(legacy, items, args.repeat, len(tweets))
+        single_us = cpu_per_tweet(single_pass, items, args.repeat, len(tweets))
+        print(f"{name:<14}{legacy_us:>12.2f}{single_us:>12.2f}{legacy_us / single_us:>9.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Cold start of the app in fresh interpreter processes, the way multi-worker servers fork
+them: import `app.main`, run the lifespan startup, report per-worker import/ready times
+and the wall time until every worker is ready.
+
+Workers start in an empty directory with no cookies.json and no provider keys.
+
+    python -m benchmarks.startup --workers 1 4 --top-imports 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER_SCRIPT = """
+import asyncio, json, time
+started = time.perf_counter()
+from app.main import app
+imported = time.perf_counter() - started
+
+async def boot():
+    async with app.router.lifespan_context(app):
+        pass
+
+asyncio.run(boot())
+print(json.dumps({'import_s': imported, 'ready_s': time.perf_counter() - started}))
+"""
+
+def worker_env() -> Dict[str, str]:
+    env = {key: value for key, value in os.environ.items() if not key.endswith('_API_KEY')}
+    env.update({'PYTHONPATH': PROJECT_ROOT, 'USE_TWITTER_MOCKS': 'false', 'LOOP_WATCHDOG_ENABLED': 'false'})
+    return env
+
+def start_workers(count: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory(prefix='comagency-startup-') as workdir:
+        started = time.perf_counter()
+        processes = [
+            subprocess.Popen(
+                [sys.executable, '-c', WORKER_SCRIPT],
+                cwd=workdir, env=worker_env(), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            )
+            for _ in range(count)
+        ]
+        reports = []
+        for process in processes:
+            stdout, _ = process.communicate()
+            if process.returncode != 0:
+                raise RuntimeError(f"Worker exited with {process.returncode}")
+            reports.append(json.loads(stdout.strip().splitlines()[-1]))
+        wall = time.perf_counter() - started
+
+    return {
+        'workers': count,
+        'import_ms_median': statistics.median(report['import_s'] for report in reports) * 1000,
+        'ready_ms_max': max(report['ready_s'] for report in reports) * 1000,
+        'wall_ms': wall * 1000,
+    }
+
+def top_imports(limit: int) -> List[tuple]:
+    """Slowest modules by cumulative import time, from `python -X importtime`"""
+    with tempfile.TemporaryDirectory(prefix='comagency-startup-') as workdir:
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import app.main'],
+            cwd=workdir, env=worker_env(), capture_output=True, text=True, check=True
+        )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = (part.strip() for part in line[len('import time:'):].split('|'))
+        rows.append((int(cumulative), module))
+    return sorted(rows, reverse=True)[:limit]
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--top-imports', type=int, default=0, help='also list the N slowest imports')
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    header = f"{'workers':>8}{'import ms (p50)':>18}{'ready ms (max)':>17}{'wall ms':>10}"
+    print(header)
+    print('-' * len(header))
+    for count in args.workers:
+        data = start_workers(count)
+        print(f"{data['workers']:>8}{data['import_ms_median']:>18.1f}{data['ready_ms_max']:>17.1f}{data['wall_ms']:>10.1f}")
+
+    if args.top_imports:
+        print()
+        for cumulative, module in top_imports(args.top_imports):
+            print(f"{cumulative / 1000:>10.1f} ms  {module}")
+
+if __name__ == '__main__':
+    main()
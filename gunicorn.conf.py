@@ -0,0 +1,30 @@
+"""Production serving: gunicorn managing uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Workers share the Twitter session file (locked, atomically replaced) and the pacer's
+SQLite token buckets, so adding workers spreads CPU-bound normalization across cores
+without multiplying logins or the Twitter rate budget.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:4730")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# LLM and image generation calls can take tens of seconds
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+
+# Recycle workers now and then to bound memory growth from long-lived clients
+max_requests = int(os.getenv("MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "200"))
+
+# Import is cheap and side-effect free, so each worker imports the app itself
+preload_app = False
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
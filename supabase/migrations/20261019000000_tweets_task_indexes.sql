@@ -0,0 +1,24 @@
+-- Indexes behind app/repositories/twitter/tweet_repository.py and the task workflows.
+--
+-- On a large, live table run each statement by hand with CREATE INDEX CONCURRENTLY
+-- (it cannot run inside the migration's transaction) to avoid blocking writes.
+
+-- get_tweets_by_author: author_username = ? ORDER BY created_at DESC
+create index if not exists tweets_author_username_created_at_idx
+    on public.tweets (author_username, created_at desc);
+
+-- get_unprocessed_by_phrase: search_query_by = ? AND NOT is_processed ORDER BY created_at DESC
+create index if not exists tweets_search_query_by_unprocessed_idx
+    on public.tweets (search_query_by, created_at desc)
+    where is_processed = false;
+
+-- get_recent_candidates: NOT is_processed AND NOT is_no_reply AND created_at >= ?
+-- (the few matching rows are then sorted by engagement)
+create index if not exists tweets_candidates_created_at_idx
+    on public.tweets (created_at desc)
+    where is_processed = false and is_no_reply = false;
+
+-- get_replied_ids: id IN (...) AND reply_id IS NOT NULL
+create index if not exists tweets_replied_idx
+    on public.tweets (id)
+    where reply_id is not null;
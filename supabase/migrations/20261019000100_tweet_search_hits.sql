@@ -0,0 +1,50 @@
+-- Search provenance: one row per (tweet, saved-search phrase) match.
+-- tweets.search_query_by / search_text_by keep the first phrase and query that found a tweet.
+
+create table if not exists public.tweet_search_hits (
+    tweet_id text not null references public.tweets (id) on delete cascade,
+    phrase text not null,
+    query text not null default '',
+    searched_at timestamptz not null default now(),
+    primary key (tweet_id, phrase)
+);
+
+-- get_tweets_by_phrase: phrase = ? ORDER BY searched_at DESC
+create index if not exists tweet_search_hits_phrase_searched_at_idx
+    on public.tweet_search_hits (phrase, searched_at desc);
+
+-- Tweets saved before this migration only have the column provenance
+insert into public.tweet_search_hits (tweet_id, phrase, query, searched_at)
+select id, search_query_by, coalesce(search_text_by, ''), created_at
+from public.tweets
+where coalesce(search_query_by, '') <> ''
+on conflict do nothing;
+
+-- get_phrase_yield: what each phrase produced, optionally since a point in time
+create or replace function public.search_phrase_yield(since timestamptz default null)
+returns table (
+    phrase text,
+    tweets bigint,
+    processed bigint,
+    replied bigint,
+    liked bigint,
+    no_reply bigint,
+    last_hit_at timestamptz
+)
+language sql
+stable
+as $$
+    select
+        h.phrase,
+        count(*),
+        count(*) filter (where t.is_processed),
+        count(*) filter (where t.reply_id is not null),
+        count(*) filter (where t.is_liked),
+        count(*) filter (where t.is_no_reply),
+        max(h.searched_at)
+    from public.tweet_search_hits h
+    join public.tweets t on t.id = h.tweet_id
+    where since is null or h.searched_at >= since
+    group by h.phrase
+    order by count(*) desc;
+$$;
@@ -0,0 +1,43 @@
+-- Full-text index over saved tweets for /twitter/tweets/local-search.
+-- A generated column stays in sync with every insert and update, whichever code path writes.
+-- Adding it rewrites the table once; on a large table run this in a quiet window.
+
+alter table public.tweets
+    add column if not exists fts tsvector
+    generated always as (to_tsvector('english', coalesce(text, ''))) stored;
+
+create index if not exists tweets_fts_idx
+    on public.tweets using gin (fts);
+
+-- search_text: ranked matches for a web-search style query
+create or replace function public.search_saved_tweets(q text, max_results int default 20, since timestamptz default null)
+returns table (
+    id text,
+    text text,
+    author_name text,
+    author_username text,
+    likes_count int,
+    retweets_count int,
+    created_at timestamptz,
+    search_query_by text,
+    rank real
+)
+language sql
+stable
+as $$
+    select
+        t.id::text,
+        t.text::text,
+        t.author_name::text,
+        t.author_username::text,
+        t.likes_count::int,
+        t.retweets_count::int,
+        t.created_at,
+        coalesce(t.search_query_by, '')::text,
+        ts_rank_cd(t.fts, query) as rank
+    from public.tweets t, websearch_to_tsquery('english', q) query
+    where t.fts @@ query
+        and (since is null or t.created_at >= since)
+    order by rank desc, t.created_at desc
+    limit least(greatest(max_results, 1), 100);
+$$;
@@ -0,0 +1,125 @@
+-- Append-only engagement history: one compact row per tweet per save or refresh.
+-- Range-partitioned by month so old history is dropped a partition at a time and
+-- time-bounded queries only touch recent partitions.
+
+create table if not exists public.tweet_engagement_snapshots (
+    tweet_id text not null,
+    captured_at timestamptz not null default now(),
+    likes_count integer not null,
+    retweets_count integer not null,
+    -- Covering: velocity reads (tweet_id, captured_at) ranges as index-only scans
+    primary key (tweet_id, captured_at) include (likes_count, retweets_count)
+) partition by range (captured_at);
+
+-- Catches rows outside the monthly partitions, so inserts never fail when the partitions
+-- run out; such rows only lose partition pruning until the next ensure call moves them.
+create table if not exists public.tweet_engagement_snapshots_default
+    partition of public.tweet_engagement_snapshots default;
+
+-- Creates the partitions for this month and the next `months_ahead`; safe to call repeatedly.
+-- Rows of a new month already sitting in the default partition are moved into it.
+-- Schedule it monthly, e.g. with pg_cron:
+--   select cron.schedule('engagement-partitions', '0 0 1 * *', 'select public.ensure_engagement_snapshot_partitions(3)');
+create or replace function public.ensure_engagement_snapshot_partitions(months_ahead int default 3)
+returns void
+language plpgsql
+as $$
+declare
+    month_start date;
+    month_end date;
+    part_name text;
+begin
+    for i in 0..months_ahead loop
+        month_start := (date_trunc('month', now()) + make_interval(months => i))::date;
+        month_end := (month_start + interval '1 month')::date;
+        part_name := 'tweet_engagement_snapshots_' || to_char(month_start, 'YYYY_MM');
+        if to_regclass('public.' || part_name) is not null then
+            continue;
+        end if;
+        -- Attaching checks that the default partition holds no rows of the month: move them first
+        execute format('create table public.%I (like public.tweet_engagement_snapshots including defaults)', part_name);
+        execute format(
+            'with moved as (delete from public.tweet_engagement_snapshots_default where captured_at >= %L and captured_at < %L returning *) '
+            'insert into public.%I select * from moved',
+            month_start, month_end, part_name
+        );
+        execute format(
+            'alter table public.tweet_engagement_snapshots attach partition public.%I for values from (%L) to (%L)',
+            part_name, month_start, month_end
+        );
+    end loop;
+end;
+$$;
+
+-- Drops whole months of history older than `keep`
+create or replace function public.drop_engagement_snapshot_partitions(keep interval default interval '6 months')
+returns void
+language plpgsql
+as $$
+declare
+    part record;
+begin
+    for part in
+        select c.relname
+        from pg_inherits i
+        join pg_class c on c.oid = i.inhrelid
+        where i.inhparent = 'public.tweet_engagement_snapshots'::regclass
+            and c.relname <> 'tweet_engagement_snapshots_default'
+            and c.relname < 'tweet_engagement_snapshots_' || to_char(date_trunc('month', now() - keep), 'YYYY_MM')
+    loop
+        execute format('drop table if exists public.%I', part.relname);
+    end loop;
+end;
+$$;
+
+select public.ensure_engagement_snapshot_partitions(3);
+
+-- Likes and retweets per hour over the last `window_hours`, from the first and last
+-- snapshot of each tweet in the window. Only tweets with at least two snapshots.
+create or replace function public.engagement_velocity(
+    tweet_ids text[] default null,
+    window_hours double precision default 6,
+    max_results int default 100
+)
+returns table (
+    tweet_id text,
+    likes_count integer,
+    retweets_count integer,
+    likes_per_hour real,
+    retweets_per_hour real,
+    snapshots bigint,
+    first_at timestamptz,
+    last_at timestamptz
+)
+language sql
+stable
+as $$
+    with recent as (
+        select s.tweet_id, s.captured_at, s.likes_count, s.retweets_count
+        from public.tweet_engagement_snapshots s
+        where s.captured_at >= now() - window_hours * interval '1 hour'
+            and (tweet_ids is null or s.tweet_id = any(tweet_ids))
+    ),
+    bounds as (
+        select r.tweet_id, min(r.captured_at) as first_at, max(r.captured_at) as last_at, count(*) as snapshots
+        from recent r
+        group by r.tweet_id
+        having count(*) > 1
+    )
+    select
+        b.tweet_id,
+        l.likes_count,
+        l.retweets_count,
+        ((l.likes_count - f.likes_count) / hours)::real,
+        ((l.retweets_count - f.retweets_count) / hours)::real,
+        b.snapshots,
+        b.first_at,
+        b.last_at
+    from bounds b
+    join recent f on f.tweet_id = b.tweet_id and f.captured_at = b.first_at
+    join recent l on l.tweet_id = b.tweet_id and l.captured_at = b.last_at
+    -- At least one minute, so two close snapshots do not explode the rate
+    cross join lateral (select greatest(extract(epoch from b.last_at - b.first_at) / 3600, 1.0 / 60) as hours) h
+    order by 4 desc
+    limit least(greatest(max_results, 1), 1000);
+$$;
@@ -0,0 +1,17 @@
+-- Bulk counter refresh for the engagement refresher: one statement for a whole batch,
+-- touching only rows whose counts actually changed.
+-- Select the refresher's tracked tweets with tweets_candidates_created_at_idx.
+
+create or replace function public.update_tweet_counters(updates jsonb)
+returns table (id text)
+language sql
+as $$
+    update public.tweets t
+    set likes_count = u.likes_count,
+        retweets_count = u.retweets_count,
+        updated_at = now()
+    from jsonb_to_recordset(updates) as u(id text, likes_count integer, retweets_count integer)
+    where t.id = u.id
+        and (t.likes_count, t.retweets_count) is distinct from (u.likes_count, u.retweets_count)
+    returning t.id::text;
+$$;